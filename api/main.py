@@ -5,18 +5,27 @@ Railway에서 실행되며 Python 검증 엔진 제공
 Features:
 - Singleton 패턴으로 검증 엔진 초기화 (메모리 효율)
 - OCR 추상화 레이어 (RapidOCR/PaddleOCR)
+- OCR 워커 프로세스 풀 (워커별 모델 1회 적재·예열, 우선순위 대기열, 장애 워커 재시작)
 - Lifespan을 통한 리소스 관리
 """
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Dict, List, Optional
+import asyncio
 import sys
 import os
 import base64
+import codecs
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from io import BytesIO
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 # Python 폴더를 sys.path에 추가
@@ -25,7 +34,46 @@ sys.path.insert(0, python_dir)
 
 from prompt_security_validator import KEPCOPromptSecurityValidator
 from llm_corrector import PowerIndustryOCRCorrector
-from audit_logger import init_db, log_validation, get_recent_logs, get_log_detail, get_dashboard_stats, cleanup_old_logs
+from audit_logger import (
+    init_db, log_validation, log_validations, get_recent_logs, get_log_detail, get_dashboard_stats,
+    get_violation_hits, get_top_rules, export_logs,
+    start_writer, stop_writer, writer_stats, close_db, pool_stats,
+    start_retention, stop_retention, retention_stats,
+)
+from validation_pool import (
+    ValidationPool, result_to_dict, violation_to_dict, validate_chunk as _validate_chunk, validate_item,
+    worker_config_version,
+)
+from workload_executor import WorkloadExecutor, WorkloadRejected
+from result_cache import ValidationCache
+from ocr_worker_pool import (
+    OCRWorkerPool, OCRJobTimeout, OCRPoolUnavailable, OCRWorkerCrashed, OCRWorkerError,
+    PRIORITY_INTERACTIVE, PRIORITY_BULK,
+)
+from document_pages import (
+    DocumentError, DocumentReader, DocumentTooLarge, DocumentUnsupported, analyze_document, detect_document_type, document_to_dict,
+)
+
+
+# 이미지 업로드 최대 크기 (디코딩 전 원본 바이트 기준, base64 본문은 4/3배까지 허용)
+IMAGE_MAX_BYTES = int(float(os.getenv("IMAGE_MAX_MB", "20")) * 1024 * 1024)
+
+# 다중 페이지 문서(PDF·TIFF) 동시 OCR 페이지 수 (0: OCR 워커 수)
+DOCUMENT_PAGE_CONCURRENCY = int(os.getenv("DOCUMENT_PAGE_CONCURRENCY", "0"))
+
+# 다건 검증 설정
+BATCH_MAX_SIZE = int(os.getenv("VALIDATE_BATCH_MAX_SIZE", "1000"))
+BATCH_WORKERS = int(os.getenv("VALIDATE_BATCH_WORKERS", "0")) or None  # 0: CPU 코어 수
+
+# 스트리밍 검증 감사로그에 행 단위로 남길 위반사항 표본 수 (전체는 유형·규칙별 건수로 기록)
+STREAM_LOG_MAX_VIOLATIONS = int(os.getenv("STREAM_LOG_MAX_VIOLATIONS", "100"))
+
+# 작업 유형별 (동시 실행 수, 대기 허용 수) - 초과 시 429 응답
+WORKLOAD_LIMITS = {
+    "text": (int(os.getenv("WORKLOAD_TEXT_CONCURRENCY", "4")), int(os.getenv("WORKLOAD_TEXT_QUEUE", "64"))),
+    "ocr": (int(os.getenv("WORKLOAD_OCR_CONCURRENCY", "2")), int(os.getenv("WORKLOAD_OCR_QUEUE", "8"))),
+    "llm": (int(os.getenv("WORKLOAD_LLM_CONCURRENCY", "4")), int(os.getenv("WORKLOAD_LLM_QUEUE", "16"))),
+}
 
 
 # ============================================================
@@ -37,8 +85,13 @@ class ValidateRequest(BaseModel):
     prompt: str = Field(..., min_length=1, description="검증할 프롬프트")
 
 
+class BatchValidateRequest(BaseModel):
+    """다건 텍스트 검증 요청"""
+    prompts: List[str] = Field(..., min_length=1, description="검증할 프롬프트 목록")
+
+
 class ImageValidateRequest(BaseModel):
-    """이미지 검증 요청 (Base64)"""
+    """이미지 검증 요청 (Base64, 호환용 - multipart/form-data 업로드 권장)"""
     image_base64: str = Field(..., description="Base64 인코딩된 이미지")
 
 
@@ -69,6 +122,16 @@ class HealthResponse(BaseModel):
     validator_loaded: bool
     ocr_engine: str
     ocr_available: bool
+    ocr_ready: bool = False  # OCR 워커 풀 사용 시 준비된 워커가 1개 이상인지 (기동 중이면 False)
+    workloads: dict = {}
+    cache: Optional[dict] = None
+    audit_log: Optional[dict] = None
+    audit_db: Optional[dict] = None
+    retention: Optional[dict] = None
+    ocr_preprocess: Optional[dict] = None
+    ocr_tiling: Optional[dict] = None
+    ocr_cache: Optional[dict] = None
+    ocr_workers: Optional[dict] = None
 
 
 # ============================================================
@@ -78,11 +141,14 @@ class HealthResponse(BaseModel):
 class AppState:
     """애플리케이션 상태 (Singleton 패턴)"""
     validator: Optional[KEPCOPromptSecurityValidator] = None
-    ocr_engine = None  # OCREngine 인스턴스
+    ocr_engine = None  # OCREngine 인스턴스 (OCR_WORKERS=0 일 때만 API 프로세스 안에서 사용)
+    ocr_pool: Optional[OCRWorkerPool] = None  # OCR 워커 프로세스 풀
     ocr_engine_name: str = "none"
     ocr_available: bool = False
     llm_corrector: Optional[PowerIndustryOCRCorrector] = None
     llm_available: bool = False
+    validation_pool: Optional[ValidationPool] = None
+    workloads: Dict[str, WorkloadExecutor] = {}
 
 
 app_state = AppState()
@@ -93,10 +159,52 @@ app_state = AppState()
 # ============================================================
 
 def _init_ocr_engine():
-    """OCR 엔진 초기화 (RapidOCR/PaddleOCR)"""
+    """
+    OCR 엔진 초기화 (워커 프로세스 풀 우선, OCR_WORKERS=0 이면 API 프로세스 안에서 RapidOCR/PaddleOCR)
+
+    워커 풀은 모델 적재·예열(최대 startup_timeout)을 기다리지 않고 기동 - 준비 상태는 /health의
+    ocr_ready·ocr_workers.ready로 확인. 준비 전 요청은 대기열에서 기다리고, 워커가 모두 기동에 실패하면
+    API 프로세스 안의 엔진으로 전환
+    """
+    try:
+        pool = OCRWorkerPool.from_env()
+    except Exception as e:
+        print(f"⚠️ OCR worker pool config invalid: {e}")
+        pool = None
+    if pool is not None:
+        pool.start(wait=False)
+        app_state.ocr_pool = pool
+        app_state.ocr_engine_name = "rapidocr"
+        app_state.ocr_available = True
+        threading.Thread(
+            target=_watch_ocr_pool_startup, args=(pool,), name="ocr-pool-startup", daemon=True
+        ).start()
+        print(f"⏳ OCR Engine: RapidOCR worker pool starting ({pool.workers} workers)")
+        return
+    _init_local_ocr_engine()
+
+
+def _watch_ocr_pool_startup(pool: OCRWorkerPool):
+    """워커 풀 기동 결과 확인 (모두 실패하면 API 프로세스 안의 엔진으로 전환하고 대기 작업은 503)"""
+    ready = pool.wait_ready()
+    if pool.closed:
+        return
+    if ready:
+        print(f"✅ OCR Engine: RapidOCR worker pool ({ready}/{pool.workers} workers ready)")
+        return
+    errors = {w["last_error"] for w in pool.stats()["worker_status"] if w["last_error"]}
+    print(f"⚠️ OCR worker pool failed to start: {'; '.join(errors) or 'timeout'}")
+    _init_local_ocr_engine()
+    app_state.ocr_pool = None
+    pool.shutdown(wait=False, error=OCRPoolUnavailable("OCR 워커 기동에 실패했습니다. 다시 시도하세요"))
+
+
+def _init_local_ocr_engine():
+    """API 프로세스 안에서 RapidOCR 초기화 (OCR 실행기 스레드에서 사용)"""
     try:
+        from ocr_cache import OCRCache
         from ocr_engine import RapidOCR
-        rapid = RapidOCR()
+        rapid = RapidOCR(cache=OCRCache.from_env())
         if rapid.is_available():
             app_state.ocr_engine = rapid
             app_state.ocr_engine_name = "rapidocr"
@@ -141,12 +249,26 @@ async def lifespan(app: FastAPI):
 
     # 검증 엔진 초기화 (Singleton)
     try:
-        app_state.validator = KEPCOPromptSecurityValidator()
+        app_state.validator = KEPCOPromptSecurityValidator(cache=ValidationCache.from_env())
         print("✅ Validator loaded successfully")
     except Exception as e:
         print(f"❌ Validator load failed: {e}")
         app_state.validator = None
 
+    # 작업 유형별 실행기 (텍스트 검증 / OCR / LLM 교정)
+    app_state.workloads = {
+        name: WorkloadExecutor(name, concurrency, queue)
+        for name, (concurrency, queue) in WORKLOAD_LIMITS.items()
+    }
+
+    # 다건 검증 프로세스 풀 (실패 시 단일 프로세스로 순차 처리)
+    try:
+        app_state.validation_pool = ValidationPool(max_workers=BATCH_WORKERS, validator=app_state.validator)
+        print(f"✅ Validation pool ready ({app_state.validation_pool.max_workers} workers)")
+    except Exception as e:
+        print(f"⚠️ Validation pool init failed: {e}")
+        app_state.validation_pool = None
+
     # OCR 엔진 초기화
     _init_ocr_engine()
 
@@ -156,8 +278,10 @@ async def lifespan(app: FastAPI):
     # Audit Log DB 초기화
     try:
         init_db()
-        # 기동 시 오래된 로그 정리
-        cleanup_old_logs()
+        # 백그라운드 기록기 (요청 경로에서는 큐 적재만 수행)
+        start_writer()
+        # 오래된 로그는 백그라운드에서 배치 단위로 정리 (기동을 지연시키지 않음)
+        start_retention()
     except Exception as e:
         print(f"⚠️ Audit log DB init failed: {e}")
 
@@ -165,6 +289,16 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("👋 Shutting down KEPCO Security Validator...")
+    if app_state.validation_pool:
+        app_state.validation_pool.shutdown()
+    if app_state.ocr_pool:
+        app_state.ocr_pool.shutdown()
+    for workload in app_state.workloads.values():
+        workload.shutdown()
+    # 정리 중지, 큐에 남은 감사로그 기록 후 DB 연결 종료
+    stop_retention()
+    stop_writer()
+    close_db()
 
 
 # ============================================================
@@ -178,6 +312,16 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+@app.exception_handler(WorkloadRejected)
+async def workload_rejected_handler(request: Request, exc: WorkloadRejected):
+    """작업 대기열 초과 → 429 Too Many Requests"""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc), "workload": exc.workload},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 # CORS 설정 (Vercel에서 접근 허용)
 app.add_middleware(
     CORSMiddleware,
@@ -203,7 +347,7 @@ async def root():
         "ocr_engine": app_state.ocr_engine_name,
         "ocr_available": app_state.ocr_available,
         "llm_corrector_available": app_state.llm_available,
-        "endpoints": ["/validate", "/validate-image", "/correct-ocr", "/health"]
+        "endpoints": ["/validate", "/validate/batch", "/validate/stream", "/validate-image", "/correct-ocr", "/health"]
     }
 
 
@@ -214,7 +358,33 @@ async def health():
         status="healthy",
         validator_loaded=app_state.validator is not None,
         ocr_engine=app_state.ocr_engine_name,
-        ocr_available=app_state.ocr_available
+        ocr_available=app_state.ocr_available,
+        ocr_ready=(
+            app_state.ocr_pool.ready_workers() > 0 if app_state.ocr_pool is not None
+            else app_state.ocr_engine is not None
+        ),
+        workloads={name: w.stats() for name, w in app_state.workloads.items()},
+        cache=(
+            app_state.validator.cache.stats()
+            if app_state.validator and app_state.validator.cache else None
+        ),
+        audit_log=writer_stats(),
+        audit_db=pool_stats(),
+        retention=retention_stats(),
+        ocr_preprocess=(
+            app_state.ocr_engine.preprocessor.stats()
+            if app_state.ocr_engine is not None else None
+        ),
+        ocr_tiling=(
+            app_state.ocr_engine.tiler.stats()
+            if app_state.ocr_engine is not None and app_state.ocr_engine.tiler is not None else None
+        ),
+        ocr_cache=(
+            app_state.ocr_engine.cache.stats()
+            if app_state.ocr_engine is not None and app_state.ocr_engine.cache is not None else None
+        ),
+        # 워커 풀 사용 시 전처리·타일·캐시 통계는 워커별(worker_status[].engine)로 제공
+        ocr_workers=app_state.ocr_pool.stats() if app_state.ocr_pool is not None else None
     )
 
 
@@ -243,29 +413,237 @@ async def validate_prompt(request: ValidateRequest):
         raise HTTPException(status_code=400, detail="프롬프트가 비어있습니다")
 
     try:
-        import time as _time
-        _start = _time.time()
+        result_dict = await app_state.workloads["text"].run(_validate_and_log, request.prompt)
+        return ValidateResponse(success=True, result=result_dict)
+    except WorkloadRejected:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        result = app_state.validator.validate(request.prompt)
 
-        result_dict = {
-            "is_safe": result.is_safe,
-            "security_level": result.security_level.value,
-            "risk_score": result.risk_score,
-            "violations": [
+def _validate_and_log(prompt: str) -> dict:
+    """검증 + 감사로그 기록 (텍스트 실행기 스레드에서 실행)"""
+    import time as _time
+    _start = _time.time()
+
+    result = app_state.validator.validate(prompt)
+    result_dict = result_to_dict(result)
+
+    # 검증 이력 로깅
+    _elapsed = int((_time.time() - _start) * 1000)
+    try:
+        log_validation(
+            prompt=prompt,
+            result=result_dict,
+            input_type="text",
+            response_time_ms=_elapsed,
+        )
+    except Exception as log_err:
+        print(f"⚠️ Audit log write failed: {log_err}")
+
+    return result_dict
+
+
+def _replace_validation_pool(old: ValidationPool) -> Optional[ValidationPool]:
+    """
+    다건 검증 프로세스 풀 교체 (워커 비정상 종료 또는 키워드 규칙·마스킹 정책 변경 시)
+
+    다른 요청이 이미 교체했으면 현재 풀을 그대로 반환. 이전 풀에 제출된 작업은 끝까지 처리
+    """
+    if app_state.validation_pool is old:
+        old.shutdown(wait=False)
+        try:
+            app_state.validation_pool = ValidationPool(max_workers=BATCH_WORKERS, validator=app_state.validator)
+        except Exception as e:
+            print(f"⚠️ Validation pool restart failed: {e}")
+            app_state.validation_pool = None
+    return app_state.validation_pool
+
+
+async def _validate_pool_chunk(pool: ValidationPool, chunk: List[str]) -> List[Dict[str, Any]]:
+    """프로세스 풀에서 묶음 검증 (워커 비정상 종료 시 풀을 교체하고 묶음 항목을 오류로 반환)"""
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool.executor, _validate_chunk, chunk)
+    except BrokenProcessPool as e:
+        print(f"⚠️ Validation worker died, restarting pool: {e}")
+        _replace_validation_pool(pool)
+        return [
+            {"success": False, "error": "검증 워커 프로세스가 비정상 종료되었습니다. 다시 시도하세요", "elapsed_ms": 0}
+            for _ in chunk
+        ]
+
+
+@app.post("/validate/batch")
+async def validate_prompt_batch(request: BatchValidateRequest):
+    """
+    다건 텍스트 프롬프트 보안 검증
+
+    - 프로세스 풀로 분산 검증, 입력 순서대로 결과 반환
+    - 항목별 오류는 해당 항목에만 표시 (전체 요청은 성공, 워커 비정상 종료 시 해당 묶음 항목만 오류)
+    - 감사로그는 단일 트랜잭션으로 일괄 기록
+    """
+    if not app_state.validator:
+        raise HTTPException(
+            status_code=503,
+            detail="Validator not available. Check deployment logs."
+        )
+
+    if len(request.prompts) > BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {BATCH_MAX_SIZE}건까지 검증할 수 있습니다"
+        )
+
+    import time as _time
+    _start = _time.time()
+
+    text_workload = app_state.workloads["text"]
+    with text_workload.slot():
+        pool = app_state.validation_pool
+        if pool and pool.config_version != worker_config_version(app_state.validator):
+            # 기동 후 바뀐 키워드 규칙·마스킹 정책을 워커에 반영
+            pool = _replace_validation_pool(pool)
+        if pool:
+            chunk_results = await asyncio.gather(*(
+                _validate_pool_chunk(pool, chunk) for chunk in pool.split(request.prompts)
+            ))
+            items = [item for chunk in chunk_results for item in chunk]
+        else:
+            items = await text_workload.run_in_slot(
+                lambda: [validate_item(app_state.validator, p) for p in request.prompts]
+            )
+
+        results = [{"index": i, **item} for i, item in enumerate(items)]
+        succeeded = sum(1 for item in items if item["success"])
+        _elapsed = int((_time.time() - _start) * 1000)
+
+        # 검증 이력 로깅 (일괄)
+        try:
+            await text_workload.run_in_slot(log_validations, [
                 {
-                    "type": v.type.value,
-                    "description": v.description,
-                    "matched_text": v.matched_text,
-                    "position": list(v.position),
-                    "severity": v.severity
+                    "prompt": prompt,
+                    "result": item["result"],
+                    "input_type": "batch",
+                    "response_time_ms": int(item["elapsed_ms"]),
                 }
-                for v in result.violations
-            ],
-            "sanitized_prompt": result.sanitized_prompt,
-            "original_prompt": result.original_prompt,
-            "timestamp": result.timestamp,
-            "recommendation": result.recommendation,
+                for prompt, item in zip(request.prompts, items)
+                if item["success"]
+            ])
+        except Exception as log_err:
+            print(f"⚠️ Audit log write failed: {log_err}")
+
+    return {
+        "success": True,
+        "count": len(items),
+        "succeeded": succeeded,
+        "failed": len(items) - succeeded,
+        "elapsed_ms": _elapsed,
+        "item_elapsed_ms_total": round(sum(item["elapsed_ms"] for item in items), 2),
+        "results": results,
+    }
+
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """
+    요청 본문을 읽으면서 응답을 스트리밍
+
+    StreamingResponse의 연결 종료 감시 태스크가 receive()로 요청 본문 청크를
+    가로채지 않도록 응답 전송만 수행 (ASGI spec_version < 2.4 서버 대응)
+
+    on_close는 응답 시작 전 연결 종료·send 실패로 본문 생성기가 시작되지 않은 경우를 포함해
+    모든 경로에서 1회 호출 (실행기 슬롯 반환 등)
+    """
+
+    def __init__(self, content, *, on_close=None, **kwargs):
+        super().__init__(content, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.stream_response(send)
+        finally:
+            try:
+                await self.body_iterator.aclose()
+            finally:
+                if self.on_close is not None:
+                    self.on_close()
+
+
+@app.post("/validate/stream")
+async def validate_prompt_stream(request: Request):
+    """
+    대용량 프롬프트 스트리밍 검증
+
+    - 요청 본문: UTF-8 텍스트 (chunked 전송 가능)
+    - 응답: NDJSON 스트림
+        {"type": "segment", "offset": ..., "sanitized_text": ..., "violations": [...]}
+        ...
+        {"type": "summary", "is_safe": ..., "security_level": ..., ...}
+    - 원문 전체를 메모리에 보관하지 않음 (청크 겹침 구간만 유지)
+    """
+    if not app_state.validator:
+        raise HTTPException(
+            status_code=503,
+            detail="Validator not available. Check deployment logs."
+        )
+
+    # 스트림 전체에 텍스트 실행기 슬롯 1개 사용 (응답 시작 전에 확보해야 429 가능, 반환은 응답 객체가 담당)
+    text_workload = app_state.workloads["text"]
+    text_workload.acquire()
+
+    async def generate():
+        import time as _time
+        _start = _time.time()
+
+        stream = app_state.validator.open_stream()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        hasher = hashlib.sha256()
+        # 감사로그용 위반 요약 - 유형·규칙별 건수 + 앞쪽 표본 (입력 길이와 무관하게 메모리 일정)
+        rule_counts: Dict[tuple, int] = {}
+        sampled_violations = []
+
+        def _segment_lines(segments):
+            for seg in segments:
+                for v in seg.violations:
+                    key = (v.type.value, v.rule_name)
+                    rule_counts[key] = rule_counts.get(key, 0) + 1
+                    if len(sampled_violations) < STREAM_LOG_MAX_VIOLATIONS:
+                        sampled_violations.append({
+                            "type": v.type.value,
+                            "description": v.description,
+                            "severity": v.severity,
+                            "rule_name": v.rule_name,
+                        })
+                yield json.dumps({
+                    "type": "segment",
+                    "offset": seg.offset,
+                    "sanitized_text": seg.sanitized_text,
+                    "violations": [violation_to_dict(v) for v in seg.violations],
+                }, ensure_ascii=False) + "\n"
+
+        async for raw in request.stream():
+            hasher.update(raw)
+            segments = await text_workload.run_in_slot(stream.feed, decoder.decode(raw))
+            for line in _segment_lines(segments):
+                yield line
+
+        segments = await text_workload.run_in_slot(
+            lambda: stream.feed(decoder.decode(b"", final=True)) + stream.close()
+        )
+        for line in _segment_lines(segments):
+            yield line
+
+        summary = segments[-1].summary
+        summary_dict = {
+            "type": "summary",
+            "is_safe": summary.is_safe,
+            "security_level": summary.security_level.value,
+            "risk_score": summary.risk_score,
+            "violation_count": summary.violation_count,
+            "type_counts": {t.value: c for t, c in summary.type_counts.items()},
+            "total_length": summary.total_length,
+            "timestamp": summary.timestamp,
+            "recommendation": summary.recommendation,
             "regulation_refs": [
                 {
                     "law": r.law,
@@ -273,34 +651,181 @@ async def validate_prompt(request: ValidateRequest):
                     "description": r.description,
                     "source": r.source
                 }
-                for r in (result.regulation_refs or [])
+                for r in (summary.regulation_refs or [])
             ]
         }
+        yield json.dumps(summary_dict, ensure_ascii=False) + "\n"
 
         # 검증 이력 로깅
         _elapsed = int((_time.time() - _start) * 1000)
         try:
-            log_validation(
-                prompt=request.prompt,
-                result=result_dict,
-                input_type="text",
+            await text_workload.run_in_slot(
+                log_validation,
+                prompt="",
+                result={
+                    **summary_dict,
+                    "violations": sampled_violations,
+                    "violation_rule_counts": [
+                        {"type": vtype, "rule_name": rule_name, "count": count}
+                        for (vtype, rule_name), count in rule_counts.items()
+                    ],
+                },
+                input_type="text_stream",
                 response_time_ms=_elapsed,
+                prompt_hash=hasher.hexdigest()[:16],
+                prompt_length=summary.total_length,
             )
         except Exception as log_err:
             print(f"⚠️ Audit log write failed: {log_err}")
 
-        return ValidateResponse(success=True, result=result_dict)
+    return _DuplexStreamingResponse(generate(), media_type="application/x-ndjson", on_close=text_workload.release)
+
+
+def _image_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"이미지는 최대 {IMAGE_MAX_BYTES / (1024 * 1024):g}MB까지 업로드할 수 있습니다"
+    )
+
+
+async def _read_body_capped(request: Request, limit: int) -> bytearray:
+    """요청 본문을 읽되 limit 초과 시 즉시 중단 (Content-Length 선검사 + 수신 누적 검사)"""
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > limit:
+        raise _image_too_large()
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > limit:
+            raise _image_too_large()
+    return body
+
+
+async def _read_multipart_image(request: Request, fields=("image", "file")) -> bytearray:
+    """
+    multipart/form-data 본문을 스트리밍 파싱해 이미지 파트만 수집
+
+    UploadFile처럼 전체를 임시 파일에 적재한 뒤 검사하지 않고, 수신 중 이미지 크기가
+    IMAGE_MAX_BYTES를 넘으면 바로 413 (다른 필드는 버림)
+    """
+    from python_multipart.multipart import MultipartParser, parse_options_header
+
+    _, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if not boundary:
+        raise HTTPException(status_code=400, detail="multipart boundary가 없습니다")
+
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > IMAGE_MAX_BYTES + 64 * 1024:
+        raise _image_too_large()
+
+    state = {"header": b"", "value": b"", "capture": False, "found": False, "too_large": False}
+    image = bytearray()
+
+    def on_part_begin():
+        state["capture"] = False
+
+    def on_header_field(data, start, end):
+        state["header"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        state["value"] += data[start:end]
+
+    def on_header_end():
+        if state["header"].lower() == b"content-disposition" and not state["found"]:
+            _, disposition = parse_options_header(state["value"])
+            if disposition.get(b"name", b"").decode("utf-8", "replace") in fields:
+                state["capture"] = state["found"] = True
+        state["header"] = state["value"] = b""
+
+    def on_part_data(data, start, end):
+        if state["capture"]:
+            image.extend(data[start:end])
+            if len(image) > IMAGE_MAX_BYTES:
+                state["too_large"] = True
+                state["capture"] = False
+
+    parser = MultipartParser(boundary, {
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_part_data": on_part_data,
+    })
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if state["too_large"]:
+                raise _image_too_large()
+        parser.finalize()
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=400, detail=f"multipart 본문 오류: {str(e)}")
+
+    if not state["found"] or not image:
+        raise HTTPException(status_code=400, detail=f"이미지 파일 필드({fields[0]})가 없습니다")
+    return image
 
 
-@app.post("/validate-image")
-async def validate_image(request: ImageValidateRequest):
+async def _read_image_upload(request: Request):
+    """
+    /validate-image 요청 본문 → 이미지 바이트
+
+    - multipart/form-data: image(또는 file) 필드 스트리밍 수신
+    - image/* · application/pdf · application/octet-stream: 본문 자체가 이미지(문서)
+    - application/json: {"image_base64": "..."} (기존 방식)
+    """
+    content_type = request.headers.get("content-type", "").lower()
+    if content_type.startswith("multipart/form-data"):
+        return await _read_multipart_image(request)
+    if content_type.startswith(("image/", "application/pdf", "application/octet-stream")):
+        body = await _read_body_capped(request, IMAGE_MAX_BYTES)
+        if not body:
+            raise HTTPException(status_code=400, detail="이미지 본문이 비어있습니다")
+        return body
+
+    body = await _read_body_capped(request, IMAGE_MAX_BYTES * 4 // 3 + 64 * 1024)
+    try:
+        payload = ImageValidateRequest.model_validate_json(body)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"요청 형식 오류: {str(e)}")
+    del body
+    try:
+        image_data = base64.b64decode(payload.image_base64)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Base64 이미지 디코딩에 실패했습니다")
+    if len(image_data) > IMAGE_MAX_BYTES:
+        raise _image_too_large()
+    return image_data
+
+
+@app.post("/validate-image", openapi_extra={
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"image": {"type": "string", "format": "binary"}},
+                    "required": ["image"],
+                }
+            },
+            "application/pdf": {"schema": {"type": "string", "format": "binary"}},
+            "application/json": {"schema": ImageValidateRequest.model_json_schema()},
+        },
+    }
+})
+async def validate_image(request: Request):
     """
     이미지 OCR + 보안 검증
 
     - 이미지에서 텍스트 추출 (OCR)
     - 추출된 텍스트에 대한 보안 검증 수행
+    - 업로드: multipart/form-data(image 필드, 권장) 또는 JSON image_base64 (호환)
+    - IMAGE_MAX_MB 초과 시 전체 수신 전에 413
+    - PDF·다중 페이지 TIFF: 페이지 단위 OCR·검증, 결과에 pages / document 추가
+      (위반 위치는 page 필드의 페이지 텍스트 기준, 차단 등급 도달 시 남은 페이지 생략)
     """
     if not app_state.validator:
         raise HTTPException(
@@ -323,24 +848,33 @@ async def validate_image(request: ImageValidateRequest):
             "extracted_text": ""
         }
 
-    try:
-        # Base64 디코딩
-        image_data = base64.b64decode(request.image_base64)
+    # 업로드 수신 (크기 초과·형식 오류는 OCR 전에 4xx)
+    image_data = await _read_image_upload(request)
 
+    # 다중 페이지 문서 (단일 프레임 TIFF는 기존 이미지 처리)
+    if detect_document_type(image_data) is not None:
+        try:
+            reader = DocumentReader.from_env(image_data)
+        except DocumentUnsupported as e:
+            raise HTTPException(status_code=415, detail=str(e))
+        except DocumentError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if reader.kind == "pdf" or reader.page_count > 1:
+            return await _validate_document(reader)
+        reader.close()
+
+    try:
         # OCR 실행
         extracted_text = ""
 
-        if app_state.ocr_engine and hasattr(app_state.ocr_engine, 'extract_text'):
-            # 새로운 OCR 추상화 레이어 사용
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.png') as tmp:
-                tmp.write(image_data)
-                tmp_path = tmp.name
-
-            try:
-                extracted_text, confidence, _, _ = app_state.ocr_engine.extract_text(tmp_path)
-            finally:
-                os.unlink(tmp_path)
+        if app_state.ocr_pool is not None:
+            # OCR 워커 프로세스 (대기열 초과 시 429, 제한 시간 초과 시 504)
+            extracted_text, _, _, _ = await asyncio.wrap_future(
+                app_state.ocr_pool.submit(image_data, priority=PRIORITY_INTERACTIVE)
+            )
+        elif app_state.ocr_engine and hasattr(app_state.ocr_engine, 'extract_text'):
+            # 새로운 OCR 추상화 레이어 사용 (OCR 실행기 스레드)
+            extracted_text = await app_state.workloads["ocr"].run(_run_ocr, image_data)
         else:
             # OCR 엔진이 초기화되지 않은 경우
             extracted_text = ""
@@ -367,7 +901,9 @@ async def validate_image(request: ImageValidateRequest):
 
         if app_state.llm_available and app_state.llm_corrector:
             try:
-                llm_result = app_state.llm_corrector.correct_text(extracted_text)
+                llm_result = await app_state.workloads["llm"].run(
+                    app_state.llm_corrector.correct_text, extracted_text
+                )
                 if llm_result.get("success"):
                     llm_correction_result = {
                         "used": True,
@@ -386,6 +922,8 @@ async def validate_image(request: ImageValidateRequest):
                         "error": llm_result.get("error", "교정 실패"),
                         "model": app_state.llm_corrector.model_id
                     }
+            except WorkloadRejected:
+                raise
             except Exception as e:
                 llm_correction_result = {
                     "used": False,
@@ -399,23 +937,14 @@ async def validate_image(request: ImageValidateRequest):
             }
 
         # 보안 검증 (교정된 텍스트 또는 원본 OCR 텍스트 사용)
-        result = app_state.validator.validate(text_for_validation)
+        result = await app_state.workloads["text"].run(app_state.validator.validate, text_for_validation)
 
         return {
             "success": True,
             "is_safe": result.is_safe,
             "security_level": result.security_level.value,
             "risk_score": result.risk_score,
-            "violations": [
-                {
-                    "type": v.type.value,
-                    "description": v.description,
-                    "matched_text": v.matched_text,
-                    "position": list(v.position),
-                    "severity": v.severity
-                }
-                for v in result.violations
-            ],
+            "violations": [violation_to_dict(v) for v in result.violations],
             "sanitized_prompt": result.sanitized_prompt,
             "original_prompt": result.original_prompt,
             "timestamp": result.timestamp,
@@ -424,6 +953,16 @@ async def validate_image(request: ImageValidateRequest):
             "llm_correction": llm_correction_result
         }
 
+    except WorkloadRejected:
+        raise
+    except OCRJobTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except OCRPoolUnavailable as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except OCRWorkerCrashed as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except OCRWorkerError as e:
+        raise HTTPException(status_code=500, detail=f"이미지 처리 오류: {e}")
     except Exception as e:
         import traceback
         error_detail = f"이미지 처리 오류: {str(e)}\n{traceback.format_exc()}"
@@ -431,6 +970,56 @@ async def validate_image(request: ImageValidateRequest):
         raise HTTPException(status_code=500, detail=f"이미지 처리 오류: {str(e)}")
 
 
+async def _validate_document(reader: DocumentReader) -> dict:
+    """다중 페이지 문서 검증 (OCR 실행기 슬롯 1개로 페이지들을 동시 OCR)"""
+    try:
+        result = await app_state.workloads["ocr"].run(_analyze_document, reader)
+    except WorkloadRejected:
+        raise
+    except DocumentTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except DocumentError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        import traceback
+        print(f"문서 처리 오류: {str(e)}\n{traceback.format_exc()}")
+        raise HTTPException(status_code=500, detail=f"문서 처리 오류: {str(e)}")
+    finally:
+        reader.close()
+
+    return {
+        "success": True,
+        **document_to_dict(result),
+        "llm_correction": {"used": False, "reason": "다중 페이지 문서는 LLM 교정을 적용하지 않습니다"},
+    }
+
+
+def _analyze_document(reader: DocumentReader):
+    """페이지 OCR 제출 (워커 풀: 일반 이미지보다 낮은 우선순위, 미사용 시 API 프로세스 스레드)"""
+    pool = app_state.ocr_pool
+    if pool is not None:
+        return analyze_document(
+            reader,
+            lambda page: pool.submit(page.data, priority=PRIORITY_BULK),
+            app_state.validator,
+            max_inflight=DOCUMENT_PAGE_CONCURRENCY or pool.workers,
+        )
+    workers = DOCUMENT_PAGE_CONCURRENCY or WORKLOAD_LIMITS["ocr"][0]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-page") as executor:
+        return analyze_document(
+            reader,
+            lambda page: executor.submit(app_state.ocr_engine.recognize_bytes, page.data),
+            app_state.validator,
+            max_inflight=workers,
+        )
+
+
+def _run_ocr(image_data: bytes) -> str:
+    """이미지 바이트 → OCR 텍스트 (OCR 실행기 스레드에서 실행, 임시 파일 없이 메모리에서 1회 디코딩)"""
+    extracted_text, confidence, _, _ = app_state.ocr_engine.extract_text_from_bytes(image_data)
+    return extracted_text
+
+
 @app.post("/correct-ocr")
 async def correct_ocr_text(request: OCRCorrectRequest):
     """
@@ -457,7 +1046,7 @@ async def correct_ocr_text(request: OCRCorrectRequest):
         else:
             corrector = app_state.llm_corrector
 
-        result = corrector.correct_text(request.ocr_text)
+        result = await app_state.workloads["llm"].run(corrector.correct_text, request.ocr_text)
 
         return {
             "success": result.get("success", False),
@@ -470,6 +1059,8 @@ async def correct_ocr_text(request: OCRCorrectRequest):
             "error": result.get("error")
         }
 
+    except WorkloadRejected:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -483,14 +1074,74 @@ async def correct_ocr_text(request: OCRCorrectRequest):
 # ============================================================
 
 @app.get("/logs")
-async def list_logs(limit: int = 50, offset: int = 0, level: str = "all"):
-    """검증 이력 목록 조회"""
+async def list_logs(
+    limit: int = 50,
+    offset: int = 0,
+    level: str = "all",
+    cursor: Optional[str] = None,
+    before_id: Optional[int] = None,
+    count: str = "cached",
+):
+    """
+    검증 이력 목록 조회
+
+    - cursor: 이전 응답의 next_cursor (권장, 깊은 페이지도 일정한 비용)
+    - before_id: 해당 로그 ID 이전 항목부터 조회
+    - count: cached(누적 카운터) | exact(전체 COUNT) | none
+    """
     try:
-        return get_recent_logs(limit=min(limit, 200), offset=offset, level_filter=level)
+        return get_recent_logs(
+            limit=min(limit, 200), offset=offset, level_filter=level,
+            cursor=cursor, before_id=before_id, count_mode=count,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+@app.get("/logs/export")
+async def export_logs_stream(
+    format: str = "csv",
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    level: str = "all",
+    after_id: Optional[int] = None,
+    gzip: bool = False,
+):
+    """
+    검증 이력 대량 내보내기 (보안성검토 보고용)
+
+    - format: csv | jsonl | parquet (컬럼형, pyarrow 필요)
+    - since / until: 기간 (since 이상, until 미만, YYYY-MM-DD[ HH:MM:SS])
+    - after_id: 마지막으로 받은 로그 ID 다음부터 이어받기 (모든 형식에 id 컬럼 포함 - 중단된 응답도 받은 행까지로 재개)
+    - gzip: csv/jsonl gzip 압축
+    - 오래된 순으로 청크 단위 스트리밍 (서버 메모리 일정, 페이지 요청 반복 불필요)
+    """
+    try:
+        body = export_logs(
+            fmt=format, since=since, until=until, level_filter=level,
+            after_id=after_id, compress=gzip,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    filename = f"validation_logs_{datetime.now().strftime('%Y%m%d%H%M%S')}.{format}" + (".gz" if gzip else "")
+    # 동기 반복자는 스레드풀에서 실행되어 DB 조회가 이벤트 루프를 막지 않음
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if gzip else _EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @app.get("/logs/{log_id}")
 async def detail_log(log_id: int):
     """검증 이력 상세 조회"""
@@ -514,6 +1165,28 @@ async def dashboard_stats(days: int = 30):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/logs/stats/violations")
+async def violation_hits(type: Optional[str] = None, rule: Optional[str] = None, days: int = 7, limit: int = 100):
+    """유형/규칙별 위반 탐지 이력 조회"""
+    try:
+        return {
+            "hits": get_violation_hits(
+                violation_type=type, rule_name=rule, days=min(days, 365), limit=min(limit, 1000)
+            )
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/logs/stats/rules")
+async def top_rules(days: int = 7, limit: int = 10, type: Optional[str] = None):
+    """탐지 건수 상위 규칙 조회"""
+    try:
+        return {"rules": get_top_rules(days=min(days, 365), limit=min(limit, 100), violation_type=type)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================
 # Entry Point
 # ============================================================
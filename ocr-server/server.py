@@ -11,13 +11,20 @@ os.environ["REQUESTS_CA_BUNDLE"] = ""
 ssl._create_default_https_context = ssl._create_unverified_context
 
 import io
+import sys
 import logging
 from fastapi import FastAPI, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from PIL import Image
+import numpy as np
 import easyocr
 
+# 전처리 파이프라인은 API 서버와 공용 (python/image_preprocess.py, OCR_* 환경변수로 설정)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python"))
+from image_preprocess import ImagePreprocessor
+from ocr_cache import OCRCache
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ocr-server")
 
@@ -35,10 +42,40 @@ logger.info("EasyOCR 모델 로딩 중... (최초 실행 시 다운로드 필요
 reader = easyocr.Reader(["ko", "en"], gpu=False)
 logger.info("EasyOCR 모델 로딩 완료")
 
+preprocessor = ImagePreprocessor.from_env()
+
+# 결과 캐시 (OCR_CACHE_MAX_MB 지정 시에만 사용, 추출 원문 저장 - OCR_CACHE_TTL 후 만료) - 엔진·언어·전처리 설정별로 분리
+ocr_cache = OCRCache.from_env()
+cache_namespace = f"easyocr:{easyocr.__version__}:ko+en:{preprocessor.settings_key()}"
+
+
+def _ocr_response(text_lines, cached):
+    """[[상자, 텍스트, 신뢰도], ...] → /ocr 응답"""
+    lines = [
+        {"text": text, "confidence": round(confidence, 3)}
+        for _, text, confidence in text_lines
+    ]
+    full_text = " ".join(line["text"] for line in lines)
+    return {
+        "success": True,
+        "engine": "easyocr",
+        "extracted_text": full_text,
+        "lines": lines,
+        "total_blocks": len(lines),
+        "total_chars": len(full_text),
+        "cached": cached,
+    }
+
 
 @app.get("/health")
 def health():
-    return {"status": "ok", "engine": "easyocr", "languages": ["ko", "en"]}
+    return {
+        "status": "ok",
+        "engine": "easyocr",
+        "languages": ["ko", "en"],
+        "preprocess": preprocessor.stats(),
+        "cache": ocr_cache.stats() if ocr_cache else None,
+    }
 
 
 @app.post("/ocr")
@@ -52,55 +89,46 @@ async def ocr(image: UploadFile = File(...)):
                 content={"error": "파일 크기는 10MB 이하여야 합니다."},
             )
 
-        img = Image.open(io.BytesIO(contents))
-
-        # RGBA -> RGB 변환 (PNG 투명 배경 처리)
-        if img.mode == "RGBA":
-            bg = Image.new("RGB", img.size, (255, 255, 255))
-            bg.paste(img, mask=img.split()[3])
-            img = bg
-        elif img.mode != "RGB":
-            img = img.convert("RGB")
-
-        # 이미지 전처리: 작은 이미지 업스케일 (인식률 향상)
-        width, height = img.size
-        if width < 1000 or height < 1000:
-            scale = max(1000 / width, 1000 / height)
-            img = img.resize(
-                (int(width * scale), int(height * scale)),
-                Image.LANCZOS,
-            )
-
-        # OCR 수행
-        img_bytes = io.BytesIO()
-        img.save(img_bytes, format="PNG")
-        img_bytes.seek(0)
-
-        results = reader.readtext(img_bytes.getvalue(), detail=1)
+        # 같은 파일 재업로드 → 디코딩 없이 캐시 응답
+        keys = []
+        if ocr_cache:
+            keys.append(ocr_cache.bytes_key(cache_namespace, contents))
+            cached = ocr_cache.get(keys)
+            if cached is not None:
+                return _ocr_response(cached["lines"], cached=True)
+
+        # 이미지 전처리: 투명 배경 합성, 배율 조정(작은 이미지 확대·대형 사진 축소), 흑백/이진화
+        with Image.open(io.BytesIO(contents)) as img:
+            img = preprocessor.process(img)
+
+            # 픽셀이 같은 이미지(재인코딩 사본 등) → 추론 생략
+            if ocr_cache:
+                image_keys = ocr_cache.image_keys(cache_namespace, img)
+                hit = ocr_cache.lookup(image_keys)
+                if hit is not None:
+                    cached, created_at = hit
+                    ocr_cache.put(keys, cached, created_at=created_at)
+                    return _ocr_response(cached["lines"], cached=True)
+                keys.extend(image_keys)
+            array = np.asarray(img)
+
+        # OCR 수행 (PNG 재인코딩 없이 RGB 배열 전달)
+        results = reader.readtext(array, detail=1)
 
         # 결과 정리 (numpy 타입을 Python 기본 타입으로 변환)
-        lines = []
-        full_text_parts = []
-        for bbox, text, confidence in results:
-            lines.append(
-                {"text": text, "confidence": round(float(confidence), 3)}
-            )
-            full_text_parts.append(text)
-
-        full_text = " ".join(full_text_parts)
-
+        text_lines = [
+            [[[float(x), float(y)] for x, y in bbox], text, float(confidence)]
+            for bbox, text, confidence in results
+        ]
+        if ocr_cache:
+            ocr_cache.lookup_miss()
+            ocr_cache.put(keys, {"lines": text_lines})
+
+        response = _ocr_response(text_lines, cached=False)
         logger.info(
-            f"OCR 완료: {len(lines)}개 텍스트 블록, {len(full_text)}자 추출"
+            f"OCR 완료: {response['total_blocks']}개 텍스트 블록, {response['total_chars']}자 추출"
         )
-
-        return {
-            "success": True,
-            "engine": "easyocr",
-            "extracted_text": full_text,
-            "lines": lines,
-            "total_blocks": len(lines),
-            "total_chars": len(full_text),
-        }
+        return response
 
     except Exception as e:
         logger.error(f"OCR 오류: {e}")
@@ -8,9 +8,17 @@ SQLite 기반 검증 이력 저장 및 조회
 """
 
 import sqlite3
+import base64
+import bisect
+import csv
+import io
 import json
 import os
 import hashlib
+import queue
+import threading
+import time
+import zlib
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from contextlib import contextmanager
@@ -19,16 +27,140 @@ from contextlib import contextmanager
 # DB 파일 경로 (환경변수 또는 기본값)
 DB_PATH = os.getenv("AUDIT_LOG_DB", os.path.join(os.path.dirname(__file__), "..", "data", "audit_log.db"))
 LOG_RETENTION_DAYS = int(os.getenv("LOG_RETENTION_DAYS", "90"))
+LOG_RETENTION_INTERVAL = float(os.getenv("LOG_RETENTION_INTERVAL", "3600"))   # 정리 주기(초)
+LOG_RETENTION_PAUSE = float(os.getenv("LOG_RETENTION_PAUSE", "0.05"))          # 파티션 삭제 사이 대기(초)
+LOG_RETENTION_BATCH = int(os.getenv("LOG_RETENTION_BATCH", "5000"))             # 경계 파티션 행 삭제 단위(건)
 
+# 로그 파티션 단위: 'month' (월 1일 기준) | 'week' (월요일 기준)
+LOG_PARTITION_UNIT = os.getenv("AUDIT_LOG_PARTITION", "month")
 
-@contextmanager
-def get_db():
-    """SQLite 연결 컨텍스트 매니저"""
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+# 대시보드 집계 히스토그램 구간
+RISK_BUCKET_WIDTH = 10  # 위험점수 0~9, 10~19, ..., 100
+RESPONSE_TIME_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)  # 구간 상한 (초과분은 마지막 구간)
+
+
+# 커넥션 풀 설정
+DB_READERS = int(os.getenv("AUDIT_DB_READERS", "4"))
+DB_CACHE_SIZE_KB = int(os.getenv("AUDIT_DB_CACHE_SIZE_KB", "16384"))
+DB_MMAP_SIZE = int(os.getenv("AUDIT_DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+
+def _connect(path: str, readonly: bool = False) -> sqlite3.Connection:
+    """튜닝된 PRAGMA가 적용된 SQLite 연결 생성"""
+    conn = sqlite3.connect(path, check_same_thread=False, timeout=10, cached_statements=256)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    if not readonly:
+        # 신규 DB는 삭제로 생긴 빈 페이지를 점진 반환 (WAL 전환 전에 설정해야 적용,
+        # 기존 DB는 VACUUM 전까지 무시됨)
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA cache_size=-{DB_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size={DB_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
     conn.execute("PRAGMA foreign_keys=ON")
+    if readonly:
+        conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+class ConnectionPool:
+    """
+    SQLite 커넥션 풀 (쓰기 1 + 읽기 N)
+
+    - WAL 모드에서 쓰기는 단일 연결로 직렬화, 읽기는 여러 연결이 동시 수행
+    - 연결을 재사용하므로 PRAGMA 설정·준비된 문장(statement cache)이 유지됨
+    """
+
+    def __init__(self, path: str, readers: int = 4):
+        self.path = path
+        self._writer = _connect(path)
+        self._writer_lock = threading.RLock()
+        self._readers: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._reader_count = max(1, readers)
+        for _ in range(self._reader_count):
+            self._readers.put(_connect(path, readonly=True))
+        self._closed = False
+
+        self.writer_acquires = 0
+        self.reader_acquires = 0
+        self.reader_waits = 0
+        self.wait_time = 0.0
+
+    @contextmanager
+    def writer(self):
+        """쓰기 연결 (블록 종료 시 commit, 예외 시 rollback)"""
+        start = time.perf_counter()
+        with self._writer_lock:
+            if self._closed:
+                raise RuntimeError("커넥션 풀이 종료되었습니다")
+            self.writer_acquires += 1
+            self.wait_time += time.perf_counter() - start
+            conn = self._writer
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @contextmanager
+    def reader(self):
+        """읽기 전용 연결 (모두 사용 중이면 반환될 때까지 대기)"""
+        if self._closed:
+            raise RuntimeError("커넥션 풀이 종료되었습니다")
+        start = time.perf_counter()
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            self.reader_waits += 1
+            conn = self._readers.get(timeout=30)
+        self.reader_acquires += 1
+        self.wait_time += time.perf_counter() - start
+        try:
+            # 파티션 목록 조회와 파티션 테이블 조회가 같은 스냅샷을 보도록 명시적 트랜잭션
+            conn.execute("BEGIN")
+            yield conn
+        finally:
+            # 읽기 트랜잭션 종료 (WAL 스냅샷 해제)
+            conn.rollback()
+            self._readers.put(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "readers": self._reader_count,
+            "readers_idle": self._readers.qsize(),
+            "writer_acquires": self.writer_acquires,
+            "reader_acquires": self.reader_acquires,
+            "reader_waits": self.reader_waits,
+            "wait_time_ms": round(self.wait_time * 1000, 2),
+        }
+
+    def close(self):
+        """모든 연결 종료 (WAL 체크포인트 포함)"""
+        with self._writer_lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._writer.execute("PRAGMA optimize")
+                self._writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
+            self._writer.close()
+        for _ in range(self._reader_count):
+            self._readers.get(timeout=30).close()
+
+
+_pool: Optional[ConnectionPool] = None
+
+
+@contextmanager
+def _get_direct_db():
+    """풀 없이 단발성 연결 (init_db 이전, CLI 등)"""
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    conn = _connect(DB_PATH)
     try:
         yield conn
         conn.commit()
@@ -39,27 +171,64 @@ def get_db():
         conn.close()
 
 
+def get_db():
+    """SQLite 쓰기 연결 컨텍스트 매니저 (풀이 있으면 풀의 쓰기 연결 사용)"""
+    if _pool is not None:
+        return _pool.writer()
+    return _get_direct_db()
+
+
+def get_read_db():
+    """SQLite 읽기 연결 컨텍스트 매니저 (풀이 있으면 풀의 읽기 연결 사용)"""
+    if _pool is not None:
+        return _pool.reader()
+    return _get_direct_db()
+
+
+def pool_stats() -> Optional[Dict[str, Any]]:
+    """커넥션 풀 상태"""
+    return _pool.stats() if _pool is not None else None
+
+
+def close_db():
+    """커넥션 풀 종료 (lifespan 종료 시 기록기 정지 후 호출)"""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+
 def init_db():
-    """DB 테이블 초기화"""
+    """DB 테이블 초기화 및 커넥션 풀 생성"""
+    global _pool
+    if LOG_PARTITION_UNIT not in ("month", "week"):
+        raise ValueError(f"지원하지 않는 파티션 단위: {LOG_PARTITION_UNIT}")
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
     with get_db() as conn:
         conn.executescript("""
-            CREATE TABLE IF NOT EXISTS validation_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL DEFAULT (datetime('now', 'localtime')),
-                session_id TEXT,
-                input_type TEXT NOT NULL DEFAULT 'text',
-                prompt_hash TEXT NOT NULL,
-                prompt_length INTEGER NOT NULL,
+            -- 검증 이력 파티션 목록 (validation_logs_{name} / log_violations_{name}, 기간 [start_date, end_date))
+            CREATE TABLE IF NOT EXISTS log_partitions (
+                name TEXT PRIMARY KEY,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                min_id INTEGER,
+                max_id INTEGER
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_partitions_start ON log_partitions(start_date);
+
+            -- 파티션 간 고유한 로그 ID 발급
+            CREATE TABLE IF NOT EXISTS log_sequence (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                last_id INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO log_sequence (id, last_id) VALUES (0, 0);
+
+            -- 파티션·보안등급별 누적 건수 (목록 조회 시 전체 COUNT 대체)
+            CREATE TABLE IF NOT EXISTS log_partition_counts (
+                partition_name TEXT NOT NULL,
                 security_level TEXT NOT NULL,
-                risk_score INTEGER NOT NULL,
-                is_safe INTEGER NOT NULL,
-                violation_count INTEGER NOT NULL DEFAULT 0,
-                violation_types TEXT,
-                violation_details TEXT,
-                regulation_refs TEXT,
-                client_ip TEXT,
-                user_agent TEXT,
-                response_time_ms INTEGER
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (partition_name, security_level)
             );
 
             CREATE TABLE IF NOT EXISTS daily_stats (
@@ -73,14 +242,326 @@ def init_db():
                 top_violation_types TEXT
             );
 
-            CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON validation_logs(timestamp);
-            CREATE INDEX IF NOT EXISTS idx_logs_security_level ON validation_logs(security_level);
-            CREATE INDEX IF NOT EXISTS idx_logs_risk_score ON validation_logs(risk_score);
+            -- 대시보드 집계 (granularity: 'hour' → period 'YYYY-MM-DD HH', 'day' → 'YYYY-MM-DD')
+            CREATE TABLE IF NOT EXISTS rollup_stats (
+                granularity TEXT NOT NULL,
+                period TEXT NOT NULL,
+                total INTEGER NOT NULL DEFAULT 0,
+                safe_count INTEGER NOT NULL DEFAULT 0,
+                warning_count INTEGER NOT NULL DEFAULT 0,
+                danger_count INTEGER NOT NULL DEFAULT 0,
+                blocked_count INTEGER NOT NULL DEFAULT 0,
+                violation_requests INTEGER NOT NULL DEFAULT 0,
+                risk_sum INTEGER NOT NULL DEFAULT 0,
+                risk_max INTEGER NOT NULL DEFAULT 0,
+                response_sum INTEGER NOT NULL DEFAULT 0,
+                response_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (granularity, period)
+            );
+
+            CREATE TABLE IF NOT EXISTS rollup_violations (
+                granularity TEXT NOT NULL,
+                period TEXT NOT NULL,
+                violation_type TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (granularity, period, violation_type)
+            );
+
+            -- metric: 'risk' (RISK_BUCKET_WIDTH 단위) / 'response_ms' (RESPONSE_TIME_BUCKETS_MS 인덱스)
+            CREATE TABLE IF NOT EXISTS rollup_histograms (
+                granularity TEXT NOT NULL,
+                period TEXT NOT NULL,
+                metric TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (granularity, period, metric, bucket)
+            );
         """)
+        # 기존 DB 마이그레이션: 파티션 테이블에 추가된 컬럼 반영
+        _add_partition_columns(conn)
+        # 기존 DB 마이그레이션: 단일 validation_logs 테이블 → 기간별 파티션 1회 이관
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'validation_logs'"
+        ).fetchone():
+            _migrate_legacy_logs(conn)
+        # 기존 DB 마이그레이션: 대시보드 집계가 비어 있으면 전체 로그로 1회 재구성
+        if conn.execute("SELECT 1 FROM rollup_stats LIMIT 1").fetchone() is None:
+            _rebuild_rollups(conn)
+    if _pool is None:
+        _pool = ConnectionPool(DB_PATH, readers=DB_READERS)
     print("✅ Audit log DB initialized:", DB_PATH)
 
 
-def log_validation(
+# 파티션 테이블 (name: 'p' + 시작일 YYYYMMDD, 예: validation_logs_p20261001)
+# id는 log_sequence에서 발급하므로 파티션 간에도 고유
+_PARTITION_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS validation_logs_{name} (
+        id INTEGER PRIMARY KEY,
+        timestamp TEXT NOT NULL,
+        session_id TEXT,
+        input_type TEXT NOT NULL DEFAULT 'text',
+        prompt_hash TEXT NOT NULL,
+        prompt_length INTEGER NOT NULL,
+        security_level TEXT NOT NULL,
+        risk_score INTEGER NOT NULL,
+        is_safe INTEGER NOT NULL,
+        violation_count INTEGER NOT NULL DEFAULT 0,
+        violation_types TEXT,
+        violation_details TEXT,
+        regulation_refs TEXT,
+        client_ip TEXT,
+        user_agent TEXT,
+        response_time_ms INTEGER,
+        violation_rule_counts TEXT  -- 유형·규칙별 위반 건수 JSON (위반사항은 표본만 기록한 경우, 예: 스트리밍 검증)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS log_violations_{name} (
+        id INTEGER PRIMARY KEY,
+        log_id INTEGER NOT NULL REFERENCES validation_logs_{name}(id) ON DELETE CASCADE,
+        timestamp TEXT NOT NULL,
+        type TEXT NOT NULL,
+        rule_name TEXT,
+        description TEXT,
+        severity INTEGER
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_logs_{name}_timestamp ON validation_logs_{name}(timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_logs_{name}_risk_score ON validation_logs_{name}(risk_score)",
+    # 등급 필터 + 커서 페이지네이션용
+    "CREATE INDEX IF NOT EXISTS idx_logs_{name}_level_ts_id ON validation_logs_{name}(security_level, timestamp, id)",
+    "CREATE INDEX IF NOT EXISTS idx_violations_{name}_log ON log_violations_{name}(log_id)",
+    "CREATE INDEX IF NOT EXISTS idx_violations_{name}_timestamp ON log_violations_{name}(timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_violations_{name}_type_ts ON log_violations_{name}(type, timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_violations_{name}_rule_ts ON log_violations_{name}(rule_name, timestamp)",
+)
+
+
+def _partition_bounds(day: str) -> tuple:
+    """날짜('YYYY-MM-DD') → 해당 파티션의 (시작일, 종료일) - 종료일은 미포함"""
+    d = datetime.strptime(day, "%Y-%m-%d").date()
+    if LOG_PARTITION_UNIT == "week":
+        start = d - timedelta(days=d.weekday())
+        end = start + timedelta(days=7)
+    else:
+        start = d.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+    return start.isoformat(), end.isoformat()
+
+
+def _load_partitions(conn: sqlite3.Connection, since: str = None, until: str = None) -> List[sqlite3.Row]:
+    """
+    기간이 겹치는 파티션 목록 (최신순)
+
+    Args:
+        since: 이 시각('YYYY-MM-DD[ HH:MM:SS]') 이후 로그가 있을 수 있는 파티션만
+        until: 이 시각 이전(포함) 로그가 있을 수 있는 파티션만
+    """
+    conditions: List[str] = []
+    params: list = []
+    if since:
+        conditions.append("end_date > ?")
+        params.append(since[:10])
+    if until:
+        conditions.append("start_date <= ?")
+        params.append(until)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return conn.execute(f"""
+        SELECT name, start_date, end_date, min_id, max_id FROM log_partitions {where}
+        ORDER BY start_date DESC
+    """, params).fetchall()
+
+
+def _create_partition(conn: sqlite3.Connection, start: str, end: str) -> str:
+    """파티션 테이블·인덱스 생성 및 등록 (호출자 트랜잭션 내). 파티션 이름 반환"""
+    name = "p" + start.replace("-", "")
+    for ddl in _PARTITION_DDL:
+        conn.execute(ddl.format(name=name))
+    conn.execute(
+        "INSERT INTO log_partitions (name, start_date, end_date) VALUES (?, ?, ?)", (name, start, end)
+    )
+    return name
+
+
+def _partition_for(conn: sqlite3.Connection, partitions: List[Any], day: str) -> str:
+    """
+    날짜가 속한 파티션 이름 (없으면 생성)
+
+    Args:
+        partitions: _load_partitions 결과 목록 (새 파티션 생성 시 추가됨)
+    """
+    for p in partitions:
+        if p["start_date"] <= day < p["end_date"]:
+            return p["name"]
+
+    # 파티션 단위가 바뀐 경우에도 기존 파티션과 기간이 겹치지 않도록 경계 조정
+    start, end = _partition_bounds(day)
+    for p in partitions:
+        if p["end_date"] <= day:
+            start = max(start, p["end_date"])
+        else:
+            end = min(end, p["start_date"])
+    name = _create_partition(conn, start, end)
+    partitions.append({"name": name, "start_date": start, "end_date": end})
+    return name
+
+
+def _add_partition_columns(conn: sqlite3.Connection):
+    """이전 버전에서 만든 파티션 테이블에 이후 추가된 컬럼 추가"""
+    for p in _load_partitions(conn):
+        table = f"validation_logs_{p['name']}"
+        columns = {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+        if "violation_rule_counts" not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN violation_rule_counts TEXT")
+
+
+def _drop_partition(conn: sqlite3.Connection, name: str):
+    """파티션 테이블 삭제 및 등록 해제 (위반사항 테이블 먼저 - 외래키 검사 생략)"""
+    conn.execute(f"DROP TABLE IF EXISTS log_violations_{name}")
+    conn.execute(f"DROP TABLE IF EXISTS validation_logs_{name}")
+    conn.execute("DELETE FROM log_partitions WHERE name = ?", (name,))
+    conn.execute("DELETE FROM log_partition_counts WHERE partition_name = ?", (name,))
+
+
+def _migrate_legacy_logs(conn: sqlite3.Connection):
+    """
+    단일 validation_logs / log_violations 테이블의 로그를 기간별 파티션으로 이관 (최초 1회)
+
+    로그 ID는 그대로 유지하고, 이관 후 기존 테이블과 log_counts는 삭제
+    """
+    has_violations = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'log_violations'"
+    ).fetchone() is not None
+
+    partitions = list(_load_partitions(conn))
+    days = [r[0] for r in conn.execute("SELECT DISTINCT substr(timestamp, 1, 10) FROM validation_logs")]
+    names = {_partition_for(conn, partitions, day) for day in days}
+
+    for p in partitions:
+        if p["name"] not in names:
+            continue
+        name = p["name"]
+        conn.execute(f"""
+            INSERT INTO validation_logs_{name} (id, {_LEGACY_LOG_COLUMNS})
+            SELECT id, {_LEGACY_LOG_COLUMNS} FROM validation_logs
+            WHERE timestamp >= ? AND timestamp < ?
+        """, (p["start_date"], p["end_date"]))
+        if has_violations:
+            conn.execute(f"""
+                INSERT INTO log_violations_{name} (log_id, timestamp, type, rule_name, description, severity)
+                SELECT log_id, timestamp, type, rule_name, description, severity FROM log_violations
+                WHERE log_id IN (SELECT id FROM validation_logs_{name})
+                ORDER BY id
+            """)
+        # violation_details JSON만 있는 로그는 위반사항 행으로 이관
+        _migrate_violation_details(conn, name)
+
+        conn.execute(f"""
+            INSERT INTO log_partition_counts (partition_name, security_level, count)
+            SELECT ?, security_level, COUNT(*) FROM validation_logs_{name} GROUP BY security_level
+            ON CONFLICT(partition_name, security_level) DO UPDATE SET count = count + excluded.count
+        """, (name,))
+        conn.execute(f"""
+            UPDATE log_partitions SET
+                min_id = (SELECT MIN(id) FROM validation_logs_{name}),
+                max_id = (SELECT MAX(id) FROM validation_logs_{name})
+            WHERE name = ?
+        """, (name,))
+
+    conn.execute("""
+        UPDATE log_sequence SET last_id = MAX(last_id, (SELECT COALESCE(MAX(id), 0) FROM validation_logs))
+    """)
+    if has_violations:
+        conn.execute("DROP TABLE log_violations")
+    conn.execute("DROP TABLE validation_logs")
+    conn.execute("DROP TABLE IF EXISTS log_counts")
+
+
+# 단일 validation_logs 테이블(파티션 이전) 컬럼
+_LEGACY_LOG_COLUMNS = """
+    timestamp, session_id, input_type, prompt_hash, prompt_length,
+    security_level, risk_score, is_safe,
+    violation_count, violation_types, violation_details,
+    regulation_refs, client_ip, user_agent, response_time_ms
+"""
+
+_LOG_COLUMNS = _LEGACY_LOG_COLUMNS.rstrip() + ", violation_rule_counts\n"
+
+# {name}: 파티션 이름 (_partition_for 결과)
+_INSERT_LOG_SQL = f"""
+    INSERT INTO validation_logs_{{name}} (id, {_LOG_COLUMNS})
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# _build_log_row 결과 튜플 내 위치 (_ROW_VIOLATIONS: INSERT 파라미터 뒤에 붙는 위반사항 목록)
+_ROW_TIMESTAMP, _ROW_LEVEL, _ROW_RISK = 0, 5, 6
+_ROW_VIOLATION_COUNT, _ROW_VIOLATION_TYPES, _ROW_RESPONSE_MS = 8, 9, 14
+_ROW_VIOLATIONS = 16
+
+_INSERT_VIOLATION_SQL = """
+    INSERT INTO log_violations_{name} (log_id, timestamp, type, rule_name, description, severity)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_ADD_LOG_COUNT_SQL = """
+    INSERT INTO log_partition_counts (partition_name, security_level, count) VALUES (?, ?, ?)
+    ON CONFLICT(partition_name, security_level) DO UPDATE SET count = count + excluded.count
+"""
+
+_UPDATE_PARTITION_IDS_SQL = """
+    UPDATE log_partitions SET
+        min_id = MIN(COALESCE(min_id, ?1), ?1),
+        max_id = MAX(COALESCE(max_id, ?2), ?2)
+    WHERE name = ?3
+"""
+
+_UPSERT_ROLLUP_STATS_SQL = """
+    INSERT INTO rollup_stats (
+        granularity, period, total, safe_count, warning_count, danger_count, blocked_count,
+        violation_requests, risk_sum, risk_max, response_sum, response_count
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(granularity, period) DO UPDATE SET
+        total = total + excluded.total,
+        safe_count = safe_count + excluded.safe_count,
+        warning_count = warning_count + excluded.warning_count,
+        danger_count = danger_count + excluded.danger_count,
+        blocked_count = blocked_count + excluded.blocked_count,
+        violation_requests = violation_requests + excluded.violation_requests,
+        risk_sum = risk_sum + excluded.risk_sum,
+        risk_max = MAX(risk_max, excluded.risk_max),
+        response_sum = response_sum + excluded.response_sum,
+        response_count = response_count + excluded.response_count
+"""
+
+_UPSERT_ROLLUP_VIOLATION_SQL = """
+    INSERT INTO rollup_violations (granularity, period, violation_type, count) VALUES (?, ?, ?, ?)
+    ON CONFLICT(granularity, period, violation_type) DO UPDATE SET count = count + excluded.count
+"""
+
+_UPSERT_ROLLUP_HISTOGRAM_SQL = """
+    INSERT INTO rollup_histograms (granularity, period, metric, bucket, count) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(granularity, period, metric, bucket) DO UPDATE SET count = count + excluded.count
+"""
+
+_LEVEL_COLUMNS = {"안전": 0, "경고": 1, "위험": 2, "차단": 3}
+
+_UPSERT_DAILY_STATS_SQL = """
+    INSERT INTO daily_stats (date, total_requests, safe_count, warning_count, danger_count, blocked_count, avg_risk_score)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(date) DO UPDATE SET
+        avg_risk_score = ROUND(
+            (avg_risk_score * total_requests + excluded.avg_risk_score * excluded.total_requests)
+            / (total_requests + excluded.total_requests), 1),
+        total_requests = total_requests + excluded.total_requests,
+        safe_count = safe_count + excluded.safe_count,
+        warning_count = warning_count + excluded.warning_count,
+        danger_count = danger_count + excluded.danger_count,
+        blocked_count = blocked_count + excluded.blocked_count
+"""
+
+
+def _build_log_row(
     prompt: str,
     result: Dict[str, Any],
     input_type: str = "text",
@@ -88,158 +569,679 @@ def log_validation(
     client_ip: str = None,
     user_agent: str = None,
     response_time_ms: int = None,
-):
-    """검증 결과를 DB에 저장"""
+    prompt_hash: str = None,
+    prompt_length: int = None,
+) -> tuple:
+    """
+    검증 결과 → validation_logs 파티션 INSERT 파라미터(ID 제외) + 위반사항 목록 (기록 시각은 호출 시점)
+
+    위반 상세는 log_violations 테이블에 행 단위로 저장 (violation_details 컬럼은 기록하지 않음)
+    result["violation_rule_counts"]([{"type", "rule_name", "count"}, ...])가 있으면 violations는 표본으로 보고
+    유형·규칙별 건수를 로그 행에 함께 저장 (위반 유형 목록도 건수 기준)
+    """
     # 프롬프트는 해시로만 저장 (원문 저장 금지 - 보안)
-    prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+    if prompt_hash is None:
+        prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+    if prompt_length is None:
+        prompt_length = len(prompt)
 
     violations = result.get("violations", [])
-    violation_types = list(set(v.get("type", "") for v in violations))
+    rule_counts = result.get("violation_rule_counts")
+    violation_types = list(set(v.get("type", "") for v in (rule_counts or violations)))
     regulation_refs = result.get("regulation_refs", [])
 
-    with get_db() as conn:
-        conn.execute("""
-            INSERT INTO validation_logs (
-                session_id, input_type, prompt_hash, prompt_length,
-                security_level, risk_score, is_safe,
-                violation_count, violation_types, violation_details,
-                regulation_refs, client_ip, user_agent, response_time_ms
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            session_id,
-            input_type,
-            prompt_hash,
-            len(prompt),
-            result.get("security_level", "안전"),
-            result.get("risk_score", 0),
-            1 if result.get("is_safe", True) else 0,
-            len(violations),
-            json.dumps(violation_types, ensure_ascii=False),
-            json.dumps([
-                {"type": v.get("type"), "description": v.get("description"), "severity": v.get("severity")}
-                for v in violations
-            ], ensure_ascii=False),
-            json.dumps([
-                {"law": r.get("law"), "article": r.get("article"), "source": r.get("source")}
-                for r in regulation_refs
-            ], ensure_ascii=False),
-            client_ip,
-            user_agent,
-            response_time_ms,
-        ))
-
-    # 일별 통계 업데이트
-    _update_daily_stats(result)
-
-
-def _update_daily_stats(result: Dict[str, Any]):
-    """일별 통계 갱신"""
-    today = datetime.now().strftime("%Y-%m-%d")
-    level = result.get("security_level", "안전")
-    risk = result.get("risk_score", 0)
+    return (
+        datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        session_id,
+        input_type,
+        prompt_hash,
+        prompt_length,
+        result.get("security_level", "안전"),
+        result.get("risk_score", 0),
+        1 if result.get("is_safe", True) else 0,
+        result.get("violation_count", len(violations)),
+        json.dumps(violation_types, ensure_ascii=False),
+        None,
+        json.dumps([
+            {"law": r.get("law"), "article": r.get("article"), "source": r.get("source")}
+            for r in regulation_refs
+        ], ensure_ascii=False),
+        client_ip,
+        user_agent,
+        response_time_ms,
+        json.dumps(rule_counts, ensure_ascii=False) if rule_counts is not None else None,
+        [
+            (v.get("type", ""), v.get("rule_name"), v.get("description"), v.get("severity"))
+            for v in violations
+        ],
+    )
+
+
+def _allocate_ids(conn: sqlite3.Connection, count: int) -> int:
+    """로그 ID count개 발급 (호출자 트랜잭션 내). 첫 ID 반환"""
+    conn.execute("UPDATE log_sequence SET last_id = last_id + ? WHERE id = 0", (count,))
+    return conn.execute("SELECT last_id FROM log_sequence WHERE id = 0").fetchone()[0] - count + 1
+
+
+def _write_rows(conn: sqlite3.Connection, rows: List[tuple]):
+    """로그·위반사항 파티션별 INSERT + 일별 통계·등급별 건수 UPSERT (호출자 트랜잭션 내)"""
+    partitions = list(_load_partitions(conn))
+    per_partition: Dict[str, list] = {}
+    for log_id, row in enumerate(rows, _allocate_ids(conn, len(rows))):
+        name = _partition_for(conn, partitions, row[_ROW_TIMESTAMP][:10])
+        per_partition.setdefault(name, []).append((log_id, row))
+
+    per_level: Dict[tuple, int] = {}
+    for name, items in per_partition.items():
+        conn.executemany(_INSERT_LOG_SQL.format(name=name), [
+            (log_id,) + row[:_ROW_VIOLATIONS] for log_id, row in items
+        ])
+        conn.executemany(_INSERT_VIOLATION_SQL.format(name=name), [
+            (log_id, row[_ROW_TIMESTAMP]) + violation
+            for log_id, row in items
+            for violation in row[_ROW_VIOLATIONS]
+        ])
+        conn.execute(_UPDATE_PARTITION_IDS_SQL, (items[0][0], items[-1][0], name))
+        for _, row in items:
+            key = (name, row[_ROW_LEVEL])
+            per_level[key] = per_level.get(key, 0) + 1
+
+    # 일별 통계: 날짜별 합산 후 1회 UPSERT
+    per_day: Dict[str, list] = {}
+    for row in rows:
+        day = per_day.setdefault(row[_ROW_TIMESTAMP][:10], [0, 0, 0, 0, 0, 0])
+        day[0] += 1
+        level = row[_ROW_LEVEL]
+        if level == "안전":
+            day[1] += 1
+        elif level == "경고":
+            day[2] += 1
+        elif level == "위험":
+            day[3] += 1
+        elif level == "차단":
+            day[4] += 1
+        day[5] += row[_ROW_RISK]
+
+    conn.executemany(_UPSERT_DAILY_STATS_SQL, [
+        (date, total, safe, warning, danger, blocked, round(risk_sum / total, 1))
+        for date, (total, safe, warning, danger, blocked, risk_sum) in per_day.items()
+    ])
+    conn.executemany(_ADD_LOG_COUNT_SQL, [key + (cnt,) for key, cnt in per_level.items()])
+
+    _update_rollups(conn, (
+        (row[_ROW_TIMESTAMP], row[_ROW_LEVEL], row[_ROW_RISK], row[_ROW_VIOLATION_COUNT],
+         row[_ROW_VIOLATION_TYPES], row[_ROW_RESPONSE_MS])
+        for row in rows
+    ))
+
+
+def _update_rollups(conn: sqlite3.Connection, records) -> None:
+    """
+    시간·일 단위 대시보드 집계 증분 반영
+
+    Args:
+        records: (timestamp, security_level, risk_score, violation_count,
+                  violation_types JSON, response_time_ms) 반복자
+    """
+    stats: Dict[tuple, list] = {}
+    violations: Dict[tuple, int] = {}
+    histograms: Dict[tuple, int] = {}
+
+    for timestamp, level, risk, violation_count, violation_types, response_ms in records:
+        risk = risk or 0
+        types = json.loads(violation_types) if violation_types else []
+        risk_bucket = min(risk // RISK_BUCKET_WIDTH, 100 // RISK_BUCKET_WIDTH)
+        response_bucket = (
+            bisect.bisect_left(RESPONSE_TIME_BUCKETS_MS, response_ms) if response_ms is not None else None
+        )
+
+        for key in (("hour", timestamp[:13]), ("day", timestamp[:10])):
+            # total, 안전, 경고, 위험, 차단, 위반건, risk_sum, risk_max, response_sum, response_count
+            agg = stats.get(key)
+            if agg is None:
+                agg = stats[key] = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+            agg[0] += 1
+            column = _LEVEL_COLUMNS.get(level)
+            if column is not None:
+                agg[1 + column] += 1
+            if violation_count:
+                agg[5] += 1
+            agg[6] += risk
+            agg[7] = max(agg[7], risk)
+            if response_bucket is not None:
+                agg[8] += response_ms
+                agg[9] += 1
+
+            for vtype in types:
+                vkey = key + (vtype,)
+                violations[vkey] = violations.get(vkey, 0) + 1
+            hkey = key + ("risk", risk_bucket)
+            histograms[hkey] = histograms.get(hkey, 0) + 1
+            if response_bucket is not None:
+                hkey = key + ("response_ms", response_bucket)
+                histograms[hkey] = histograms.get(hkey, 0) + 1
+
+    conn.executemany(_UPSERT_ROLLUP_STATS_SQL, [key + tuple(agg) for key, agg in stats.items()])
+    conn.executemany(_UPSERT_ROLLUP_VIOLATION_SQL, [key + (cnt,) for key, cnt in violations.items()])
+    conn.executemany(_UPSERT_ROLLUP_HISTOGRAM_SQL, [key + (cnt,) for key, cnt in histograms.items()])
+
+
+def _rule_name_from_description(description: Optional[str]) -> Optional[str]:
+    """기존 위반 설명에서 규칙명 추출 ('{패턴명} 탐지' / '{규칙명}: '키워드' 키워드 발견')"""
+    if not description:
+        return None
+    if " 키워드 발견" in description and ": " in description:
+        return description.split(": ", 1)[0]
+    if description.endswith(" 탐지"):
+        return description[:-len(" 탐지")]
+    return None
+
+
+def _migrate_violation_details(conn: sqlite3.Connection, name: str, chunk_size: int = 5000) -> None:
+    """
+    파티션 내 로그의 violation_details JSON을 위반사항 행으로 이관 (기존 DB 최초 1회)
+
+    원본 JSON은 그대로 보존 (해석할 수 없는 값도 남겨 두고, 새 로그에는 기록하지 않음)
+    """
+    cursor = conn.execute(f"""
+        SELECT id, timestamp, violation_details FROM validation_logs_{name}
+        WHERE violation_details IS NOT NULL
+    """)
+    insert_sql = _INSERT_VIOLATION_SQL.format(name=name)
+    while True:
+        chunk = cursor.fetchmany(chunk_size)
+        if not chunk:
+            break
+        params = []
+        for log_id, timestamp, details in chunk:
+            try:
+                items = json.loads(details)
+            except (json.JSONDecodeError, TypeError):
+                continue
+            for v in items:
+                description = v.get("description")
+                params.append((
+                    log_id, timestamp, v.get("type") or "",
+                    _rule_name_from_description(description), description, v.get("severity"),
+                ))
+        conn.executemany(insert_sql, params)
+
+
+def _rebuild_rollups(conn: sqlite3.Connection, chunk_size: int = 5000) -> None:
+    """전체 파티션 로그로 대시보드 집계 재구성 (기존 DB 최초 1회)"""
+    conn.execute("DELETE FROM rollup_stats")
+    conn.execute("DELETE FROM rollup_violations")
+    conn.execute("DELETE FROM rollup_histograms")
+    for p in _load_partitions(conn):
+        cursor = conn.execute(f"""
+            SELECT timestamp, security_level, risk_score, violation_count, violation_types, response_time_ms
+            FROM validation_logs_{p["name"]}
+        """)
+        while True:
+            chunk = cursor.fetchmany(chunk_size)
+            if not chunk:
+                break
+            _update_rollups(conn, (tuple(r) for r in chunk))
+
+
+class AuditLogWriter:
+    """
+    백그라운드 감사로그 기록기
+
+    - 요청 경로에서는 행(row)을 메모리 큐에 넣기만 함 (디스크 I/O 없음)
+    - 기록 스레드가 batch_size 건 또는 flush_interval 초마다 단일 트랜잭션으로 기록
+    - 큐가 가득 차면 해당 로그는 버리고 dropped 증가 (요청은 지연시키지 않음)
+    - stop() 시 남은 큐를 모두 기록한 뒤 종료
+    """
+
+    def __init__(self, queue_size: int = 10000, batch_size: int = 500, flush_interval: float = 0.5):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[tuple]" = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, rows: List[tuple]):
+        for row in rows:
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                self.dropped += 1
+
+    def _run(self):
+        while not self._stop.is_set() or not self._queue.empty():
+            batch = self._take_batch()
+            if batch:
+                self._flush(batch)
+
+    def _take_batch(self) -> List[tuple]:
+        """첫 행을 기다린 뒤 batch_size 또는 flush_interval 중 먼저 도달할 때까지 수집"""
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop.is_set():
+                # 종료 중에는 기다리지 않고 남은 행만 수집
+                try:
+                    while len(batch) < self.batch_size:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    pass
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: List[tuple]):
+        try:
+            with get_db() as conn:
+                _write_rows(conn, batch)
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:
+            self.errors += 1
+            self.last_error = str(e)
+            print(f"⚠️ Audit log batch write failed ({len(batch)} rows): {e}")
+
+    def stop(self, timeout: float = 10.0):
+        """남은 큐를 기록하고 종료"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+
+_writer: Optional[AuditLogWriter] = None
+
+
+def start_writer() -> AuditLogWriter:
+    """백그라운드 기록기 시작 (이후 log_validation은 큐에 적재만 수행)"""
+    global _writer
+    if _writer is None:
+        _writer = AuditLogWriter(
+            queue_size=int(os.getenv("AUDIT_LOG_QUEUE_SIZE", "10000")),
+            batch_size=int(os.getenv("AUDIT_LOG_BATCH_SIZE", "500")),
+            flush_interval=float(os.getenv("AUDIT_LOG_FLUSH_INTERVAL", "0.5")),
+        )
+    _writer.start()
+    return _writer
 
-    with get_db() as conn:
-        row = conn.execute("SELECT * FROM daily_stats WHERE date = ?", (today,)).fetchone()
 
+def stop_writer():
+    """남은 로그를 모두 기록한 뒤 백그라운드 기록기 종료"""
+    if _writer is not None:
+        _writer.stop()
+
+
+def writer_stats() -> Optional[Dict[str, Any]]:
+    """백그라운드 기록기 상태 (큐 깊이, 누락 건수 등)"""
+    return _writer.stats() if _writer is not None else None
+
+
+def _submit_rows(rows: List[tuple]):
+    """기록기 동작 중이면 큐에 적재, 아니면 즉시 기록 (CLI 등)"""
+    if _writer is not None and _writer.running:
+        _writer.enqueue(rows)
+    else:
+        with get_db() as conn:
+            _write_rows(conn, rows)
+
+
+def log_validation(
+    prompt: str,
+    result: Dict[str, Any],
+    input_type: str = "text",
+    session_id: str = None,
+    client_ip: str = None,
+    user_agent: str = None,
+    response_time_ms: int = None,
+    prompt_hash: str = None,
+    prompt_length: int = None,
+):
+    """검증 결과를 DB에 저장
+
+    스트리밍 검증처럼 원문 전체를 보관하지 않는 경우 prompt_hash/prompt_length를 직접 전달
+    """
+    _submit_rows([_build_log_row(
+        prompt, result, input_type, session_id, client_ip, user_agent,
+        response_time_ms, prompt_hash, prompt_length,
+    )])
+
+
+def log_validations(entries: List[Dict[str, Any]]) -> int:
+    """
+    다건 검증 결과를 단일 트랜잭션으로 저장
+
+    Args:
+        entries: log_validation 인자(dict) 목록. 예: {"prompt": ..., "result": ..., "input_type": "batch"}
+
+    Returns:
+        int: 저장(또는 큐 적재)된 건수
+    """
+    if not entries:
+        return 0
+
+    rows = [_build_log_row(**entry) for entry in entries]
+    _submit_rows(rows)
+    return len(rows)
+
+
+def _encode_cursor(timestamp: str, log_id: int) -> str:
+    """(timestamp, id) → 불투명 커서 문자열"""
+    return base64.urlsafe_b64encode(f"{timestamp}|{log_id}".encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """불투명 커서 → (timestamp, id)"""
+    try:
+        timestamp, log_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").rsplit("|", 1)
+        return timestamp, int(log_id)
+    except (ValueError, UnicodeError):
+        raise ValueError("잘못된 커서입니다")
+
+
+def _partition_count(conn: sqlite3.Connection, name: str, level_filter: Optional[str]) -> int:
+    """파티션의 (등급별) 누적 건수"""
+    if level_filter:
+        row = conn.execute(
+            "SELECT count FROM log_partition_counts WHERE partition_name = ? AND security_level = ?",
+            (name, level_filter),
+        ).fetchone()
+        return row[0] if row else 0
+    return conn.execute(
+        "SELECT COALESCE(SUM(count), 0) FROM log_partition_counts WHERE partition_name = ?", (name,)
+    ).fetchone()[0]
+
+
+def _count_logs(conn: sqlite3.Connection, level_filter: Optional[str], count_mode: str) -> Optional[int]:
+    """
+    전체 건수 조회
+
+    - cached: 파티션·등급별 누적 카운터 (기본, 테이블 크기와 무관)
+    - exact: 파티션별 COUNT(*) 전체 스캔 합산
+    - none: 생략
+    """
+    if count_mode == "none":
+        return None
+    if count_mode == "exact":
+        total = 0
+        for p in _load_partitions(conn):
+            if level_filter:
+                total += conn.execute(
+                    f"SELECT COUNT(*) FROM validation_logs_{p['name']} WHERE security_level = ?", (level_filter,)
+                ).fetchone()[0]
+            else:
+                total += conn.execute(f"SELECT COUNT(*) FROM validation_logs_{p['name']}").fetchone()[0]
+        return total
+    if level_filter:
+        return conn.execute(
+            "SELECT COALESCE(SUM(count), 0) FROM log_partition_counts WHERE security_level = ?", (level_filter,)
+        ).fetchone()[0]
+    return conn.execute("SELECT COALESCE(SUM(count), 0) FROM log_partition_counts").fetchone()[0]
+
+
+def _find_log(conn: sqlite3.Connection, log_id: int, columns: str = "*") -> Optional[sqlite3.Row]:
+    """ID 범위가 해당하는 파티션에서만 로그 조회"""
+    for p in conn.execute(
+        "SELECT name FROM log_partitions WHERE min_id <= ? AND max_id >= ? ORDER BY start_date DESC",
+        (log_id, log_id),
+    ).fetchall():
+        row = conn.execute(
+            f"SELECT {columns}, ? AS partition_name FROM validation_logs_{p['name']} WHERE id = ?",
+            (p["name"], log_id),
+        ).fetchone()
         if row:
-            total = row["total_requests"] + 1
-            new_avg = (row["avg_risk_score"] * row["total_requests"] + risk) / total
-            conn.execute("""
-                UPDATE daily_stats SET
-                    total_requests = ?,
-                    safe_count = safe_count + ?,
-                    warning_count = warning_count + ?,
-                    danger_count = danger_count + ?,
-                    blocked_count = blocked_count + ?,
-                    avg_risk_score = ?
-                WHERE date = ?
-            """, (
-                total,
-                1 if level == "안전" else 0,
-                1 if level == "경고" else 0,
-                1 if level == "위험" else 0,
-                1 if level == "차단" else 0,
-                round(new_avg, 1),
-                today,
-            ))
-        else:
-            conn.execute("""
-                INSERT INTO daily_stats (date, total_requests, safe_count, warning_count, danger_count, blocked_count, avg_risk_score)
-                VALUES (?, 1, ?, ?, ?, ?, ?)
-            """, (
-                today,
-                1 if level == "안전" else 0,
-                1 if level == "경고" else 0,
-                1 if level == "위험" else 0,
-                1 if level == "차단" else 0,
-                float(risk),
-            ))
-
-
-def get_recent_logs(limit: int = 50, offset: int = 0, level_filter: str = None) -> Dict:
-    """최근 검증 이력 조회"""
-    with get_db() as conn:
-        where = ""
+            return row
+    return None
+
+
+def get_recent_logs(
+    limit: int = 50,
+    offset: int = 0,
+    level_filter: str = None,
+    cursor: str = None,
+    before_id: int = None,
+    count_mode: str = "cached",
+) -> Dict:
+    """
+    최근 검증 이력 조회
+
+    cursor(이전 응답의 next_cursor) 또는 before_id를 주면 해당 위치 이후를
+    (timestamp, id) 키셋으로 조회 (offset 무시, 깊은 페이지도 일정한 비용).
+    둘 다 없으면 기존 offset 방식.
+
+    파티션은 기간이 겹치지 않으므로 최신 파티션부터 차례로 조회하고,
+    커서 시각 이후 파티션과 limit을 채운 뒤의 파티션은 조회하지 않음.
+    """
+    if count_mode not in ("cached", "exact", "none"):
+        raise ValueError(f"지원하지 않는 count 방식: {count_mode}")
+    if level_filter == "all":
+        level_filter = None
+
+    with get_read_db() as conn:
+        conditions: List[str] = []
         params: list = []
-        if level_filter and level_filter != "all":
-            where = "WHERE security_level = ?"
+        if level_filter:
+            conditions.append("security_level = ?")
             params.append(level_filter)
 
-        total = conn.execute(f"SELECT COUNT(*) as cnt FROM validation_logs {where}", params).fetchone()["cnt"]
+        position = None
+        if cursor:
+            position = _decode_cursor(cursor)
+        elif before_id is not None:
+            row = _find_log(conn, before_id, "timestamp")
+            position = (row["timestamp"], before_id) if row else None
+            if position is None:
+                raise ValueError("before_id에 해당하는 로그가 없습니다")
 
-        rows = conn.execute(f"""
-            SELECT id, timestamp, input_type, prompt_hash, prompt_length,
-                   security_level, risk_score, is_safe, violation_count,
-                   violation_types, client_ip, response_time_ms
-            FROM validation_logs {where}
-            ORDER BY timestamp DESC
-            LIMIT ? OFFSET ?
-        """, params + [limit, offset]).fetchall()
+        if position is not None:
+            conditions.append("(timestamp, id) < (?, ?)")
+            params.extend(position)
+            offset = 0
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows: list = []
+        skip = offset
+        for p in _load_partitions(conn, until=position[0] if position else None):
+            if skip:
+                # 건너뛸 행 수가 파티션 전체보다 많으면 누적 카운터로 파티션째 생략
+                count = _partition_count(conn, p["name"], level_filter)
+                if count <= skip:
+                    skip -= count
+                    continue
+            rows.extend(conn.execute(f"""
+                SELECT id, timestamp, input_type, prompt_hash, prompt_length,
+                       security_level, risk_score, is_safe, violation_count,
+                       violation_types, client_ip, response_time_ms
+                FROM validation_logs_{p["name"]} {where}
+                ORDER BY timestamp DESC, id DESC
+                LIMIT ? OFFSET ?
+            """, params + [limit + 1 - len(rows), skip]).fetchall())
+            skip = 0
+            if len(rows) > limit:
+                break
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1]["timestamp"], rows[-1]["id"]) if has_more else None
 
         return {
-            "total": total,
+            "total": _count_logs(conn, level_filter, count_mode),
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
             "logs": [dict(r) for r in rows],
         }
 
 
 def get_log_detail(log_id: int) -> Optional[Dict]:
     """검증 이력 상세 조회"""
-    with get_db() as conn:
-        row = conn.execute("SELECT * FROM validation_logs WHERE id = ?", (log_id,)).fetchone()
+    with get_read_db() as conn:
+        row = _find_log(conn, log_id)
         if row:
             d = dict(row)
-            # JSON 파싱
-            for field in ("violation_types", "violation_details", "regulation_refs"):
-                if d.get(field):
-                    try:
-                        d[field] = json.loads(d[field])
-                    except (json.JSONDecodeError, TypeError):
-                        pass
+            name = d.pop("partition_name")
+            # 위반사항은 같은 파티션의 log_violations 행으로 구성
+            details = [
+                dict(v) for v in conn.execute(f"""
+                    SELECT type, rule_name, description, severity
+                    FROM log_violations_{name} WHERE log_id = ? ORDER BY id
+                """, (log_id,))
+            ]
+            d["violation_details"] = details
+            d["violation_types"] = list(dict.fromkeys(v["type"] for v in details))
+            if d.get("violation_rule_counts"):
+                # 위반사항을 표본만 기록한 로그 - 전체 건수는 유형·규칙별 집계로 제공
+                d["violation_rule_counts"] = json.loads(d["violation_rule_counts"])
+                d["violation_types"] = list(dict.fromkeys(c["type"] for c in d["violation_rule_counts"]))
+            if d.get("regulation_refs"):
+                try:
+                    d["regulation_refs"] = json.loads(d["regulation_refs"])
+                except (json.JSONDecodeError, TypeError):
+                    pass
             return d
         return None
 
 
+def get_violation_hits(
+    violation_type: str = None,
+    rule_name: str = None,
+    days: int = 7,
+    limit: int = 100,
+) -> List[Dict]:
+    """유형/규칙별 위반 탐지 이력 (예: 최근 7일 '주민등록번호' 탐지 건)"""
+    since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    conditions = ["v.timestamp >= ?"]
+    params: list = [since]
+    if violation_type:
+        conditions.append("v.type = ?")
+        params.append(violation_type)
+    if rule_name:
+        conditions.append("v.rule_name = ?")
+        params.append(rule_name)
+
+    with get_read_db() as conn:
+        rows: list = []
+        for p in _load_partitions(conn, since=since):
+            rows.extend(conn.execute(f"""
+                SELECT v.log_id, v.timestamp, v.type, v.rule_name, v.severity,
+                       l.input_type, l.security_level, l.risk_score, l.client_ip
+                FROM log_violations_{p["name"]} v
+                JOIN validation_logs_{p["name"]} l ON l.id = v.log_id
+                WHERE {' AND '.join(conditions)}
+                ORDER BY v.timestamp DESC, v.id DESC
+                LIMIT ?
+            """, params + [limit - len(rows)]).fetchall())
+            if len(rows) >= limit:
+                break
+        return [dict(r) for r in rows]
+
+
+def get_top_rules(days: int = 7, limit: int = 10, violation_type: str = None) -> List[Dict]:
+    """탐지 건수 상위 규칙"""
+    since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    where = "WHERE timestamp >= ?"
+    params: list = [since]
+    if violation_type:
+        where += " AND type = ?"
+        params.append(violation_type)
+
+    with get_read_db() as conn:
+        partitions = _load_partitions(conn, since=since)
+        if not partitions:
+            return []
+        # 기간이 겹치는 파티션만 합쳐 집계 (로그 ID는 파티션 간 고유하므로 DISTINCT 유지)
+        union = " UNION ALL ".join(
+            f"SELECT log_id, type, rule_name FROM log_violations_{p['name']} {where}" for p in partitions
+        )
+        rows = conn.execute(f"""
+            SELECT rule_name, type, COUNT(*) as hits, COUNT(DISTINCT log_id) as log_count
+            FROM ({union})
+            GROUP BY rule_name, type
+            ORDER BY hits DESC
+            LIMIT ?
+        """, params * len(partitions) + [limit]).fetchall()
+        return [dict(r) for r in rows]
+
+
+def _histogram_percentile(buckets: Dict[int, int], total: int, q: float) -> Optional[int]:
+    """응답시간 히스토그램에서 분위수 추정 (해당 구간 상한값, 최종 구간은 마지막 상한 초과)"""
+    if not total:
+        return None
+    threshold = q * total
+    seen = 0
+    for bucket in sorted(buckets):
+        seen += buckets[bucket]
+        if seen >= threshold:
+            return RESPONSE_TIME_BUCKETS_MS[min(bucket, len(RESPONSE_TIME_BUCKETS_MS) - 1)]
+    return RESPONSE_TIME_BUCKETS_MS[-1]
+
+
 def get_dashboard_stats(days: int = 30) -> Dict:
-    """대시보드 통계"""
+    """대시보드 통계 (사전 집계 테이블만 조회 - 로그 건수와 무관한 비용)"""
     since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
 
-    with get_db() as conn:
+    with get_read_db() as conn:
         # 전체 요약
-        summary = conn.execute("""
+        row = conn.execute("""
             SELECT
-                COUNT(*) as total_requests,
-                SUM(CASE WHEN security_level = '안전' THEN 1 ELSE 0 END) as safe_count,
-                SUM(CASE WHEN security_level = '경고' THEN 1 ELSE 0 END) as warning_count,
-                SUM(CASE WHEN security_level = '위험' THEN 1 ELSE 0 END) as danger_count,
-                SUM(CASE WHEN security_level = '차단' THEN 1 ELSE 0 END) as blocked_count,
-                ROUND(AVG(risk_score), 1) as avg_risk_score,
-                MAX(risk_score) as max_risk_score,
-                ROUND(AVG(response_time_ms), 0) as avg_response_ms
-            FROM validation_logs
-            WHERE timestamp >= ?
+                COALESCE(SUM(total), 0) as total_requests,
+                SUM(safe_count) as safe_count,
+                SUM(warning_count) as warning_count,
+                SUM(danger_count) as danger_count,
+                SUM(blocked_count) as blocked_count,
+                SUM(risk_sum) as risk_sum,
+                MAX(risk_max) as max_risk_score,
+                SUM(response_sum) as response_sum,
+                SUM(response_count) as response_count
+            FROM rollup_stats
+            WHERE granularity = 'day' AND period >= ?
         """, (since,)).fetchone()
+        summary = {
+            "total_requests": row["total_requests"],
+            "safe_count": row["safe_count"],
+            "warning_count": row["warning_count"],
+            "danger_count": row["danger_count"],
+            "blocked_count": row["blocked_count"],
+            "avg_risk_score": round(row["risk_sum"] / row["total_requests"], 1) if row["total_requests"] else None,
+            "max_risk_score": row["max_risk_score"],
+            "avg_response_ms": round(row["response_sum"] / row["response_count"], 0) if row["response_count"] else None,
+        }
 
         # 일별 추이
         daily = conn.execute("""
@@ -248,12 +1250,12 @@ def get_dashboard_stats(days: int = 30) -> Dict:
             ORDER BY date ASC
         """, (since,)).fetchall()
 
-        # 위반유형 Top 5
+        # 위반유형 Top 10 (유형별 정규화 집계)
         top_violations = conn.execute("""
-            SELECT violation_types, COUNT(*) as cnt
-            FROM validation_logs
-            WHERE timestamp >= ? AND violation_count > 0
-            GROUP BY violation_types
+            SELECT violation_type, SUM(count) as cnt
+            FROM rollup_violations
+            WHERE granularity = 'day' AND period >= ?
+            GROUP BY violation_type
             ORDER BY cnt DESC
             LIMIT 10
         """, (since,)).fetchall()
@@ -261,29 +1263,474 @@ def get_dashboard_stats(days: int = 30) -> Dict:
         # 시간대별 분포
         hourly = conn.execute("""
             SELECT
-                CAST(strftime('%H', timestamp) AS INTEGER) as hour,
-                COUNT(*) as cnt
-            FROM validation_logs
-            WHERE timestamp >= ?
+                CAST(substr(period, 12, 2) AS INTEGER) as hour,
+                SUM(total) as cnt
+            FROM rollup_stats
+            WHERE granularity = 'hour' AND period >= ?
             GROUP BY hour
             ORDER BY hour
         """, (since,)).fetchall()
 
+        # 위험점수 / 응답시간 히스토그램
+        histograms: Dict[str, Dict[int, int]] = {"risk": {}, "response_ms": {}}
+        for r in conn.execute("""
+            SELECT metric, bucket, SUM(count) as cnt
+            FROM rollup_histograms
+            WHERE granularity = 'day' AND period >= ?
+            GROUP BY metric, bucket
+        """, (since,)):
+            histograms.setdefault(r["metric"], {})[r["bucket"]] = r["cnt"]
+
+        response_total = row["response_count"] or 0
+        response = histograms["response_ms"]
+
         return {
             "period_days": days,
-            "summary": dict(summary) if summary else {},
+            "summary": summary,
             "daily_trend": [dict(r) for r in daily],
             "top_violations": [dict(r) for r in top_violations],
             "hourly_distribution": [dict(r) for r in hourly],
+            "risk_histogram": [
+                {"min_score": bucket * RISK_BUCKET_WIDTH, "cnt": cnt}
+                for bucket, cnt in sorted(histograms["risk"].items())
+            ],
+            "response_time_percentiles": {
+                "p50": _histogram_percentile(response, response_total, 0.50),
+                "p90": _histogram_percentile(response, response_total, 0.90),
+                "p99": _histogram_percentile(response, response_total, 0.99),
+            },
         }
 
 
-def cleanup_old_logs():
-    """보관기간 초과 로그 삭제"""
-    cutoff = (datetime.now() - timedelta(days=LOG_RETENTION_DAYS)).strftime("%Y-%m-%d %H:%M:%S")
+# 내보내기 컬럼 (violation_details는 log_violations 행으로 대체되어 제외)
+EXPORT_COLUMNS = (
+    "id", "timestamp", "session_id", "input_type", "prompt_hash", "prompt_length",
+    "security_level", "risk_score", "is_safe", "violation_count", "violation_types",
+    "regulation_refs", "client_ip", "user_agent", "response_time_ms", "violation_rule_counts",
+)
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+EXPORT_CHUNK_SIZE = int(os.getenv("AUDIT_EXPORT_CHUNK_SIZE", "5000"))
+
+_EXPORT_INT_COLUMNS = {"id", "prompt_length", "risk_score", "is_safe", "violation_count", "response_time_ms"}
+_EXPORT_JSON_COLUMNS = ("violation_types", "regulation_refs", "violation_rule_counts")
+
+
+def _parse_export_time(value: Optional[str], name: str) -> Optional[str]:
+    """'YYYY-MM-DD' 또는 'YYYY-MM-DD HH:MM:SS' 검증 후 저장 형식으로 변환"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        raise ValueError(f"잘못된 {name} 형식입니다 (YYYY-MM-DD 또는 YYYY-MM-DD HH:MM:SS)")
+
+
+def iter_export_chunks(
+    since: str = None,
+    until: str = None,
+    level_filter: str = None,
+    position: tuple = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+):
+    """
+    검증 이력을 오래된 순으로 chunk_size 건씩 반환 (since 이상, until 미만)
+
+    청크마다 짧은 읽기 트랜잭션으로 (timestamp, id) 키셋 조회 - 장시간 연결·스냅샷을 붙잡지 않으며
+    메모리는 청크 크기로 일정. position((timestamp, id)) 이후부터 재개.
+
+    Yields:
+        행 목록
+    """
+    columns = ", ".join(EXPORT_COLUMNS)
+    while True:
+        rows: list = []
+        with get_read_db() as conn:
+            conditions: List[str] = []
+            params: list = []
+            if since:
+                conditions.append("timestamp >= ?")
+                params.append(since)
+            if until:
+                conditions.append("timestamp < ?")
+                params.append(until)
+            if level_filter:
+                conditions.append("security_level = ?")
+                params.append(level_filter)
+            if position is not None:
+                conditions.append("(timestamp, id) > (?, ?)")
+                params.extend(position)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+            start = max(since or "", position[0] if position else "") or None
+            for p in reversed(_load_partitions(conn, since=start, until=until)):
+                rows.extend(conn.execute(f"""
+                    SELECT {columns} FROM validation_logs_{p["name"]} {where}
+                    ORDER BY timestamp, id
+                    LIMIT ?
+                """, params + [chunk_size - len(rows)]).fetchall())
+                if len(rows) >= chunk_size:
+                    break
+        if not rows:
+            return
+        position = (rows[-1]["timestamp"], rows[-1]["id"])
+        yield rows
+        if len(rows) < chunk_size:
+            return
+
+
+class _ByteSink(io.RawIOBase):
+    """pyarrow 기록 결과를 모아 두었다가 꺼내 가는 쓰기 전용 파일 객체"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _export_csv(chunks, header: bool):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        # Excel에서 한글이 깨지지 않도록 BOM 포함 (이어받기 시에는 생략)
+        buffer.write("\ufeff")
+        writer.writerow(EXPORT_COLUMNS)
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _export_jsonl(chunks):
+    for rows in chunks:
+        lines = []
+        for row in rows:
+            d = dict(row)
+            for key in _EXPORT_JSON_COLUMNS:
+                if d[key]:
+                    try:
+                        d[key] = json.loads(d[key])
+                    except (json.JSONDecodeError, TypeError):
+                        pass
+            lines.append(json.dumps(d, ensure_ascii=False))
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _export_parquet(chunks, pa, pq):
+    """청크 1개 = Parquet row group 1개로 순차 기록"""
+    schema = pa.schema([
+        (name, pa.int64() if name in _EXPORT_INT_COLUMNS else pa.string()) for name in EXPORT_COLUMNS
+    ])
+    sink = _ByteSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for rows in chunks:
+            writer.write_table(pa.Table.from_pylist([dict(r) for r in rows], schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    yield sink.drain()
+
+
+def _gzip_stream(parts):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits 31: gzip 헤더
+    for part in parts:
+        data = compressor.compress(part)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_logs(
+    fmt: str = "csv",
+    since: str = None,
+    until: str = None,
+    level_filter: str = None,
+    after_id: int = None,
+    compress: bool = False,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+):
+    """
+    검증 이력 대량 내보내기 (바이트 청크 반복자)
+
+    Args:
+        fmt: csv | jsonl | parquet (parquet은 pyarrow 필요, 자체 zstd 압축)
+        since / until: 기간 (since 이상, until 미만)
+        after_id: 해당 로그 다음 행부터 재개 (중단된 내보내기는 마지막으로 받은 행의 id로 이어받기)
+        compress: gzip 압축 (csv/jsonl)
+
+    인자 오류는 반복 시작 전에 ValueError로 즉시 발생 (응답 시작 전 400 처리 가능)
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 내보내기 형식: {fmt}")
+    if fmt == "parquet" and compress:
+        raise ValueError("parquet 형식은 자체 압축을 사용하므로 gzip을 지정할 수 없습니다")
+    if level_filter == "all":
+        level_filter = None
+    since = _parse_export_time(since, "since")
+    until = _parse_export_time(until, "until")
+
+    position = None
+    if after_id is not None:
+        with get_read_db() as conn:
+            row = _find_log(conn, after_id, "timestamp")
+        if row is None:
+            raise ValueError("after_id에 해당하는 로그가 없습니다")
+        position = (row["timestamp"], after_id)
+
+    chunks = iter_export_chunks(since, until, level_filter, position, chunk_size)
+    if fmt == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("parquet 내보내기에는 pyarrow 설치가 필요합니다")
+        return _export_parquet(chunks, pa, pq)
+    parts = _export_csv(chunks, header=position is None) if fmt == "csv" else _export_jsonl(chunks)
+    return _gzip_stream(parts) if compress else parts
+
+
+def _retention_cutoff() -> str:
+    return (datetime.now() - timedelta(days=LOG_RETENTION_DAYS)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _drop_expired_partition(cutoff: str) -> Optional[int]:
+    """
+    기간 전체가 보관기간을 지난 가장 오래된 파티션 삭제 (DROP TABLE - 행 단위 삭제 없음)
+
+    Returns:
+        삭제된 로그 건수, 더 이상 만료 파티션이 없으면 None
+    """
+    with get_db() as conn:
+        oldest = conn.execute(
+            "SELECT name, end_date FROM log_partitions ORDER BY start_date LIMIT 1"
+        ).fetchone()
+        if oldest is None or oldest["end_date"] > cutoff[:10]:
+            return None
+        count = _partition_count(conn, oldest["name"], None)
+        _drop_partition(conn, oldest["name"])
+        return count
+
+
+def _delete_expired_rows(cutoff: str, batch: int) -> int:
+    """
+    보관기간 경계가 걸친 가장 오래된 파티션에서 만료 로그를 행 단위로 삭제 (batch 건씩)
+
+    기간 전체가 만료된 파티션은 _drop_expired_partition으로 먼저 DROP한 뒤 호출
+
+    Returns:
+        삭제된 로그 건수, 더 이상 만료 로그가 없으면 0
+    """
+    with get_db() as conn:
+        oldest = conn.execute(
+            "SELECT name, start_date FROM log_partitions ORDER BY start_date LIMIT 1"
+        ).fetchone()
+        if oldest is None or oldest["start_date"] >= cutoff:
+            return 0
+        name = oldest["name"]
+        expired = f"""
+            SELECT id FROM validation_logs_{name} WHERE timestamp < ? ORDER BY timestamp LIMIT ?
+        """
+        levels = conn.execute(f"""
+            SELECT security_level, COUNT(*) FROM validation_logs_{name}
+            WHERE id IN ({expired}) GROUP BY security_level
+        """, (cutoff, batch)).fetchall()
+        if not levels:
+            return 0
+        conn.execute(f"DELETE FROM log_violations_{name} WHERE log_id IN ({expired})", (cutoff, batch))
+        deleted = conn.execute(
+            f"DELETE FROM validation_logs_{name} WHERE id IN ({expired})", (cutoff, batch)
+        ).rowcount
+        conn.executemany(
+            "UPDATE log_partition_counts SET count = count - ? WHERE partition_name = ? AND security_level = ?",
+            [(count, name, level) for level, count in levels],
+        )
+        conn.execute(f"""
+            UPDATE log_partitions SET
+                min_id = (SELECT MIN(id) FROM validation_logs_{name}),
+                max_id = (SELECT MAX(id) FROM validation_logs_{name})
+            WHERE name = ?
+        """, (name,))
+        return deleted
+
+
+def _delete_expired_aggregates(cutoff: str):
+    """보관기간 초과 일별 통계·대시보드 집계 삭제"""
     with get_db() as conn:
-        deleted = conn.execute("DELETE FROM validation_logs WHERE timestamp < ?", (cutoff,)).rowcount
         conn.execute("DELETE FROM daily_stats WHERE date < ?", (cutoff[:10],))
-    if deleted:
-        print(f"🗑️ Cleaned up {deleted} logs older than {LOG_RETENTION_DAYS} days")
-    return deleted
+        conn.execute("DELETE FROM rollup_stats WHERE period < ?", (cutoff[:10],))
+        conn.execute("DELETE FROM rollup_violations WHERE period < ?", (cutoff[:10],))
+        conn.execute("DELETE FROM rollup_histograms WHERE period < ?", (cutoff[:10],))
+
+
+def _reclaim_space() -> int:
+    """빈 페이지 반환(auto_vacuum=INCREMENTAL인 경우) 및 WAL 체크포인트. 반환한 페이지 수"""
+    with get_db() as conn:
+        before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if before and conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            # execute()는 1페이지씩만 진행하므로 sqlite3_exec 경로로 끝까지 실행
+            conn.executescript("PRAGMA incremental_vacuum;")
+        reclaimed = before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+    with get_db() as conn:
+        conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+    return reclaimed
+
+
+class RetentionWorker:
+    """
+    백그라운드 보관기간 정리기
+
+    - interval 초마다 기간 전체가 보관기간을 지난 파티션을 오래된 순으로 DROP
+    - 보관기간 경계가 걸친 파티션은 만료 로그만 batch 건씩 행 단위 삭제
+    - 파티션·배치마다 트랜잭션을 끝내고 pause 초 양보 (기록기·조회를 장시간 막지 않음)
+    - 정리 후 빈 페이지 반환 및 WAL 체크포인트
+    """
+
+    def __init__(self, interval: float = 3600, pause: float = 0.05, batch: int = 5000):
+        self.interval = interval
+        self.pause = pause
+        self.batch = batch
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.runs = 0
+        self.dropped_partitions = 0
+        self.trimmed_rows = 0
+        self.deleted = 0
+        self.reclaimed_pages = 0
+        self.in_progress = False
+        self.last_run_at: Optional[str] = None
+        self.last_run_deleted = 0
+        self.last_run_ms = 0.0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-log-retention", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        # 기동 직후 1회 실행 후 주기 실행 (기동 자체는 기다리지 않음)
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                self.errors += 1
+                self.last_error = str(e)
+                print(f"⚠️ Audit log retention failed: {e}")
+            self._stop.wait(self.interval)
+
+    def run_once(self) -> int:
+        """1회 정리 (중지 요청 시 파티션·배치 경계에서 중단). 삭제 건수 반환"""
+        start = time.perf_counter()
+        cutoff = _retention_cutoff()
+        deleted = 0
+        self.in_progress = True
+        try:
+            while not self._stop.is_set():
+                count = _drop_expired_partition(cutoff)
+                if count is None:
+                    break
+                deleted += count
+                self.deleted += count
+                self.dropped_partitions += 1
+                self._stop.wait(self.pause)
+            while not self._stop.is_set():
+                count = _delete_expired_rows(cutoff, self.batch)
+                if not count:
+                    break
+                deleted += count
+                self.deleted += count
+                self.trimmed_rows += count
+                self._stop.wait(self.pause)
+            _delete_expired_aggregates(cutoff)
+            if deleted:
+                self.reclaimed_pages += _reclaim_space()
+                print(f"🗑️ Cleaned up {deleted} logs older than {LOG_RETENTION_DAYS} days")
+        finally:
+            self.in_progress = False
+            self.runs += 1
+            self.last_run_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            self.last_run_deleted = deleted
+            self.last_run_ms = round((time.perf_counter() - start) * 1000, 2)
+        return deleted
+
+    def stop(self, timeout: float = 10.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "in_progress": self.in_progress,
+            "retention_days": LOG_RETENTION_DAYS,
+            "partition_unit": LOG_PARTITION_UNIT,
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "dropped_partitions": self.dropped_partitions,
+            "trimmed_rows": self.trimmed_rows,
+            "deleted": self.deleted,
+            "reclaimed_pages": self.reclaimed_pages,
+            "last_run_at": self.last_run_at,
+            "last_run_deleted": self.last_run_deleted,
+            "last_run_ms": self.last_run_ms,
+            "errors": self.errors,
+            "last_error": self.last_error,
+        }
+
+
+_retention: Optional[RetentionWorker] = None
+
+
+def start_retention() -> RetentionWorker:
+    """백그라운드 보관기간 정리 시작"""
+    global _retention
+    if _retention is None:
+        _retention = RetentionWorker(
+            interval=LOG_RETENTION_INTERVAL,
+            pause=LOG_RETENTION_PAUSE,
+            batch=LOG_RETENTION_BATCH,
+        )
+    _retention.start()
+    return _retention
+
+
+def stop_retention():
+    """진행 중인 파티션·배치 삭제까지만 처리하고 정리 중지"""
+    if _retention is not None:
+        _retention.stop()
+
+
+def retention_stats() -> Optional[Dict[str, Any]]:
+    """보관기간 정리 진행 상태"""
+    return _retention.stats() if _retention is not None else None
+
+
+def cleanup_old_logs():
+    """보관기간 초과 로그 삭제 (대기 없이 끝까지 수행 - CLI·수동 실행용)"""
+    return RetentionWorker(pause=0).run_once()
@@ -0,0 +1,372 @@
+"""
+다중 페이지 문서(PDF·TIFF 팩스) 페이지 단위 OCR + 보안 검증
+
+- 페이지 읽기: 문서 전체를 한 번에 디코딩하지 않고 필요한 페이지만 차례로 디코딩(TIFF)·렌더링(PDF)
+    - TIFF: 프레임 단위 seek, 팩스 표준 해상도(204×98dpi 등) 비정방형 픽셀은 세로로 늘려 보정
+    - PDF: pypdfium2로 페이지별 렌더링 (선택 의존성, 없으면 DocumentUnsupported)
+    - 페이지 픽셀 수 상한(max_page_pixels): PDF는 렌더링 배율을 낮춰 맞추고(MIN_PDF_DPI 미만이면 거절),
+      TIFF는 프레임 디코딩 전에 크기 확인 (PIL 압축 폭탄 검사는 첫 프레임에만 적용되므로)
+- OCR: 최대 max_inflight 페이지를 동시에 OCR (OCR 워커 풀 또는 스레드 풀 - submit 함수로 주입)
+- 검증: 페이지 OCR이 끝나는 대로 해당 페이지만 검증 (위반 위치는 페이지 텍스트 기준)
+- 조기 종료: 누적 등급이 stop_level(기본 차단)에 도달하면 남은 페이지는 읽지 않고 대기 중인 OCR 취소
+
+사용법:
+    with DocumentReader.from_env(data) as reader:
+        result = analyze_document(reader, lambda page: pool.submit(page.data), validator)
+"""
+
+import io
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from PIL import Image
+
+from prompt_security_validator import KEPCOPromptSecurityValidator, SecurityLevel, ValidationResult
+from validation_pool import violation_to_dict
+
+
+# 문서 전체 텍스트에서 페이지 사이 구분자
+PAGE_SEPARATOR = "\n\n"
+
+# 등급 순서 (조기 종료 판정)
+_LEVEL_RANK = {
+    SecurityLevel.SAFE: 0,
+    SecurityLevel.WARNING: 1,
+    SecurityLevel.DANGER: 2,
+    SecurityLevel.BLOCKED: 3,
+}
+
+_TIFF_MAGIC = (b"II*\x00", b"MM\x00*")
+
+# 페이지 픽셀 상한에 맞추느라 PDF 렌더링 해상도가 이보다 낮아지면 판독 불가로 보고 거절
+MIN_PDF_DPI = 72
+
+
+class DocumentError(ValueError):
+    """문서를 읽을 수 없음 (손상된 파일 등)"""
+
+
+class DocumentUnsupported(DocumentError):
+    """지원하지 않는 문서 형식 (PDF 처리 라이브러리 미설치 등)"""
+
+
+class DocumentTooLarge(DocumentError):
+    """페이지 크기가 픽셀 상한 초과"""
+
+
+def detect_document_type(data: bytes) -> Optional[str]:
+    """파일 시그니처 → 'pdf' / 'tiff' / None"""
+    head = bytes(data[:8])
+    if head.startswith(b"%PDF-"):
+        return "pdf"
+    if head[:4] in _TIFF_MAGIC:
+        return "tiff"
+    return None
+
+
+@dataclass
+class DocumentPage:
+    """OCR에 넘길 페이지 1장 (PNG 인코딩, DPI 정보 포함)"""
+    number: int                 # 1부터 시작
+    data: bytes
+    size: Tuple[int, int]       # 보정 후 크기
+
+
+@dataclass
+class PageResult:
+    """페이지별 OCR·검증 결과 (위반 위치는 페이지 텍스트 기준)"""
+    number: int
+    extracted_text: str = ""
+    ocr_confidence: float = 0.0
+    image_size: Tuple[int, int] = (0, 0)
+    validation_result: Optional[ValidationResult] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class DocumentAnalysisResult:
+    """문서 분석 결과"""
+    kind: str
+    page_count: int             # 문서 전체 페이지 수
+    pages: List[PageResult]     # 처리한 페이지 (페이지 순)
+    validation_result: ValidationResult  # 처리한 페이지 전체 기준 (위치는 extracted_text 기준)
+    extracted_text: str         # 처리한 페이지 텍스트를 PAGE_SEPARATOR로 연결
+    stopped_early: bool = False  # stop_level 도달로 남은 페이지 생략
+    truncated: bool = False      # max_pages 초과분 생략
+    failed_pages: List[int] = field(default_factory=list)
+
+
+class DocumentReader:
+    """PDF·다중 프레임 TIFF 페이지 단위 지연 읽기"""
+
+    def __init__(self, data: bytes, pdf_dpi: int = 300, max_pages: int = 200, max_page_pixels: int = 40_000_000):
+        self.kind = detect_document_type(data)
+        if self.kind is None:
+            raise DocumentUnsupported("PDF 또는 TIFF 문서가 아닙니다")
+        self.pdf_dpi = pdf_dpi
+        self.max_pages = max_pages
+        self.max_page_pixels = max_page_pixels
+        self._image: Optional[Image.Image] = None
+        self._pdf = None
+
+        try:
+            if self.kind == "tiff":
+                self._image = Image.open(io.BytesIO(data))
+                self.page_count = getattr(self._image, "n_frames", 1)
+            else:
+                self._pdf = _open_pdf(data)
+                self.page_count = len(self._pdf)
+        except DocumentError:
+            raise
+        except Exception as e:
+            raise DocumentError(f"문서를 열 수 없습니다: {e}")
+
+    @classmethod
+    def from_env(cls, data: bytes) -> "DocumentReader":
+        """
+        환경변수 기반 생성
+
+        - OCR_PDF_DPI: PDF 렌더링 해상도 (기본 300 - 전처리 목표 DPI와 같게 두면 재조정 없음)
+        - DOCUMENT_MAX_PAGES: 문서당 최대 처리 페이지 수 (기본 200, 초과분은 truncated로 표시)
+        - DOCUMENT_MAX_PAGE_PIXELS: 페이지당 최대 픽셀 수 (기본 4천만 - A2 300dpi 수준)
+        """
+        return cls(
+            data,
+            pdf_dpi=int(os.getenv("OCR_PDF_DPI", "300")),
+            max_pages=int(os.getenv("DOCUMENT_MAX_PAGES", "200")),
+            max_page_pixels=int(float(os.getenv("DOCUMENT_MAX_PAGE_PIXELS", "40000000"))),
+        )
+
+    @property
+    def truncated(self) -> bool:
+        return self.page_count > self.max_pages
+
+    def __iter__(self) -> Iterator[DocumentPage]:
+        """페이지를 순서대로 1장씩 디코딩·렌더링 (소비한 만큼만 처리)"""
+        for index in range(min(self.page_count, self.max_pages)):
+            try:
+                if self.kind == "tiff":
+                    self._image.seek(index)
+                    page = _normalize_frame(self._image, self.max_page_pixels, index + 1)
+                else:
+                    page = self._render_pdf_page(index)
+            except DocumentError:
+                raise
+            except Exception as e:
+                raise DocumentError(f"{index + 1}페이지를 읽을 수 없습니다: {e}")
+            yield _encode_page(index + 1, page)
+
+    def _render_pdf_page(self, index: int) -> Image.Image:
+        pdf_page = self._pdf[index]
+        try:
+            # 렌더링 전에 페이지 크기(pt)로 픽셀 수를 계산해 상한을 넘지 않는 배율로 제한
+            width, height = pdf_page.get_size()
+            dpi = float(self.pdf_dpi)
+            area = width * height / (72 * 72)
+            if area <= 0:
+                raise DocumentError(f"{index + 1}페이지 크기가 올바르지 않습니다")
+            if area * dpi * dpi > self.max_page_pixels:
+                dpi = (self.max_page_pixels / area) ** 0.5
+                if dpi < MIN_PDF_DPI:
+                    raise DocumentTooLarge(
+                        f"{index + 1}페이지가 너무 큽니다 ({width / 72:.0f}×{height / 72:.0f}인치)"
+                    )
+            bitmap = pdf_page.render(scale=dpi / 72)
+            image = bitmap.to_pil()
+        finally:
+            pdf_page.close()
+        image.info["dpi"] = (dpi, dpi)
+        return image
+
+    def close(self):
+        if self._image is not None:
+            self._image.close()
+            self._image = None
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+    def __enter__(self) -> "DocumentReader":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _open_pdf(data: bytes):
+    try:
+        import pypdfium2
+    except ImportError:
+        raise DocumentUnsupported("PDF 검증에는 pypdfium2가 필요합니다 (pip install pypdfium2)")
+    return pypdfium2.PdfDocument(bytes(data))
+
+
+def _normalize_frame(frame: Image.Image, max_pixels: int, number: int) -> Image.Image:
+    """현재 TIFF 프레임 → 정방형 픽셀 이미지 (팩스 표준 해상도 204×98dpi 등은 세로로 늘림)"""
+    dpi = frame.info.get("dpi")
+    if not (isinstance(dpi, tuple) and len(dpi) == 2 and dpi[0] and dpi[1]):
+        dpi = None
+    width, height = frame.size
+    target_height = height
+    if dpi is not None:
+        x_dpi, y_dpi = float(dpi[0]), float(dpi[1])
+        if abs(x_dpi - y_dpi) / max(x_dpi, y_dpi) > 0.1:
+            target_height = round(height * x_dpi / y_dpi)
+    # seek()은 헤더만 읽으므로 디코딩(copy) 전에 원본·보정 후 크기 모두 검사
+    if width * max(height, target_height) > max_pixels:
+        raise DocumentTooLarge(f"{number}페이지가 너무 큽니다 ({width}×{height}픽셀)")
+
+    image = frame.copy()
+    if target_height != height:
+        if image.mode == "1":
+            image = image.convert("L")
+        image = image.resize((width, target_height), Image.Resampling.BICUBIC)
+    if dpi is not None:
+        image.info["dpi"] = (x_dpi, x_dpi)
+    return image
+
+
+def _encode_page(number: int, image: Image.Image) -> DocumentPage:
+    """페이지 이미지 → PNG 바이트 (무손실, 같은 페이지는 같은 바이트 → OCR 캐시 적중)"""
+    buffer = io.BytesIO()
+    params = {"compress_level": 1}
+    if image.info.get("dpi"):
+        params["dpi"] = image.info["dpi"]
+    image.save(buffer, "PNG", **params)
+    return DocumentPage(number=number, data=buffer.getvalue(), size=image.size)
+
+
+def scan_pages(
+    pages: Iterable[DocumentPage],
+    submit: Callable[[DocumentPage], Future],
+    validator: KEPCOPromptSecurityValidator,
+    max_inflight: int = 4,
+    stop_level: Optional[SecurityLevel] = SecurityLevel.BLOCKED,
+) -> Iterator[PageResult]:
+    """
+    페이지 OCR(동시 max_inflight건) → 완료되는 대로 페이지 검증 결과 반환 (완료 순)
+
+    submit(page)는 recognize_bytes와 같은 (텍스트, 신뢰도, 줄 목록, 원본 크기)를 돌려주는 Future 반환.
+    누적 등급이 stop_level 이상이 되면 새 페이지를 읽지 않고 대기 중인 OCR을 취소한 뒤 종료
+    """
+    pages = iter(pages)
+    inflight = {}
+    exhausted = False
+    violations = []
+    try:
+        while True:
+            while not exhausted and len(inflight) < max(1, max_inflight):
+                page = next(pages, None)
+                if page is None:
+                    exhausted = True
+                    break
+                inflight[submit(page)] = page
+            if not inflight:
+                return
+
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: inflight[f].number):
+                result = _page_result(inflight.pop(future), future, validator)
+                if result.validation_result is not None:
+                    violations.extend(result.validation_result.violations)
+                yield result
+
+            if stop_level is not None and violations:
+                _, level = validator.assess(violations)
+                if _LEVEL_RANK[level] >= _LEVEL_RANK[stop_level]:
+                    return
+    finally:
+        # 조기 종료·오류 시 아직 시작하지 않은 OCR 취소 (실행 중인 작업은 결과만 버림)
+        for future in inflight:
+            future.cancel()
+
+
+def _page_result(page: DocumentPage, future: Future, validator: KEPCOPromptSecurityValidator) -> PageResult:
+    try:
+        text, confidence, _, _ = future.result()
+    except Exception as e:
+        return PageResult(number=page.number, image_size=page.size, error=f"OCR 실패: {e}")
+    return PageResult(
+        number=page.number,
+        extracted_text=text,
+        ocr_confidence=confidence,
+        image_size=page.size,
+        validation_result=validator.validate(text),
+    )
+
+
+def analyze_document(
+    reader: DocumentReader,
+    submit: Callable[[DocumentPage], Future],
+    validator: KEPCOPromptSecurityValidator,
+    max_inflight: int = 4,
+    stop_level: Optional[SecurityLevel] = SecurityLevel.BLOCKED,
+) -> DocumentAnalysisResult:
+    """문서 전체 분석 (scan_pages 결과를 페이지 순으로 모아 문서 단위 점수·등급 산출)"""
+    pages = sorted(scan_pages(reader, submit, validator, max_inflight, stop_level), key=lambda p: p.number)
+    validated = [p.validation_result for p in pages if p.validation_result is not None]
+    combined = validator.merge_results(validated, PAGE_SEPARATOR)
+    return DocumentAnalysisResult(
+        kind=reader.kind,
+        page_count=reader.page_count,
+        pages=pages,
+        validation_result=combined,
+        extracted_text=combined.original_prompt,
+        stopped_early=len(pages) < min(reader.page_count, reader.max_pages),
+        truncated=reader.truncated,
+        failed_pages=[p.number for p in pages if p.error is not None],
+    )
+
+
+def document_to_dict(result: DocumentAnalysisResult) -> Dict[str, Any]:
+    """DocumentAnalysisResult → API 응답용 dict (위반 위치는 page 필드의 페이지 텍스트 기준)"""
+    combined = result.validation_result
+    notes = []
+    if result.stopped_early:
+        notes.append(f"⛔ {len(result.pages)}/{result.page_count}페이지 검사 중 차단 등급에 도달해 남은 페이지 검사를 생략했습니다.")
+    if result.truncated:
+        notes.append(f"⚠️ 최대 처리 페이지 수를 넘어 {result.page_count}페이지 중 일부만 검사했습니다 (검사하지 않은 페이지가 있어 안전으로 판정하지 않음).")
+    if result.failed_pages:
+        notes.append(f"⚠️ OCR 실패 페이지: {', '.join(map(str, result.failed_pages))} (검증되지 않은 내용이 있어 안전으로 판정하지 않음)")
+
+    pages = []
+    violations = []
+    for page in result.pages:
+        page_violations = []
+        if page.validation_result is not None:
+            page_violations = [violation_to_dict(v) for v in page.validation_result.violations]
+            violations.extend(dict(v, page=page.number) for v in page_violations)
+        pages.append({
+            "page": page.number,
+            "extracted_text": page.extracted_text,
+            "ocr_confidence": round(page.ocr_confidence, 2),
+            "image_size": {"width": page.image_size[0], "height": page.image_size[1]},
+            "is_safe": page.validation_result.is_safe if page.validation_result else False,
+            "security_level": page.validation_result.security_level.value if page.validation_result else None,
+            "risk_score": page.validation_result.risk_score if page.validation_result else None,
+            "violations": page_violations,
+            "error": page.error,
+        })
+
+    return {
+        "is_safe": combined.is_safe and not result.failed_pages and not result.truncated,
+        "security_level": combined.security_level.value,
+        "risk_score": combined.risk_score,
+        "violations": violations,
+        "sanitized_prompt": combined.sanitized_prompt,
+        "original_prompt": combined.original_prompt,
+        "timestamp": combined.timestamp,
+        "recommendation": "\n".join(notes + [combined.recommendation]),
+        "extracted_text": result.extracted_text,
+        "document": {
+            "type": result.kind,
+            "page_count": result.page_count,
+            "pages_processed": len(result.pages),
+            "stopped_early": result.stopped_early,
+            "truncated": result.truncated,
+            "failed_pages": result.failed_pages,
+        },
+        "pages": pages,
+    }
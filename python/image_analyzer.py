@@ -1,12 +1,15 @@
 """
 이미지 OCR 분석 및 보안 검증 모듈
 이미지 내 텍스트를 추출하여 민감정보 탐지
+다중 페이지 문서(PDF·TIFF 팩스)는 페이지 단위로 OCR·검증 (document_pages)
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 from dataclasses import dataclass
-from PIL import Image
+from document_pages import DocumentAnalysisResult, DocumentReader, analyze_document
+from ocr_cache import OCRCache
 from ocr_engine import RapidOCR
 from prompt_security_validator import KEPCOPromptSecurityValidator, ValidationResult
 
@@ -25,10 +28,15 @@ class ImageAnalysisResult:
 class ImageSecurityAnalyzer:
     """이미지 보안 분석기"""
 
-    def __init__(self):
-        """초기화"""
+    def __init__(self, page_workers: int = 2):
+        """
+        초기화
+
+        Args:
+            page_workers: 다중 페이지 문서에서 동시에 OCR할 페이지 수
+        """
         # OCR 엔진 초기화 (RapidOCR)
-        self.ocr_engine = RapidOCR()
+        self.ocr_engine = RapidOCR(cache=OCRCache.from_env())
         if not self.ocr_engine.is_available():
             raise RuntimeError("RapidOCR를 사용할 수 없습니다. pip install rapidocr-onnxruntime")
 
@@ -36,13 +44,21 @@ class ImageSecurityAnalyzer:
         self.validator = KEPCOPromptSecurityValidator()
 
         # 지원 이미지 형식
-        self.supported_formats = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.gif'}
+        self.supported_formats = {'.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff', '.gif', '.pdf'}
+        # 페이지 단위로 처리하는 문서 형식
+        self.document_formats = {'.pdf', '.tif', '.tiff'}
+        self.page_workers = max(1, page_workers)
 
     def is_supported_format(self, file_path: str) -> bool:
         """지원되는 이미지 형식인지 확인"""
         ext = os.path.splitext(file_path)[1].lower()
         return ext in self.supported_formats
 
+    def is_document(self, file_path: str) -> bool:
+        """페이지 단위로 처리할 문서 형식인지 확인 (단일 프레임 TIFF도 1페이지 문서로 처리)"""
+        ext = os.path.splitext(file_path)[1].lower()
+        return ext in self.document_formats
+
     def extract_text_from_image(self, image_path: str) -> Tuple[str, float]:
         """
         이미지에서 텍스트 추출 (RapidOCR)
@@ -77,13 +93,11 @@ class ImageSecurityAnalyzer:
         if not self.is_supported_format(image_path):
             raise ValueError(f"지원되지 않는 이미지 형식입니다. 지원 형식: {self.supported_formats}")
 
-        # 이미지 정보
-        image = Image.open(image_path)
-        image_size = image.size
-        file_size = os.path.getsize(image_path)
-
-        # OCR 텍스트 추출
-        extracted_text, ocr_confidence = self.extract_text_from_image(image_path)
+        # OCR 텍스트 추출 (이미지 정보는 OCR과 같은 1회 디코딩 결과 사용)
+        try:
+            extracted_text, ocr_confidence, image_size, file_size = self.ocr_engine.extract_text(image_path)
+        except Exception as e:
+            raise Exception(f"OCR 실패: {str(e)}")
 
         # 보안 검증
         validation_result = self.validator.validate(extracted_text)
@@ -97,6 +111,31 @@ class ImageSecurityAnalyzer:
             ocr_confidence=ocr_confidence
         )
 
+    def analyze_document(self, document_path: str) -> DocumentAnalysisResult:
+        """
+        다중 페이지 문서(PDF·TIFF) 보안 분석 - 페이지별 OCR·검증, 차단 등급 도달 시 남은 페이지 생략
+
+        Args:
+            document_path: 문서 파일 경로
+
+        Returns:
+            DocumentAnalysisResult
+        """
+        if not os.path.exists(document_path):
+            raise FileNotFoundError(f"문서 파일을 찾을 수 없습니다: {document_path}")
+
+        with open(document_path, 'rb') as f:
+            data = f.read()
+
+        with DocumentReader.from_env(data) as reader, \
+                ThreadPoolExecutor(max_workers=self.page_workers, thread_name_prefix='ocr-page') as executor:
+            return analyze_document(
+                reader,
+                lambda page: executor.submit(self.ocr_engine.recognize_bytes, page.data),
+                self.validator,
+                max_inflight=self.page_workers,
+            )
+
 
 def main():
     """테스트 실행"""
@@ -0,0 +1,290 @@
+"""
+OCR 입력 이미지 전처리 파이프라인
+ONNX 추론 시간은 픽셀 수에 비례하므로, 인식에 필요한 만큼만 확대·축소해 OCR 지연을 줄임
+
+단계 (순서대로, 단계별로 켜고 끄며 소요 시간 측정):
+    1. mode      : 팔레트/투명 배경(RGBA, LA, P) → 흰 배경 합성, 그 외 RGB 또는 흑백(L) 변환
+    2. grayscale : 흑백 변환 (팩스 스캔 등 - 확대 전에 적용해 1/3 픽셀 데이터로 처리)
+    3. scale     : 목표 DPI 기준 배율 결정 + 총 픽셀 수 상한/하한
+                   - DPI 정보가 있으면 target_dpi로 맞춤 (300dpi 팩스·스캔은 그대로)
+                   - DPI 정보가 없으면 총 픽셀 수가 min_pixels 미만일 때만 확대 (최대 max_upscale배)
+                   - 총 픽셀 수가 max_pixels를 넘는 대형 사진은 축소 (JPEG는 디코딩 단계에서 축소)
+    4. binarize  : 이진화 (off / otsu / 0-255 고정 임계값)
+
+예) 3000×400 영수증 띠: 1.2MP로 하한 이상 → 확대하지 않음 (기존: 7500×1000으로 LANCZOS 확대)
+
+사용법:
+    preprocessor = ImagePreprocessor.from_env()
+    with Image.open(path) as image:
+        rgb = preprocessor.process(image)
+    preprocessor.stats()  # 단계별 처리 건수·평균 소요 시간
+"""
+
+import math
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+
+from PIL import Image
+
+
+STAGES = ("mode", "grayscale", "scale", "binarize")
+
+_RESAMPLING = {
+    "nearest": Image.Resampling.NEAREST,
+    "bilinear": Image.Resampling.BILINEAR,
+    "bicubic": Image.Resampling.BICUBIC,
+    "lanczos": Image.Resampling.LANCZOS,
+}
+
+
+def _parse_binarize(value: Union[str, int, None]) -> Optional[Union[str, int]]:
+    """'off' / 'otsu' / 0-255 정수 → None / 'otsu' / 임계값"""
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return min(255, max(0, value))
+    value = value.strip().lower()
+    if value in ("", "0", "off", "false", "no", "none"):
+        return None
+    if value == "otsu":
+        return "otsu"
+    return min(255, max(0, int(value)))
+
+
+def _otsu_threshold(histogram) -> int:
+    """흑백 히스토그램(256칸) → 클래스 간 분산이 최대인 임계값"""
+    total = sum(histogram)
+    if not total:
+        return 128
+    weighted_total = sum(i * count for i, count in enumerate(histogram))
+    background = 0
+    weighted_background = 0.0
+    best, best_variance = 128, -1.0
+    for i, count in enumerate(histogram):
+        background += count
+        if background == 0:
+            continue
+        foreground = total - background
+        if foreground == 0:
+            break
+        weighted_background += i * count
+        mean_background = weighted_background / background
+        mean_foreground = (weighted_total - weighted_background) / foreground
+        variance = background * foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best, best_variance = i, variance
+    return best
+
+
+class ImagePreprocessor:
+    """단계별 설정·시간 측정이 가능한 OCR 전처리기 (스레드 안전 - 여러 요청이 공유)"""
+
+    def __init__(
+        self,
+        target_dpi: int = 300,
+        min_pixels: int = 1_000_000,
+        max_pixels: int = 8_000_000,
+        max_upscale: float = 2.0,
+        grayscale: bool = False,
+        binarize: Union[str, int, None] = None,
+        upscale_method: str = "bicubic",
+        enabled: Tuple[str, ...] = STAGES,
+    ):
+        self.target_dpi = target_dpi
+        self.min_pixels = min_pixels
+        self.max_pixels = max_pixels
+        self.max_upscale = max(1.0, max_upscale)
+        self.grayscale = grayscale or binarize is not None
+        self.binarize = _parse_binarize(binarize)
+        self.upscale_method = upscale_method
+        self._upscale_filter = _RESAMPLING[upscale_method]
+        self.enabled = tuple(stage for stage in STAGES if stage in enabled)
+
+        self._lock = threading.Lock()
+        self.processed = 0
+        # 단계 → [적용 건수, 누적 소요 시간(초)]
+        self._timings: Dict[str, list] = {stage: [0, 0.0] for stage in STAGES}
+        self.pixels_in = 0
+        self.pixels_out = 0
+
+    @classmethod
+    def from_env(cls) -> "ImagePreprocessor":
+        """
+        환경변수 기반 생성
+
+        - OCR_TARGET_DPI: 목표 해상도 (기본 300, DPI 정보가 있는 이미지에만 적용, 0이면 무시)
+        - OCR_MIN_MEGAPIXELS: 이보다 작은 이미지만 확대 (기본 1)
+        - OCR_MAX_MEGAPIXELS: 이보다 큰 이미지는 축소 (기본 8, 0이면 제한 없음)
+        - OCR_MAX_UPSCALE: 최대 확대 배율 (기본 2)
+        - OCR_GRAYSCALE: 흑백 변환 여부 (기본 false)
+        - OCR_BINARIZE: 이진화 - off / otsu / 0-255 임계값 (기본 off, 설정 시 흑백 변환 포함)
+        - OCR_UPSCALE_METHOD: 확대 보간 - nearest / bilinear / bicubic / lanczos (기본 bicubic)
+        - OCR_PREPROCESS_STAGES: 사용할 단계 목록 (기본 "mode,grayscale,scale,binarize")
+        """
+        stages = os.getenv("OCR_PREPROCESS_STAGES", ",".join(STAGES))
+        return cls(
+            target_dpi=int(os.getenv("OCR_TARGET_DPI", "300")),
+            min_pixels=int(float(os.getenv("OCR_MIN_MEGAPIXELS", "1")) * 1_000_000),
+            max_pixels=int(float(os.getenv("OCR_MAX_MEGAPIXELS", "8")) * 1_000_000),
+            max_upscale=float(os.getenv("OCR_MAX_UPSCALE", "2")),
+            grayscale=os.getenv("OCR_GRAYSCALE", "false").lower() in ("1", "true", "yes"),
+            binarize=os.getenv("OCR_BINARIZE", "off"),
+            upscale_method=os.getenv("OCR_UPSCALE_METHOD", "bicubic").lower(),
+            enabled=tuple(s.strip() for s in stages.split(",") if s.strip()),
+        )
+
+    def settings_key(self) -> str:
+        """결과에 영향을 주는 설정 요약 (OCR 결과 캐시 키 등에 사용)"""
+        return (
+            f"stages={'+'.join(self.enabled)};dpi={self.target_dpi};"
+            f"px={self.min_pixels}-{self.max_pixels};up={self.max_upscale}:{self.upscale_method};"
+            f"gray={int(self.grayscale)};bin={self.binarize}"
+        )
+
+    # ------------------------------------------------------------
+    # 배율 계산
+    # ------------------------------------------------------------
+
+    def scale_factor(self, size: Tuple[int, int], dpi: Optional[float] = None) -> float:
+        """원본 크기(와 DPI) → 적용할 배율 (1.0이면 크기 유지)"""
+        width, height = size
+        pixels = width * height
+        if not pixels:
+            return 1.0
+
+        if dpi and self.target_dpi:
+            scale = self.target_dpi / dpi
+        elif pixels < self.min_pixels:
+            scale = math.sqrt(self.min_pixels / pixels)
+        else:
+            scale = 1.0
+
+        scale = min(scale, self.max_upscale)
+        if self.max_pixels and pixels * scale * scale > self.max_pixels:
+            scale = math.sqrt(self.max_pixels / pixels)
+        # 5% 이내 차이는 리샘플링 비용 대비 효과가 없으므로 생략
+        return 1.0 if abs(scale - 1.0) < 0.05 else scale
+
+    @staticmethod
+    def _image_dpi(image: Image.Image) -> Optional[float]:
+        dpi = image.info.get("dpi")
+        if not dpi:
+            return None
+        try:
+            value = float(dpi[0] if isinstance(dpi, tuple) else dpi)
+        except (TypeError, ValueError):
+            return None
+        # 72/96dpi는 화면 캡처·편집기 기본값이라 실제 해상도 정보로 보지 않음
+        return value if value > 96 else None
+
+    # ------------------------------------------------------------
+    # 단계
+    # ------------------------------------------------------------
+
+    def _stage_mode(self, image: Image.Image) -> Image.Image:
+        if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+            rgba = image.convert("RGBA")
+            background = Image.new("RGB", rgba.size, (255, 255, 255))
+            background.paste(rgba, mask=rgba.getchannel("A"))
+            return background
+        if image.mode in ("1", "L") or image.mode == "RGB":
+            return image
+        return image.convert("RGB")
+
+    def _stage_grayscale(self, image: Image.Image) -> Image.Image:
+        return image if image.mode == "L" else image.convert("L")
+
+    def _stage_scale(self, image: Image.Image, scale: float) -> Image.Image:
+        width, height = image.size
+        new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        if image.mode == "1":
+            image = image.convert("L")
+        if scale < 1.0:
+            # reducing_gap: 정수배 축소(reduce)로 먼저 줄인 뒤 보간 - 대형 사진 축소 비용 절감
+            return image.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+        return image.resize(new_size, self._upscale_filter)
+
+    def _stage_binarize(self, image: Image.Image) -> Image.Image:
+        if image.mode != "L":
+            image = image.convert("L")
+        threshold = self.binarize
+        if threshold == "otsu":
+            threshold = _otsu_threshold(image.histogram())
+        return image.point([0 if i <= threshold else 255 for i in range(256)])
+
+    def process(self, image: Image.Image) -> Image.Image:
+        """
+        이미지 → OCR 입력용 RGB 이미지
+
+        아직 픽셀을 읽지 않은(Image.open 직후) JPEG는 축소 배율만큼 디코딩 단계에서 줄여 읽음
+        """
+        timings: Dict[str, float] = {}
+        original_size = image.size
+        scale = 1.0
+        if "scale" in self.enabled:
+            scale = self.scale_factor(original_size, self._image_dpi(image))
+            if scale <= 0.5 and image.format == "JPEG" and getattr(image, "im", None) is None:
+                start = time.perf_counter()
+                # draft는 요청 크기 이상인 1/2·1/4·1/8 배율 중 가장 작은 것으로 디코딩
+                image.draft(image.mode, (math.ceil(original_size[0] * scale),
+                                         math.ceil(original_size[1] * scale)))
+                image.load()
+                timings["scale"] = time.perf_counter() - start
+
+        if "mode" in self.enabled:
+            start = time.perf_counter()
+            image = self._stage_mode(image)
+            timings["mode"] = time.perf_counter() - start
+
+        if "grayscale" in self.enabled and self.grayscale:
+            start = time.perf_counter()
+            image = self._stage_grayscale(image)
+            timings["grayscale"] = time.perf_counter() - start
+
+        if scale != 1.0:
+            start = time.perf_counter()
+            # draft로 이미 일부 줄었으면 남은 배율만 적용
+            remaining = scale * original_size[0] / image.size[0]
+            if abs(remaining - 1.0) >= 0.01:
+                image = self._stage_scale(image, remaining)
+            timings["scale"] = timings.get("scale", 0.0) + time.perf_counter() - start
+
+        if "binarize" in self.enabled and self.binarize is not None:
+            start = time.perf_counter()
+            image = self._stage_binarize(image)
+            timings["binarize"] = time.perf_counter() - start
+
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+
+        with self._lock:
+            self.processed += 1
+            self.pixels_in += original_size[0] * original_size[1]
+            self.pixels_out += image.size[0] * image.size[1]
+            for stage, elapsed in timings.items():
+                self._timings[stage][0] += 1
+                self._timings[stage][1] += elapsed
+        return image
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "processed": self.processed,
+                "enabled": list(self.enabled),
+                "target_dpi": self.target_dpi,
+                "min_pixels": self.min_pixels,
+                "max_pixels": self.max_pixels,
+                "max_upscale": self.max_upscale,
+                "grayscale": self.grayscale,
+                "binarize": self.binarize,
+                "pixel_ratio": round(self.pixels_out / self.pixels_in, 3) if self.pixels_in else None,
+                "stages": {
+                    stage: {
+                        "applied": count,
+                        "avg_ms": round(total / count * 1000, 3) if count else 0.0,
+                    }
+                    for stage, (count, total) in self._timings.items()
+                },
+            }
@@ -0,0 +1,349 @@
+"""
+추가 전용(append-only) JSON Lines 로그
+검증 결과를 1건 1줄로 파일 끝에 덧붙여 기록 (기존 파일을 다시 읽거나 재작성하지 않음)
+
+- 버퍼링: buffer_size 건 또는 flush_interval 초마다 한 번에 기록 (추가 기록이 없어도 타이머로 기록,
+  종료 시 atexit로 잔여분 기록)
+- 회전: 파일 크기(max_bytes) 또는 경과 시간(rotate_interval) 초과 시 '{파일}.{시각}'으로 보관
+- 압축(선택): 보관 파일을 gzip으로 압축 ('{파일}.{시각}.gz')
+- 기록 도중 중단되어도 앞선 줄은 온전함 (잘린 마지막 줄은 읽을 때 건너뜀)
+- 기존 JSON 배열 형식(security_log.json) 파일은 처음 열 때 보관 파일로 옮겨 함께 조회
+
+사용법:
+    writer = JsonlLogWriter.from_env("security_log.jsonl")
+    writer.write({"timestamp": ..., "risk_score": ...})
+    for entry in iter_log_entries("security_log.jsonl"):
+        ...
+"""
+
+import atexit
+import glob
+import gzip
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
+
+
+# 보관 파일 접미사: .YYYYmmdd-HHMMSS-ffffff[.gz]
+_ARCHIVE_SUFFIX = re.compile(r"\.\d{8}-\d{6}-\d{6}(\.gz)?$")
+_ARRAY_SEPARATORS = re.compile(r"[\s,]*")
+# 배열 원소 경계 탐색용 (문자열 밖 구조 문자 / 문자열 안 종료·이스케이프 문자)
+_ARRAY_STRUCTURAL = re.compile(r'["{}\[\],]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class JsonlLogWriter:
+    """버퍼링·회전·압축을 지원하는 추가 전용 JSON Lines 기록기 (스레드 안전)"""
+
+    def __init__(
+        self,
+        filepath: str,
+        buffer_size: int = 100,
+        flush_interval: float = 1.0,
+        max_bytes: int = 64 * 1024 * 1024,
+        rotate_interval: float = 0,
+        compress: bool = True,
+    ):
+        self.filepath = filepath
+        self.buffer_size = max(1, buffer_size)
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        self._timer: Optional[threading.Timer] = None
+        self._file: Optional[IO[str]] = None
+        self._size = 0
+        self._opened_at = 0.0
+        self._closed = False
+
+        self.written = 0
+        self.flushes = 0
+        self.rotations = 0
+
+        atexit.register(self.close)
+
+    @classmethod
+    def from_env(cls, filepath: str) -> "JsonlLogWriter":
+        """
+        환경변수 기반 생성
+
+        - SECURITY_LOG_BUFFER: 버퍼 건수 (기본 100, 1이면 매 건 기록)
+        - SECURITY_LOG_FLUSH_INTERVAL: 최대 버퍼 유지 시간(초, 기본 1)
+        - SECURITY_LOG_MAX_MB: 회전 기준 파일 크기 (기본 64, 0이면 크기 회전 안 함)
+        - SECURITY_LOG_ROTATE_HOURS: 회전 기준 경과 시간 (기본 0 - 시간 회전 안 함)
+        - SECURITY_LOG_COMPRESS: 보관 파일 gzip 압축 여부 (기본 true)
+        """
+        return cls(
+            filepath,
+            buffer_size=int(os.getenv("SECURITY_LOG_BUFFER", "100")),
+            flush_interval=float(os.getenv("SECURITY_LOG_FLUSH_INTERVAL", "1.0")),
+            max_bytes=int(float(os.getenv("SECURITY_LOG_MAX_MB", "64")) * 1024 * 1024),
+            rotate_interval=float(os.getenv("SECURITY_LOG_ROTATE_HOURS", "0")) * 3600,
+            compress=os.getenv("SECURITY_LOG_COMPRESS", "true").lower() in ("1", "true", "yes"),
+        )
+
+    def write(self, entry: Dict[str, Any]):
+        """
+        로그 1건 추가 (버퍼가 차거나 flush_interval이 지나면 파일에 기록)
+
+        버퍼에 남은 건은 다음 기록을 기다리지 않고 늦어도 flush_interval 뒤 타이머로 기록
+        """
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("로그 기록기가 종료되었습니다")
+            self._buffer.append(line)
+            if (len(self._buffer) >= self.buffer_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_on_timer(self):
+        with self._lock:
+            self._timer = None
+            if not self._closed:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        data = "".join(self._buffer)
+        self._buffer.clear()
+        if self._file is None:
+            self._open()
+        elif self._should_rotate(len(data.encode("utf-8"))):
+            self._rotate()
+        self._file.write(data)
+        self._file.flush()
+        self._size += len(data.encode("utf-8"))
+        self.written += data.count("\n")
+        self.flushes += 1
+
+    def _open(self):
+        directory = os.path.dirname(os.path.abspath(self.filepath))
+        os.makedirs(directory, exist_ok=True)
+        # 기존 JSON 배열 형식 파일에는 이어 쓸 수 없으므로 보관 파일로 이동
+        if _detect_format(self.filepath) == "array":
+            self._archive()
+        self._file = open(self.filepath, "a", encoding="utf-8")
+        self._size = self._file.tell()
+        # 이전 기록이 줄 중간에서 끊겼으면 새 줄부터 시작 (잘린 줄과 이어 붙지 않도록)
+        if self._size and not _ends_with_newline(self.filepath):
+            self._file.write("\n")
+            self._size += 1
+        self._opened_at = time.time()
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if self._size == 0:
+            return False
+        if self.max_bytes and self._size + incoming > self.max_bytes:
+            return True
+        return bool(self.rotate_interval) and time.time() - self._opened_at >= self.rotate_interval
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        self._archive()
+        self.rotations += 1
+        self._open()
+
+    def _archive(self):
+        """현재 파일을 '{파일}.{시각}'으로 옮기고 필요 시 gzip 압축"""
+        archived = f"{self.filepath}.{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+        os.replace(self.filepath, archived)
+        if self.compress:
+            with open(archived, "rb") as src, gzip.open(archived + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(archived)
+
+    def close(self):
+        """남은 버퍼 기록 후 파일 닫기"""
+        with self._lock:
+            if self._closed:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            try:
+                self._flush()
+            finally:
+                self._closed = True
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+        atexit.unregister(self.close)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "filepath": self.filepath,
+            "buffered": len(self._buffer),
+            "written": self.written,
+            "flushes": self.flushes,
+            "rotations": self.rotations,
+            "file_bytes": self._size,
+        }
+
+
+def _ends_with_newline(path: str) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def _open_text(path: str) -> IO[str]:
+    """gzip 여부를 내용으로 판별해 텍스트 모드로 열기"""
+    with open(path, "rb") as f:
+        magic = f.read(2)
+    if magic == _GZIP_MAGIC:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def _detect_format(path: str) -> Optional[str]:
+    """'array' (기존 JSON 배열) / 'jsonl' / None (파일 없음 또는 빈 파일)"""
+    try:
+        with _open_text(path) as f:
+            head = f.read(256).lstrip()
+    except FileNotFoundError:
+        return None
+    if not head:
+        return None
+    return "array" if head[0] == "[" else "jsonl"
+
+
+def _scan_array_element(buf: str, i: int, depth: int, in_string: bool) -> Tuple[Optional[int], int, int, bool]:
+    """
+    buf[i:]에서 배열 원소의 끝 위치 탐색 (문자열·중첩 괄호 고려, 버퍼를 더 읽은 뒤 이어서 탐색 가능)
+
+    Returns:
+        (원소 끝 위치 - 없으면 None, 이어서 탐색할 위치, depth, in_string)
+    """
+    while True:
+        m = (_STRING_SPECIAL if in_string else _ARRAY_STRUCTURAL).search(buf, i)
+        if m is None:
+            return None, len(buf), depth, in_string
+        c = m.group()
+        i = m.end()
+        if in_string:
+            if c == "\\":
+                if i >= len(buf):
+                    # 이스케이프 대상 문자는 다음 청크에 있음
+                    return None, m.start(), depth, True
+                i += 1
+            else:
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c in "{[":
+            depth += 1
+        elif c in "}]":
+            if depth == 0:
+                return m.start(), i, depth, in_string
+            depth -= 1
+            if depth == 0:
+                return i, i, depth, in_string
+        elif depth == 0:
+            return m.start(), i, depth, in_string
+
+
+def _iter_json_array(f: IO[str], chunk_size: int) -> Iterator[Dict[str, Any]]:
+    """
+    JSON 배열 파일을 전체 적재 없이 원소 단위로 읽기 (손상된 원소·잘린 끝부분은 건너뜀)
+
+    해석에 실패한 원소는 끝 위치를 찾을 때까지만 더 읽고 (재해석 없이 이어서 탐색) 다음 원소로 이동
+    """
+    decoder = json.JSONDecoder()
+    buf = f.read(chunk_size).lstrip()
+    if not buf.startswith("["):
+        return
+    pos = 1
+    scan = None  # 해석 실패한 원소의 끝 탐색 상태 (위치, depth, in_string)
+    scanned: List[str] = []  # 탐색 중인 원소의 이미 탐색한 앞부분 (버퍼를 다시 복사하지 않도록 분리 보관)
+    while True:
+        if scan is None:
+            pos = _ARRAY_SEPARATORS.match(buf, pos).end()
+            if pos < len(buf):
+                if buf[pos] == "]":
+                    return
+                try:
+                    entry, pos = decoder.raw_decode(buf, pos)
+                except ValueError:
+                    scan = (pos, 0, False)
+                else:
+                    yield entry
+                    continue
+        if scan is not None:
+            end, *state = _scan_array_element(buf, *scan)
+            if end is not None:
+                text = "".join(scanned) + buf[pos:end]
+                pos, scan = end, None
+                scanned.clear()
+                try:
+                    # 청크 경계에서 잘려 실패했던 원소는 여기서 해석됨
+                    entry = json.loads(text)
+                except ValueError:
+                    continue
+                yield entry
+                continue
+            scanned.append(buf[pos:state[0]])
+            pos, scan = state[0], (0,) + tuple(state[1:])
+        more = f.read(chunk_size)
+        if not more:
+            return
+        buf, pos = buf[pos:] + more, 0
+
+
+def _iter_json_lines(f: IO[str]) -> Iterator[Dict[str, Any]]:
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            # 기록 도중 중단되어 잘린 줄
+            continue
+
+
+def iter_log_file(path: str, chunk_size: int = 64 * 1024) -> Iterator[Dict[str, Any]]:
+    """로그 파일 1개를 형식(JSON 배열/JSONL, gzip 여부) 자동 판별해 1건씩 읽기"""
+    fmt = _detect_format(path)
+    if fmt is None:
+        return
+    with _open_text(path) as f:
+        if fmt == "array":
+            yield from _iter_json_array(f, chunk_size)
+        else:
+            yield from _iter_json_lines(f)
+
+
+def log_files(filepath: str) -> List[str]:
+    """보관 파일(오래된 순) + 현재 파일 경로 목록"""
+    archived = sorted(
+        path for path in glob.glob(glob.escape(filepath) + ".*")
+        if _ARCHIVE_SUFFIX.search(path[len(filepath):])
+    )
+    return archived + ([filepath] if os.path.exists(filepath) else [])
+
+
+def iter_log_entries(filepath: str) -> Iterator[Dict[str, Any]]:
+    """보관 파일을 포함한 전체 로그를 오래된 순으로 1건씩 읽기"""
+    for path in log_files(filepath):
+        yield from iter_log_file(path)
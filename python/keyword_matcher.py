@@ -0,0 +1,132 @@
+"""
+다중 키워드 매칭 엔진
+키워드 사전을 트라이(trie)로 1회 구축하고, 텍스트를 한 번만 훑어 모든 키워드 위치를 탐지
+
+- 대소문자 무시 (str.lower 기준, 기존 str.find 방식과 동일한 위치 반환)
+- 겹치는 매칭 모두 보고 (예: 'SECRET' / 'TOP SECRET')
+- 키워드 수와 무관하게 텍스트 길이 × 매칭 접두사 길이에 비례하는 비용
+  (수천 건의 변전소명·내부 시스템 코드 사전도 선형 증가 없이 적재 가능)
+- 소규모 사전(기본 규칙)은 키워드별 str.find가 더 빠르므로 자동 전환
+
+사용법:
+    matcher = KeywordMatcher()
+    matcher.add("대외비", payload)
+    for entry_id, start, end in matcher.find_all(text):
+        keyword, payload = matcher.entry(entry_id)
+"""
+
+import re
+from typing import Any, List, Optional, Pattern, Tuple
+
+
+# 트라이 노드에서 "여기서 끝나는 키워드 목록"을 담는 키 (문자 키와 충돌하지 않음)
+_END = None
+
+# 키워드 수가 이 값 이하이면 키워드별 str.find(C 구현)가 파이썬 트라이 순회보다 빠름
+# (3.6MB 한글 텍스트 기준 교차점 약 150개)
+LINEAR_SCAN_MAX_KEYWORDS = 128
+
+
+class KeywordMatcher:
+    """트라이 기반 다중 키워드 매처"""
+
+    def __init__(self):
+        self._root: dict = {}
+        self._entries: List[Tuple[str, Any]] = []
+        self._max_length = 0
+        # 키워드 첫 글자 문자 클래스 (후보 위치만 정규식으로 건너뛰며 탐색)
+        self._first_char_re: Optional[Pattern] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_keyword_length(self) -> int:
+        """등록된 키워드 중 최대 길이"""
+        return self._max_length
+
+    def add(self, keyword: str, payload: Any = None) -> int:
+        """키워드 등록 (빈 문자열은 무시). 등록 순번(entry_id) 반환"""
+        if not keyword:
+            return -1
+
+        keyword_lower = keyword.lower()
+        node = self._root
+        for ch in keyword_lower:
+            node = node.setdefault(ch, {})
+
+        entry_id = len(self._entries)
+        node.setdefault(_END, []).append(entry_id)
+        self._entries.append((keyword, payload))
+        self._max_length = max(self._max_length, len(keyword), len(keyword_lower))
+        self._first_char_re = None
+        return entry_id
+
+    def entry(self, entry_id: int) -> Tuple[str, Any]:
+        """등록된 (키워드, payload) 반환"""
+        return self._entries[entry_id]
+
+    def _get_first_char_re(self) -> Pattern:
+        if self._first_char_re is None:
+            chars = ''.join(re.escape(ch) for ch in self._root if ch is not _END)
+            self._first_char_re = re.compile(f'[{chars}]' if chars else r'(?!)')
+        return self._first_char_re
+
+    def find_all(self, text: str, lowered: Optional[str] = None) -> List[Tuple[int, int, int]]:
+        """
+        모든 키워드 매칭 위치 반환
+
+        Args:
+            text: 검사할 텍스트
+            lowered: text.lower() 결과 (이미 계산한 경우 재사용)
+
+        Returns:
+            List[Tuple[int, int, int]]: (entry_id, start, end)
+                등록 순서 → 위치 순서로 정렬 (기존 키워드별 str.find 루프와 동일한 순서)
+        """
+        if not self._entries:
+            return []
+
+        if lowered is None:
+            lowered = text.lower()
+        if len(self._entries) <= LINEAR_SCAN_MAX_KEYWORDS:
+            return self._find_all_linear(lowered)
+
+        n = len(lowered)
+        root = self._root
+        buckets: List[List[int]] = [[] for _ in self._entries]
+
+        for m in self._get_first_char_re().finditer(lowered):
+            start = m.start()
+            node = root[m.group()]
+            pos = start + 1
+            while True:
+                ends = node.get(_END)
+                if ends:
+                    for entry_id in ends:
+                        buckets[entry_id].append(start)
+                if pos >= n:
+                    break
+                node = node.get(lowered[pos])
+                if node is None:
+                    break
+                pos += 1
+
+        results = []
+        for entry_id, starts in enumerate(buckets):
+            if starts:
+                length = len(self._entries[entry_id][0])
+                results.extend((entry_id, s, s + length) for s in starts)
+        return results
+
+    def _find_all_linear(self, lowered: str) -> List[Tuple[int, int, int]]:
+        """소규모 사전용 키워드별 str.find 스캔 (결과/순서는 트라이 순회와 동일)"""
+        results = []
+        for entry_id, (keyword, _) in enumerate(self._entries):
+            keyword_lower = keyword.lower()
+            length = len(keyword)
+            idx = lowered.find(keyword_lower)
+            while idx != -1:
+                results.append((entry_id, idx, idx + length))
+                idx = lowered.find(keyword_lower, idx + 1)
+        return results
@@ -0,0 +1,265 @@
+"""
+OCR 결과 캐시
+같은 팩스 양식·스크린샷이 반복 업로드될 때 전처리·ONNX/EasyOCR 추론을 생략하기 위한 디스크 캐시
+
+- 키 (엔진 이름·버전 + 전처리/타일 설정 네임스페이스 포함 - 설정이 바뀌면 이전 항목은 자동으로 무효):
+    1. 업로드 바이트 SHA-256    : 같은 파일 재업로드 → 디코딩·전처리 없이 적중
+    2. 전처리된 픽셀 SHA-256    : 메타데이터만 다르거나 무손실 재인코딩된 같은 이미지 → 추론 생략
+    3. 지각 해시(선택, dHash)   : JPEG 재압축 등 미세하게 달라진 사본도 적중
+       ※ 레이아웃이 같고 작은 글자만 다른 양식도 같은 해시가 될 수 있어 기본 비활성화
+- 값: 추출 텍스트, 줄별 상자·텍스트·신뢰도, 평균 신뢰도 (JSON)
+- 저장: SQLite 파일 (재시작 후에도 유지, 여러 워커 프로세스 공유), 용량 초과 시 최근 사용이 가장 오래된 항목부터 삭제
+- 개인정보: 값에 추출 원문이 그대로 저장되므로 기본 비활성화 (OCR_CACHE_MAX_MB 지정 시 사용)
+    - 저장 후 ttl초가 지난 항목은 조회되지 않고 주기적으로 삭제 (감사로그 보존 기간 LOG_RETENTION_DAYS를 넘지 않음)
+
+사용법:
+    cache = OCRCache.from_env()  # OCR_CACHE_MAX_MB 미지정 시 None
+    keys = [cache.bytes_key(namespace, data)]
+    value = cache.get(keys)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "ocr_cache.db")
+
+# 만료 항목 삭제 최소 간격 (초)
+EXPIRE_INTERVAL = 60
+
+# 지각 해시 한 변 크기 (hash_size × hash_size 비트)
+PHASH_SIZE = 16
+# 인접 픽셀 밝기 차가 이 값을 넘을 때만 1 - 흰 배경의 JPEG 압축 잡음으로 비트가 흔들리지 않게 함
+PHASH_MIN_DIFF = 8
+
+KEY_KINDS = ("bytes", "pixels", "phash")
+
+
+class OCRCache:
+    """SQLite 기반 OCR 결과 캐시 (용량 상한, 최근 사용 순 삭제, 스레드 안전)"""
+
+    # 이 횟수만큼 저장할 때마다 용량 정리
+    CLEANUP_INTERVAL = 100
+
+    def __init__(
+        self,
+        path: str = DEFAULT_DB_PATH,
+        max_bytes: int = 256 * 1024 * 1024,
+        perceptual: bool = False,
+        ttl: float = 3600,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.perceptual = perceptual
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._last_expire = 0.0
+
+        self.hits = {kind: 0 for kind in KEY_KINDS}
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS ocr_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL,
+                created_at REAL NOT NULL DEFAULT 0
+            )
+        """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(ocr_cache)")}
+        if "created_at" not in columns:
+            # 저장 시각이 없는 이전 항목은 만료된 것으로 취급 (0)
+            self._conn.execute("ALTER TABLE ocr_cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_ocr_cache_accessed ON ocr_cache(accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_ocr_cache_created ON ocr_cache(created_at)")
+        self._conn.commit()
+        with self._lock:
+            self._expire(time.time())
+
+    @classmethod
+    def from_env(cls) -> Optional["OCRCache"]:
+        """
+        환경변수 기반 생성 (기본 비활성화 - OCR_CACHE_MAX_MB를 지정해야 사용)
+
+        - OCR_CACHE_DB: 캐시 파일 경로 (기본 data/ocr_cache.db)
+        - OCR_CACHE_MAX_MB: 캐시 용량 (기본 0 - 비활성화)
+        - OCR_CACHE_TTL: 항목 유효 시간(초, 기본 3600, LOG_RETENTION_DAYS를 넘으면 보존 기간으로 제한)
+        - OCR_CACHE_PHASH: 지각 해시 키 사용 여부 (기본 false)
+        """
+        max_mb = float(os.getenv("OCR_CACHE_MAX_MB", "0"))
+        if max_mb <= 0:
+            return None
+        ttl = float(os.getenv("OCR_CACHE_TTL", "3600"))
+        retention = float(os.getenv("LOG_RETENTION_DAYS", "90")) * 86400
+        if retention > 0:
+            ttl = min(ttl, retention) if ttl > 0 else retention
+        return cls(
+            path=os.getenv("OCR_CACHE_DB", DEFAULT_DB_PATH),
+            max_bytes=int(max_mb * 1024 * 1024),
+            perceptual=os.getenv("OCR_CACHE_PHASH", "false").lower() in ("1", "true", "yes"),
+            ttl=ttl,
+        )
+
+    # ------------------------------------------------------------
+    # 키
+    # ------------------------------------------------------------
+
+    @staticmethod
+    def _key(kind: str, namespace: str, digest: str) -> str:
+        scope = hashlib.sha256(namespace.encode("utf-8")).hexdigest()[:16]
+        return f"{kind}:{scope}:{digest}"
+
+    def bytes_key(self, namespace: str, data: bytes) -> str:
+        """업로드 원본 바이트 키"""
+        return self._key("bytes", namespace, hashlib.sha256(data).hexdigest())
+
+    def image_keys(self, namespace: str, image: Image.Image) -> List[str]:
+        """전처리된 이미지 → 픽셀 키 (+ 지각 해시 키)"""
+        digest = hashlib.sha256(f"{image.mode}:{image.size}:".encode("ascii"))
+        digest.update(image.tobytes())
+        keys = [self._key("pixels", namespace, digest.hexdigest())]
+        if self.perceptual:
+            # 크기가 다른 이미지끼리는 섞이지 않도록 크기 포함
+            keys.append(self._key("phash", namespace, f"{image.size[0]}x{image.size[1]}:{_dhash(image)}"))
+        return keys
+
+    # ------------------------------------------------------------
+    # 조회·저장
+    # ------------------------------------------------------------
+
+    def get(self, keys: List[str]) -> Optional[Dict[str, Any]]:
+        """keys를 순서대로 조회해 처음 적중한 값 (없거나 만료되면 None, 실제 OCR 수행 시 lookup_miss 호출)"""
+        hit = self.lookup(keys)
+        return hit[0] if hit is not None else None
+
+    def lookup(self, keys: List[str]) -> Optional[Tuple[Dict[str, Any], float]]:
+        """get과 같으나 (값, 저장 시각) 반환 - 다른 키로 다시 저장할 때 만료 시각을 유지하기 위해 사용"""
+        now = time.time()
+        with self._lock:
+            self._maybe_expire(now)
+            for key in keys:
+                row = self._conn.execute("SELECT value, created_at FROM ocr_cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    continue
+                if self.ttl > 0 and row[1] < now - self.ttl:
+                    self._conn.execute("DELETE FROM ocr_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                    self.expired += 1
+                    continue
+                self._conn.execute("UPDATE ocr_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+                self.hits[key.split(":", 1)[0]] += 1
+                return json.loads(row[0]), row[1]
+        return None
+
+    def lookup_miss(self):
+        """모든 키 조회가 실패해 실제 OCR을 수행한 경우 호출"""
+        with self._lock:
+            self.misses += 1
+
+    def put(self, keys: List[str], value: Dict[str, Any], created_at: Optional[float] = None):
+        """keys 모두에 value 저장 (created_at: 기존 항목의 별칭으로 저장할 때 원래 저장 시각 - 만료 연장 방지)"""
+        encoded = json.dumps(value, ensure_ascii=False)
+        size = len(encoded.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ocr_cache (key, value, size, accessed_at, created_at) VALUES (?, ?, ?, ?, ?)",
+                [(key, encoded, size, now, created_at or now) for key in keys],
+            )
+            self._conn.commit()
+            self._puts += 1
+            if self._puts % self.CLEANUP_INTERVAL == 0:
+                self._cleanup(now)
+            else:
+                self._maybe_expire(now)
+
+    def _maybe_expire(self, now: float):
+        if now - self._last_expire >= EXPIRE_INTERVAL:
+            self._expire(now)
+
+    def _expire(self, now: float):
+        """저장 후 ttl이 지난 항목 삭제"""
+        self._last_expire = now
+        if self.ttl <= 0:
+            return
+        deleted = self._conn.execute("DELETE FROM ocr_cache WHERE created_at < ?", (now - self.ttl,)).rowcount
+        self._conn.commit()
+        self.expired += max(deleted, 0)
+
+    def _cleanup(self, now: float):
+        """만료 항목 삭제 후 용량 초과분을 최근 사용이 오래된 항목부터 삭제"""
+        self._expire(now)
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM ocr_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # 정리 직후 바로 다시 넘치지 않도록 90%까지 줄임
+        excess = total - int(self.max_bytes * 0.9)
+        doomed = []
+        for key, size in self._conn.execute("SELECT key, size FROM ocr_cache ORDER BY accessed_at ASC"):
+            if excess <= 0:
+                break
+            doomed.append((key,))
+            excess -= size
+        self._conn.executemany("DELETE FROM ocr_cache WHERE key = ?", doomed)
+        self._conn.commit()
+        self.evictions += len(doomed)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM ocr_cache")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM ocr_cache"
+            ).fetchone()
+            hits = sum(self.hits.values())
+            lookups = hits + self.misses
+            return {
+                "path": os.path.abspath(self.path),
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+                "perceptual": self.perceptual,
+                "ttl_s": self.ttl,
+                "hits": dict(self.hits),
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expired": self.expired,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def _dhash(image: Image.Image, size: int = PHASH_SIZE) -> str:
+    """차분 해시 - 흑백 (size+1)×size 축소 후 가로 인접 픽셀 밝기 비교 (size² 비트, 16진수)"""
+    small = image.convert("L").resize((size + 1, size), Image.Resampling.BILINEAR)
+    pixels = small.tobytes()
+    bits = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for col in range(size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1] + PHASH_MIN_DIFF)
+    return f"{bits:0{size * size // 4}x}"
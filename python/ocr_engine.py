@@ -7,13 +7,20 @@ RapidOCR(PaddleOCR) 기반 OCR 인터페이스 제공
 사용법:
     ocr = RapidOCR()
     text, confidence, size, file_size = ocr.extract_text("image.png")
+    text, confidence, size, file_size = ocr.extract_text_from_bytes(uploaded_bytes)  # 임시 파일 불필요
+
+    ocr = RapidOCR(cache=OCRCache.from_env())  # 같은 이미지 재업로드 시 추론 생략
 """
 
-import os
+import io
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 from PIL import Image
 
+from image_preprocess import ImagePreprocessor
+from ocr_cache import OCRCache
+from ocr_tiling import TiledOCR
+
 
 class OCREngine(ABC):
     """
@@ -21,9 +28,19 @@ class OCREngine(ABC):
 
     새로운 OCR 엔진을 추가하려면 이 클래스를 상속받아 구현:
     - RapidOCR: PaddleOCR 기반 (현재 사용 중)
+
+    하위 클래스는 extract_text_from_array만 구현하면 되며, 파일 경로·메모리 버퍼 입력은
+    공통 구현이 이미지를 1회 디코딩해 배열로 넘김 (크기 정보도 같은 디코딩 결과에서 계산)
+
+    cache(ocr_cache.OCRCache)를 주면 업로드 바이트 → 전처리된 픽셀 순으로 캐시를 조회해
+    적중 시 추론을 생략 (키에 cache_namespace가 포함되어 엔진·설정 변경 시 자동 무효)
     """
 
-    @abstractmethod
+    def __init__(self, preprocessor: Optional[ImagePreprocessor] = None, cache: Optional[OCRCache] = None):
+        # 전처리 설정 (미지정 시 OCR_* 환경변수)
+        self.preprocessor = preprocessor or ImagePreprocessor.from_env()
+        self.cache = cache
+
     def extract_text(self, image_path: str) -> Tuple[str, float, Tuple[int, int], int]:
         """
         이미지에서 텍스트 추출
@@ -38,6 +55,85 @@ class OCREngine(ABC):
                 - image_size: (width, height)
                 - file_size: 파일 크기 (bytes)
         """
+        with open(image_path, 'rb') as f:
+            data = f.read()
+        return self.extract_text_from_bytes(data)
+
+    def extract_text_from_bytes(self, data: bytes) -> Tuple[str, float, Tuple[int, int], int]:
+        """
+        메모리 버퍼(업로드 바이트 등)에서 텍스트 추출 - 디스크 I/O 없음
+
+        Returns:
+            extract_text와 동일 (file_size는 버퍼 길이)
+        """
+        text, confidence, _, image_size = self.recognize_bytes(data)
+        return text, confidence, image_size, len(data)
+
+    def recognize_bytes(self, data: bytes) -> Tuple[str, float, List[list], Tuple[int, int]]:
+        """
+        메모리 버퍼 → (텍스트, 신뢰도, 줄 목록, 원본 크기) - OCR 결과 캐시 적용
+
+        줄 목록: [[상자(4점, 전처리된 이미지 좌표), 텍스트, 신뢰도 0-1], ...] (엔진이 제공하지 않으면 빈 목록)
+        """
+        cache = self.cache
+        keys: List[str] = []
+        if cache is not None:
+            namespace = self.cache_namespace()
+            keys.append(cache.bytes_key(namespace, data))
+            cached = cache.get(keys)
+            if cached is not None:
+                return cached["text"], cached["confidence"], cached["lines"], tuple(cached["image_size"])
+
+        with Image.open(io.BytesIO(data)) as image:
+            image_size = image.size
+            processed = self._preprocess_image(image)
+            if cache is not None:
+                image_keys = cache.image_keys(namespace, processed)
+                hit = cache.lookup(image_keys)
+                if hit is not None:
+                    # 같은 픽셀의 다른 파일 - 다음 업로드부터는 바이트 키로 바로 적중 (만료 시각은 원래 항목 기준)
+                    cached, created_at = hit
+                    cache.put(keys, dict(cached, image_size=list(image_size)), created_at=created_at)
+                    return cached["text"], cached["confidence"], cached["lines"], image_size
+                keys.extend(image_keys)
+            array = _to_rgb_array(processed)
+
+        text, confidence, lines = self.recognize_array(array)
+        if cache is not None:
+            cache.lookup_miss()
+            cache.put(keys, {
+                "text": text,
+                "confidence": confidence,
+                "lines": lines,
+                "image_size": list(image_size),
+            })
+        return text, confidence, lines, image_size
+
+    def recognize_array(self, array) -> Tuple[str, float, List[list]]:
+        """배열 → (텍스트, 신뢰도, 줄 목록) - 줄 단위 결과를 주는 엔진은 재정의"""
+        text, confidence = self.extract_text_from_array(array)
+        return text, confidence, []
+
+    def cache_namespace(self) -> str:
+        """OCR 결과 캐시 네임스페이스 - 엔진 이름·버전과 결과에 영향을 주는 설정"""
+        return f"{self.name}:{self.version}:{self.preprocessor.settings_key()}"
+
+    @property
+    def version(self) -> str:
+        """엔진(모델 패키지) 버전"""
+        return "unknown"
+
+    @abstractmethod
+    def extract_text_from_array(self, array) -> Tuple[str, float]:
+        """
+        디코딩된 이미지 배열에서 텍스트 추출
+
+        Args:
+            array: numpy uint8 배열 (height, width, 3), RGB 순서
+
+        Returns:
+            (추출된 텍스트, 신뢰도 0-100)
+        """
         pass
 
     @abstractmethod
@@ -51,27 +147,15 @@ class OCREngine(ABC):
         """OCR 엔진 이름"""
         pass
 
-    def _get_image_info(self, image_path: str) -> Tuple[Tuple[int, int], int]:
-        """이미지 정보 추출 (공통)"""
-        image = Image.open(image_path)
-        image_size = image.size
-        file_size = os.path.getsize(image_path)
-        return image_size, file_size
-
     def _preprocess_image(self, image: Image.Image) -> Image.Image:
-        """이미지 전처리 (공통)"""
-        # RGB 변환
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+        """이미지 전처리 (공통) - 모드 변환·배율 조정·흑백/이진화, image_preprocess 참고"""
+        return self.preprocessor.process(image)
 
-        # 해상도가 너무 낮으면 확대
-        width, height = image.size
-        if width < 1000 or height < 1000:
-            scale = max(1000 / width, 1000 / height)
-            new_size = (int(width * scale), int(height * scale))
-            image = image.resize(new_size, Image.Resampling.LANCZOS)
 
-        return image
+def _to_rgb_array(image: Image.Image):
+    """RGB PIL 이미지 → numpy 배열 (numpy는 OCR 엔진 의존성이므로 사용 시점에 로드)"""
+    import numpy as np
+    return np.asarray(image)
 
 
 class RapidOCR(OCREngine):
@@ -85,10 +169,19 @@ class RapidOCR(OCREngine):
         - 한국어 인식률 우수
         - GPU 없이도 빠른 속도
         - 메모리 효율적
+
+    대형 페이지는 타일 분할 병렬 인식 가능 (OCR_TILING=true, ocr_tiling 참고)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        preprocessor: Optional[ImagePreprocessor] = None,
+        tiler: Optional[TiledOCR] = None,
+        cache: Optional[OCRCache] = None,
+    ):
         """RapidOCR 초기화"""
+        super().__init__(preprocessor, cache)
+        self.tiler = tiler if tiler is not None else TiledOCR.from_env()
         self._engine = None
         self._available = self._check_availability()
 
@@ -96,7 +189,11 @@ class RapidOCR(OCREngine):
         """RapidOCR 사용 가능 여부 확인"""
         try:
             from rapidocr_onnxruntime import RapidOCR as _RapidOCR
-            self._engine = _RapidOCR()
+            if self.tiler is not None and self.tiler.workers > 1:
+                # 타일 병렬 실행 시 세션별 스레드 수를 나눠 코어 과다 할당 방지
+                self._engine = _RapidOCR(intra_op_num_threads=self.tiler.engine_threads())
+            else:
+                self._engine = _RapidOCR()
             return True
         except ImportError:
             return False
@@ -110,22 +207,52 @@ class RapidOCR(OCREngine):
     def is_available(self) -> bool:
         return self._available
 
-    def extract_text(self, image_path: str) -> Tuple[str, float, Tuple[int, int], int]:
-        if not self._available or not self._engine:
-            raise RuntimeError("RapidOCR is not available. Install with: pip install rapidocr-onnxruntime")
+    @property
+    def version(self) -> str:
+        try:
+            from importlib.metadata import version
+            return version("rapidocr-onnxruntime")
+        except Exception:
+            return "unknown"
 
-        # 이미지 정보
-        image_size, file_size = self._get_image_info(image_path)
+    def cache_namespace(self) -> str:
+        namespace = super().cache_namespace()
+        if self.tiler is not None:
+            namespace += f":{self.tiler.settings_key()}"
+        return namespace
 
-        # 이미지 로드 및 전처리
-        image = Image.open(image_path)
-        image = self._preprocess_image(image)
+    def extract_lines(self, array) -> List[list]:
+        """
+        RGB 배열 1장을 한 번에 인식
 
-        # OCR 실행
-        result, _ = self._engine(image)
+        Returns:
+            [[상자(4점), 텍스트, 신뢰도 0-1], ...] (읽기 순서)
+        """
+        if not self._available or not self._engine:
+            raise RuntimeError("RapidOCR is not available. Install with: pip install rapidocr-onnxruntime")
 
-        if result is None:
-            return "", 0.0, image_size, file_size
+        # RapidOCR은 배열 입력을 BGR(OpenCV 순서)로 간주
+        import numpy as np
+        result, _ = self._engine(np.ascontiguousarray(array[:, :, ::-1]))
+        # numpy 값 → 기본 타입 (캐시 JSON 저장·응답 직렬화용)
+        return [
+            [[[float(x), float(y)] for x, y in box], text, float(score)]
+            for box, text, score in result or []
+        ]
+
+    def extract_text_from_array(self, array) -> Tuple[str, float]:
+        text, confidence, _ = self.recognize_array(array)
+        return text, confidence
+
+    def recognize_array(self, array) -> Tuple[str, float, List[list]]:
+        height, width = array.shape[:2]
+        if self.tiler is not None and self.tiler.should_tile(width, height):
+            result = self.tiler.run(array, self.extract_lines)
+        else:
+            result = self.extract_lines(array)
+
+        if not result:
+            return "", 0.0, []
 
         # 텍스트 및 신뢰도 추출
         text_parts = []
@@ -141,7 +268,7 @@ class RapidOCR(OCREngine):
         extracted_text = ' '.join(text_parts)
         avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
 
-        return extracted_text, avg_confidence, image_size, file_size
+        return extracted_text, avg_confidence, result
 
 
 def get_best_ocr_engine() -> OCREngine:
@@ -0,0 +1,342 @@
+"""
+대형 스캔 문서용 타일 분할 OCR
+A3 스캔·다단 양식처럼 큰 페이지를 겹치는 타일로 나눠 병렬 인식한 뒤 하나의 결과로 재조립
+
+- 분할: 약 tile_size 격자, 인접 타일은 overlap 픽셀씩 겹침
+        경계는 잉크 투영 프로파일에서 빈 띠(줄 사이, 단 사이 여백)로 옮겨 줄이 잘리지 않게 함
+        (여백이 없는 경계는 나누지 않음 - 예: 단일 단 문서는 가로로만 분할)
+- 병렬: 스레드 풀 (onnxruntime 추론 중에는 GIL이 풀림) - 엔진의 intra-op 스레드 수는 코어 수 / workers로 제한
+- 중복 제거: 겹침 영역에서 같은 줄이 두 타일에 잡히면 잘리지 않은 쪽(더 큰 상자)만 유지
+- 여백 없이 세로 경계에 걸친 긴 줄: 줄 전체를 담는 띠(양옆 여백까지)를 원본에서 잘라 한 번 더 인식
+- 읽기 순서: 위→아래, 같은 행은 왼쪽→오른쪽 (RapidOCR 단일 호출 결과와 같은 정렬 규칙)
+
+사용법:
+    tiler = TiledOCR.from_env()
+    if tiler and tiler.should_tile(width, height):
+        lines = tiler.run(array, engine.extract_lines)
+"""
+
+import math
+import os
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# 줄 상자가 타일 내부 경계에서 이 거리(px) 이내면 잘린 것으로 간주 (좌우는 줄 높이 이내)
+EDGE_MARGIN = 4
+# 두 상자의 교집합이 작은 상자 면적의 이 비율 이상이면 같은 줄
+DUPLICATE_RATIO = 0.5
+# 이 값보다 어두운 픽셀을 잉크로 보고 경계 위치 선정 (0-255)
+INK_THRESHOLD = 128
+
+
+def default_workers() -> int:
+    return min(4, os.cpu_count() or 1)
+
+
+def _bounds(box) -> Tuple[float, float, float, float]:
+    xs = [point[0] for point in box]
+    ys = [point[1] for point in box]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _area(bounds) -> float:
+    return max(0.0, bounds[2] - bounds[0]) * max(0.0, bounds[3] - bounds[1])
+
+
+def _intersection(a, b) -> float:
+    return _area((max(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), min(a[3], b[3])))
+
+
+def _offset(lines: List[list], x0: int, y0: int) -> List[list]:
+    """부분 배열 좌표 → 페이지 좌표"""
+    return [
+        [[[px + x0, py + y0] for px, py in box], text, confidence]
+        for box, text, confidence in lines
+    ]
+
+
+def sort_reading_order(lines: List[list]) -> List[list]:
+    """위→아래, 같은 높이(허용 오차 이내)는 왼쪽→오른쪽 - RapidOCR sorted_boxes와 같은 방식"""
+    if not lines:
+        return lines
+    heights = [line[0][3][1] - line[0][0][1] for line in lines]
+    tolerance = max(10.0, 0.5 * statistics.median(heights))
+    ordered = sorted(lines, key=lambda line: (line[0][0][1], line[0][0][0]))
+    for i in range(len(ordered) - 1):
+        for j in range(i, -1, -1):
+            upper, lower = ordered[j], ordered[j + 1]
+            if abs(lower[0][0][1] - upper[0][0][1]) < tolerance and lower[0][0][0] < upper[0][0][0]:
+                ordered[j], ordered[j + 1] = lower, upper
+            else:
+                break
+    return ordered
+
+
+class TiledOCR:
+    """겹치는 타일 단위 병렬 OCR + 결과 병합"""
+
+    def __init__(
+        self,
+        tile_size: int = 1600,
+        overlap: int = 200,
+        min_pixels: int = 4_000_000,
+        workers: Optional[int] = None,
+    ):
+        if overlap * 2 >= tile_size:
+            raise ValueError("overlap은 tile_size의 절반보다 작아야 합니다")
+        self.tile_size = tile_size
+        self.overlap = overlap
+        self.min_pixels = min_pixels
+        self.workers = max(1, workers or default_workers())
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self.pages = 0
+        self.tiles = 0
+        self.duplicates_removed = 0
+        self.lines_rejoined = 0
+        self.total_seconds = 0.0
+
+    @classmethod
+    def from_env(cls) -> Optional["TiledOCR"]:
+        """
+        환경변수 기반 생성 (OCR_TILING=true일 때만, 아니면 None)
+
+        - OCR_TILE_SIZE: 타일 한 변 픽셀 (기본 1600, RapidOCR max_side_len 2000 이하 권장)
+        - OCR_TILE_OVERLAP: 인접 타일 겹침 픽셀 (기본 200, 가장 큰 글자 높이의 몇 배 이상)
+        - OCR_TILE_MIN_MEGAPIXELS: 이보다 큰 페이지만 분할 (기본 4)
+        - OCR_TILE_WORKERS: 병렬 타일 수 (기본 0 - 코어 수, 최대 4)
+        """
+        if os.getenv("OCR_TILING", "false").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            tile_size=int(os.getenv("OCR_TILE_SIZE", "1600")),
+            overlap=int(os.getenv("OCR_TILE_OVERLAP", "200")),
+            min_pixels=int(float(os.getenv("OCR_TILE_MIN_MEGAPIXELS", "4")) * 1_000_000),
+            workers=int(os.getenv("OCR_TILE_WORKERS", "0")) or None,
+        )
+
+    def settings_key(self) -> str:
+        """결과에 영향을 주는 설정 요약 (OCR 결과 캐시 키 등에 사용)"""
+        return f"tile={self.tile_size}/{self.overlap};min_px={self.min_pixels}"
+
+    def engine_threads(self) -> int:
+        """타일 병렬 실행 시 엔진 세션당 intra-op 스레드 수 (코어 과다 할당 방지)"""
+        return max(1, (os.cpu_count() or 1) // self.workers)
+
+    def should_tile(self, width: int, height: int) -> bool:
+        return (width * height >= self.min_pixels
+                and (width > self.tile_size or height > self.tile_size))
+
+    # ------------------------------------------------------------
+    # 분할
+    # ------------------------------------------------------------
+
+    def _axis(self, length: int, profile=None, gap: int = 1) -> List[Tuple[int, int]]:
+        """
+        한 축의 타일 구간 - 균등 분할 후 각 경계를 ±overlap/2 안의 여백으로 이동
+
+        경계 양쪽으로 overlap/2씩 겹침. profile(잉크 투영)을 주면 여백이 없는 경계는 건너뛰므로
+        단 구분 없이 긴 줄이 이어지는 문서는 그 축으로 나누지 않음 (여백은 gap 픽셀 이상 연속 빈 구간)
+        """
+        if length <= self.tile_size:
+            return [(0, length)]
+        count = math.ceil((length - self.overlap) / (self.tile_size - self.overlap))
+        half = self.overlap // 2
+        if profile is not None:
+            import numpy as np
+            profile = np.convolve(profile, np.ones(gap, dtype=np.int64), mode="same")
+
+        cuts = [0]
+        for i in range(1, count):
+            cut = round(i * length / count)
+            if profile is not None:
+                lo = max(cuts[-1] + half + 1, cut - half)
+                hi = min(length - half - 1, cut + half)
+                if lo > hi:
+                    continue
+                # 여백 중 균등 분할 위치에 가장 가까운 곳
+                positions = np.arange(lo, hi + 1)
+                cost = profile[lo:hi + 1] * (2 * half + 2) + np.abs(positions - cut)
+                cut = lo + int(np.argmin(cost))
+                if profile[cut]:
+                    # 여백이 없으면 줄을 자르는 대신 이 경계는 나누지 않음 (타일이 커짐)
+                    continue
+            cuts.append(cut)
+        cuts.append(length)
+        return [(max(0, cuts[i] - half), min(length, cuts[i + 1] + half)) for i in range(len(cuts) - 1)]
+
+    def plan(self, width: int, height: int, array=None) -> List[Tuple[int, int, int, int]]:
+        """
+        페이지 크기 → 타일 영역 (x0, y0, x1, y1) 목록
+
+        array를 주면 가로 경계는 빈 행, 세로 경계는 해당 타일 행 안의 빈 열에 맞춤
+        """
+        ink = None if array is None else array.min(axis=2) < INK_THRESHOLD
+        # 세로 경계는 단어 사이 틈이 아닌 단 사이 여백(overlap/4 폭 이상)에만 둠
+        column_gap = max(1, self.overlap // 4)
+        tiles = []
+        for y0, y1 in self._axis(height, None if ink is None else ink.sum(axis=1)):
+            columns = self._axis(width, None if ink is None else ink[y0:y1].sum(axis=0), column_gap)
+            tiles.extend((x0, y0, x1, y1) for x0, x1 in columns)
+        return tiles
+
+    # ------------------------------------------------------------
+    # 인식·병합
+    # ------------------------------------------------------------
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ocr-tile")
+            return self._executor
+
+    def _map(self, fn, items) -> list:
+        if len(items) <= 1 or self.workers == 1:
+            return [fn(item) for item in items]
+        return list(self._get_executor().map(fn, items))
+
+    def run(self, array, recognize: Callable[[Any], List[list]]) -> List[list]:
+        """
+        페이지 배열을 타일로 나눠 인식 후 병합
+
+        Args:
+            array: (height, width, 3) 배열
+            recognize: 배열 → [[상자(4점), 텍스트, 신뢰도], ...] (상자는 입력 배열 좌표)
+
+        Returns:
+            페이지 좌표 기준 줄 목록 (읽기 순서)
+        """
+        start = time.perf_counter()
+        height, width = array.shape[:2]
+        tiles = self.plan(width, height, array)
+
+        def recognize_region(region):
+            x0, y0, x1, y1 = region
+            return region, _offset(recognize(array[y0:y1, x0:x1]), x0, y0)
+
+        kept, duplicates = self._deduplicate(self._map(recognize_region, tiles), width, height)
+
+        # 세로 경계에 걸려 잘린 줄 → 줄 전체를 담는 띠를 다시 인식해 조각을 대체
+        strips = self._rejoin_strips(kept, array)
+        rejoined = 0
+        results = self._map(recognize_region, [region for region, _ in strips])
+        for (region, (row_top, row_bottom)), (_, lines) in zip(strips, results):
+            before = len(kept)
+            kept = [
+                c for c in kept
+                if _intersection(c["bounds"], region) < DUPLICATE_RATIO * _area(c["bounds"])
+            ]
+            rejoined += before - len(kept)
+            # 띠 위아래 여유분에 걸친 이웃 줄 일부는 제외 (중심이 잘린 줄 높이 범위 안인 줄만)
+            for line in lines:
+                bounds = _bounds(line[0])
+                center = (bounds[1] + bounds[3]) / 2
+                if row_top <= center <= row_bottom and not any(
+                    _intersection(bounds, c["bounds"]) >= DUPLICATE_RATIO * min(_area(bounds), _area(c["bounds"]))
+                    for c in kept
+                ):
+                    kept.append({"line": line, "bounds": bounds})
+
+        with self._lock:
+            self.pages += 1
+            self.tiles += len(tiles)
+            self.duplicates_removed += duplicates
+            self.lines_rejoined += rejoined
+            self.total_seconds += time.perf_counter() - start
+        return sort_reading_order([c["line"] for c in kept])
+
+    def _deduplicate(self, results, width: int, height: int) -> Tuple[List[dict], int]:
+        """타일별 결과 → 겹침 영역 중복을 제거한 줄 목록, 제거 건수"""
+        candidates = []
+        for (x0, y0, x1, y1), lines in results:
+            for line in lines:
+                bounds = _bounds(line[0])
+                # 이미지 가장자리가 아닌 타일 경계 가까이(잘린 글자는 검출되지 않을 수 있으므로 줄 높이 이내)면 잘린 줄로 간주
+                margin = max(EDGE_MARGIN, bounds[3] - bounds[1])
+                cut_left = x0 > 0 and bounds[0] <= x0 + margin
+                cut_right = x1 < width and bounds[2] >= x1 - margin
+                cut_top = y0 > 0 and bounds[1] <= y0 + EDGE_MARGIN
+                cut_bottom = y1 < height and bounds[3] >= y1 - EDGE_MARGIN
+                candidates.append({
+                    "line": line,
+                    "bounds": bounds,
+                    "cut": cut_left or cut_right or cut_top or cut_bottom,
+                    "cut_x": cut_left or cut_right,
+                })
+
+        # 잘리지 않은 줄 → 큰 상자 순으로 채택, 겹치는 나머지는 중복
+        candidates.sort(key=lambda c: (c["cut"], -_area(c["bounds"])))
+        kept = []
+        for candidate in candidates:
+            bounds = candidate["bounds"]
+            if any(
+                _intersection(bounds, other["bounds"])
+                >= DUPLICATE_RATIO * min(_area(bounds), _area(other["bounds"]))
+                for other in kept
+            ):
+                continue
+            kept.append(candidate)
+        return kept, len(candidates) - len(kept)
+
+    def _rejoin_strips(self, kept: List[dict], array) -> List[Tuple[Tuple[int, int, int, int], Tuple[float, float]]]:
+        """
+        좌우로 잘린 줄마다 그 줄을 온전히 담는 가로 띠 (영역, 잘린 줄의 세로 범위)
+
+        줄 높이 범위의 잉크 프로파일에서 양옆으로 가장 가까운 여백(overlap/4 폭 이상)까지 넓히고,
+        위아래로 줄 높이만큼 여유를 둠 (같은 행에서 겹치는 띠는 하나로 합침)
+        """
+        import numpy as np
+
+        height, width = array.shape[:2]
+        gap = max(1, self.overlap // 4)
+        strips: List[List[float]] = []
+        for candidate in kept:
+            if not candidate.get("cut_x"):
+                continue
+            x0, y0, x1, y1 = candidate["bounds"]
+            profile = (array[int(y0):int(math.ceil(y1))].min(axis=2) < INK_THRESHOLD).sum(axis=0)
+            blank = np.flatnonzero(np.convolve(profile, np.ones(gap, dtype=np.int64), mode="same") == 0)
+            left_blank = blank[blank < x0]
+            right_blank = blank[blank > x1]
+            strip = [int(left_blank[-1]) if len(left_blank) else 0, y0,
+                     int(right_blank[0]) + 1 if len(right_blank) else width, y1]
+            for other in strips:
+                if _intersection(strip, other) > 0:
+                    other[:] = [min(strip[0], other[0]), min(strip[1], other[1]),
+                                max(strip[2], other[2]), max(strip[3], other[3])]
+                    break
+            else:
+                strips.append(strip)
+
+        regions = []
+        for x0, y0, x1, y1 in strips:
+            pad = y1 - y0
+            regions.append((
+                (int(x0), max(0, int(y0 - pad)), int(x1), min(height, int(math.ceil(y1 + pad)))),
+                (y0, y1),
+            ))
+        return regions
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tile_size": self.tile_size,
+            "overlap": self.overlap,
+            "min_pixels": self.min_pixels,
+            "workers": self.workers,
+            "pages": self.pages,
+            "tiles": self.tiles,
+            "duplicates_removed": self.duplicates_removed,
+            "lines_rejoined": self.lines_rejoined,
+            "avg_page_ms": round(self.total_seconds / self.pages * 1000, 2) if self.pages else 0.0,
+        }
@@ -0,0 +1,559 @@
+"""
+OCR 워커 프로세스 풀
+API 프로세스 안에서 RapidOCR 1개를 모든 요청이 공유하던 구조 대신, 전용 프로세스 N개가 각자 ONNX 모델을 1회 적재해 처리
+
+- 기동: 워커마다 엔진 생성 + 예열 추론 1회 (첫 요청 지연 제거), 준비 완료 후 작업 수신
+  (start(wait=False)면 기다리지 않고 반환 - 준비 전 제출된 작업은 대기열에서 대기)
+- 대기열: 우선순위(작을수록 먼저) → 제출 순, 작업마다 제한 시간 (대기 시간 포함,
+  대기 중 제한 시간이 지나면 만료 감시 스레드가 워커 배정 전에 실패 처리)
+- 결과: concurrent.futures.Future (asyncio에서는 asyncio.wrap_future로 대기)
+- 격리: 손상된 이미지로 워커가 죽거나(세그폴트·OOM) 제한 시간을 넘기면 해당 워커만 재시작, API는 영향 없음
+- 재활용: 메모리(RSS)가 max_rss_bytes를 넘거나 max_jobs 건 처리 후 워커 교체
+- 지표: 대기 시간 / 추론 시간 분리 (지수이동평균·최대), 워커별 상태·처리 건수·재시작 횟수·RSS
+
+사용법:
+    pool = OCRWorkerPool.from_env()
+    pool.start()            # 또는 pool.start(wait=False) 후 pool.wait_ready()
+    text, confidence, lines, image_size = await asyncio.wrap_future(pool.submit(image_bytes))
+    pool.shutdown()
+"""
+
+import heapq
+import itertools
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+from workload_executor import WorkloadRejected
+
+
+# 우선순위 (작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 10
+
+
+class OCRJobTimeout(TimeoutError):
+    """OCR 작업 제한 시간 초과 (대기 + 추론)"""
+
+
+class OCRWorkerCrashed(RuntimeError):
+    """작업 처리 중 워커 프로세스 비정상 종료"""
+
+
+class OCRWorkerError(RuntimeError):
+    """워커에서 발생한 OCR 오류 (이미지 형식 오류 등)"""
+
+
+class OCRPoolUnavailable(RuntimeError):
+    """워커 풀을 사용할 수 없어 대기 작업을 처리하지 못함 (기동 실패 후 종료 등)"""
+
+
+# ============================================================
+# 워커 프로세스
+# ============================================================
+
+def _rss_bytes() -> int:
+    """현재 프로세스 상주 메모리 (Linux: /proc, 그 외: 최대 RSS, 확인 불가 시 0)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, Linux는 KB 단위
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return 0
+
+
+def _warmup_image():
+    """예열용 글자 이미지 (검출·인식 모델을 모두 거치도록 텍스트 포함)"""
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (320, 64), "white")
+    ImageDraw.Draw(image).text((12, 20), "KEPCO OCR 0123456789", fill="black")
+    return image
+
+
+def _engine_stats(engine) -> Dict[str, Any]:
+    return {
+        "preprocess": engine.preprocessor.stats(),
+        "tiling": engine.tiler.stats() if engine.tiler is not None else None,
+        "cache": engine.cache.stats() if engine.cache is not None else None,
+    }
+
+
+def _worker_main(conn):
+    """
+    워커 프로세스 진입점
+
+    수신: (job_id, 이미지 바이트) / None (종료)
+    송신: ("ready", 예열 ms) / ("failed", 메시지)
+          ("ok", job_id, (텍스트, 신뢰도, 줄 목록, 원본 크기), 추론 초, RSS, 엔진 통계)
+          ("error", job_id, 메시지, 추론 초, RSS, 엔진 통계)
+    """
+    try:
+        from ocr_cache import OCRCache
+        from ocr_engine import RapidOCR, _to_rgb_array
+
+        engine = RapidOCR(cache=OCRCache.from_env())
+        if not engine.is_available():
+            conn.send(("failed", "RapidOCR를 사용할 수 없습니다 (pip install rapidocr-onnxruntime)"))
+            return
+        start = time.perf_counter()
+        # 캐시를 거치지 않고 배열로 직접 추론 (모델 세션·메모리 풀 초기화)
+        engine.recognize_array(_to_rgb_array(_warmup_image()))
+        conn.send(("ready", round((time.perf_counter() - start) * 1000, 2)))
+    except Exception as e:
+        conn.send(("failed", f"{type(e).__name__}: {e}"))
+        return
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if message is None:
+            return
+        job_id, data = message
+        start = time.perf_counter()
+        try:
+            result = engine.recognize_bytes(data)
+            reply = ("ok", job_id, result)
+        except Exception as e:
+            reply = ("error", job_id, f"{type(e).__name__}: {e}")
+        conn.send(reply + (time.perf_counter() - start, _rss_bytes(), _engine_stats(engine)))
+
+
+# ============================================================
+# 부모 프로세스
+# ============================================================
+
+class _Job:
+    __slots__ = ("data", "future", "submitted", "deadline")
+
+    def __init__(self, data: bytes, timeout: float):
+        self.data = data
+        self.future: Future = Future()
+        self.submitted = time.monotonic()
+        self.deadline = self.submitted + timeout
+
+
+class _Worker:
+    """워커 프로세스 1개와 이를 감독하는 스레드"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.state = "stopped"  # starting / idle / busy / restarting / failed / stopped
+        self.jobs = 0
+        self.jobs_since_start = 0
+        self.restarts = 0
+        self.crashes = 0
+        self.rss = 0
+        self.started_at = 0.0
+        self.warmup_ms = None
+        self.last_error: Optional[str] = None
+        self.engine_stats: Optional[Dict[str, Any]] = None
+
+    def stats(self) -> Dict[str, Any]:
+        alive = self.process is not None and self.process.is_alive()
+        return {
+            "index": self.index,
+            "pid": self.process.pid if alive else None,
+            "state": self.state,
+            "alive": alive,
+            "jobs": self.jobs,
+            "restarts": self.restarts,
+            "crashes": self.crashes,
+            "rss_mb": round(self.rss / 1024 / 1024, 1),
+            "uptime_s": round(time.monotonic() - self.started_at, 1) if alive else 0,
+            "warmup_ms": self.warmup_ms,
+            "last_error": self.last_error,
+            "engine": self.engine_stats,
+        }
+
+
+class OCRWorkerPool:
+    """OCR 전용 프로세스 풀 (우선순위 대기열, 제한 시간, 워커 재시작)"""
+
+    # 지표 지수이동평균 가중치
+    EWMA_ALPHA = 0.2
+    # 기동 실패 시 재시도 간격 (초, 실패가 이어지면 최대 60초까지 2배씩)
+    RESTART_BACKOFF = 1.0
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue: int = 32,
+        timeout: float = 60.0,
+        startup_timeout: float = 120.0,
+        max_rss_bytes: int = 0,
+        max_jobs: int = 0,
+    ):
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self.max_rss_bytes = max_rss_bytes
+        self.max_jobs = max_jobs
+        # ONNX Runtime 스레드가 떠 있는 부모를 fork하지 않도록 spawn 사용
+        self._context = multiprocessing.get_context("spawn")
+        self._workers = [_Worker(i) for i in range(self.workers)]
+        self._threads: List[threading.Thread] = []
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self._measured = 0
+        self._avg_wait = 0.0
+        self._avg_inference = 0.0
+        self._max_wait = 0.0
+        self._max_inference = 0.0
+
+    @classmethod
+    def from_env(cls) -> Optional["OCRWorkerPool"]:
+        """
+        환경변수 기반 생성 (OCR_WORKERS=0 이면 None - API 프로세스 안에서 직접 OCR)
+
+        - OCR_WORKERS: 워커 프로세스 수 (기본 2)
+        - OCR_WORKER_QUEUE: 대기 허용 작업 수 (기본 32, 초과 시 429)
+        - OCR_WORKER_TIMEOUT: 작업 제한 시간(초, 대기 포함, 기본 60)
+        - OCR_WORKER_MAX_RSS_MB: 워커 메모리가 이를 넘으면 재시작 (기본 0 - 제한 없음)
+        - OCR_WORKER_MAX_JOBS: 워커당 처리 건수 후 재시작 (기본 0 - 제한 없음)
+        """
+        workers = int(os.getenv("OCR_WORKERS", "2"))
+        if workers <= 0:
+            return None
+        return cls(
+            workers=workers,
+            max_queue=int(os.getenv("OCR_WORKER_QUEUE", "32")),
+            timeout=float(os.getenv("OCR_WORKER_TIMEOUT", "60")),
+            max_rss_bytes=int(float(os.getenv("OCR_WORKER_MAX_RSS_MB", "0")) * 1024 * 1024),
+            max_jobs=int(os.getenv("OCR_WORKER_MAX_JOBS", "0")),
+        )
+
+    # ------------------------------------------------------------
+    # 기동·종료
+    # ------------------------------------------------------------
+
+    def start(self, wait: bool = True) -> int:
+        """
+        워커 기동 (모델 적재·예열은 워커마다 병렬 진행)
+
+        wait=True면 모든 워커의 기동이 끝날 때까지 최대 startup_timeout(기본 120초) 동안 블록.
+        서버 기동을 막지 않으려면 wait=False로 호출하고 ready_workers()·stats()["ready"]로 준비 상태 확인
+
+        Returns:
+            wait=True이면 준비된 워커 수 (startup_timeout까지 대기), 아니면 0
+        """
+        for worker in self._workers:
+            thread = threading.Thread(
+                target=self._supervise, args=(worker,), name=f"ocr-worker-{worker.index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        thread = threading.Thread(target=self._expire_queued, name="ocr-queue-expiry", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        if not wait:
+            return 0
+        return self.wait_ready()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> int:
+        """
+        모든 워커의 첫 기동(성공 또는 실패)이 끝날 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간(초, 기본 startup_timeout)
+
+        Returns:
+            준비된 워커 수
+        """
+        deadline = time.monotonic() + (self.startup_timeout if timeout is None else timeout)
+        with self._cond:
+            while not self._closed:
+                states = [w.state for w in self._workers]
+                if "starting" not in states and "stopped" not in states:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+        return self.ready_workers()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def ready_workers(self) -> int:
+        return sum(w.state in ("idle", "busy") for w in self._workers)
+
+    def _spawn(self, worker: _Worker) -> bool:
+        """워커 프로세스 생성 후 예열 완료까지 대기"""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main, args=(child_conn,), name=f"ocr-worker-{worker.index}", daemon=True
+        )
+        self._set_state(worker, "starting")
+        process.start()
+        child_conn.close()
+        worker.process, worker.conn = process, parent_conn
+        worker.started_at = time.monotonic()
+        worker.jobs_since_start = 0
+        worker.rss = 0
+
+        message = None
+        try:
+            if parent_conn.poll(self.startup_timeout):
+                message = parent_conn.recv()
+        except (EOFError, OSError):
+            pass
+        if message and message[0] == "ready":
+            worker.warmup_ms = message[1]
+            self._set_state(worker, "idle")
+            return True
+
+        worker.last_error = message[1] if message else "워커 기동 실패 (응답 없음)"
+        self._stop(worker, graceful=False)
+        self._set_state(worker, "failed")
+        return False
+
+    def _stop(self, worker: _Worker, graceful: bool = True):
+        """워커 종료 (graceful이면 종료 메시지 후 잠시 대기, 응답 없으면 강제 종료)"""
+        process, conn = worker.process, worker.conn
+        if process is None:
+            return
+        if graceful and process.is_alive():
+            try:
+                conn.send(None)
+            except (OSError, BrokenPipeError):
+                pass
+            process.join(5)
+        if process.is_alive():
+            process.kill()
+        process.join()
+        conn.close()
+        worker.process = worker.conn = None
+
+    def _restart(self, worker: _Worker, graceful: bool):
+        self._set_state(worker, "restarting")
+        self._stop(worker, graceful=graceful)
+        worker.restarts += 1
+
+    def _set_state(self, worker: _Worker, state: str):
+        with self._cond:
+            worker.state = state
+            self._cond.notify_all()
+
+    def shutdown(self, wait: bool = True, error: Optional[Exception] = None):
+        """
+        신규 작업 거절, 대기 중인 작업 취소 후 워커 종료
+
+        Args:
+            error: 지정 시 대기 중인 작업을 취소하지 않고 이 예외로 실패 처리 (요청 측에 오류 응답 전달)
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            pending, self._heap = self._heap, []
+            self._cond.notify_all()
+        for _, _, job in pending:
+            if error is None:
+                job.future.cancel()
+            elif job.future.set_running_or_notify_cancel():
+                self._fail(job.future, error)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    # ------------------------------------------------------------
+    # 작업 제출·처리
+    # ------------------------------------------------------------
+
+    def submit(self, data: bytes, priority: int = PRIORITY_INTERACTIVE, timeout: Optional[float] = None) -> Future:
+        """
+        OCR 작업 제출
+
+        Returns:
+            Future → (텍스트, 신뢰도, 줄 목록, 원본 크기)
+            실패 시 OCRJobTimeout / OCRWorkerCrashed / OCRWorkerError
+
+        Raises:
+            WorkloadRejected: 대기열 초과
+        """
+        job = _Job(data if isinstance(data, bytes) else bytes(data), self.timeout if timeout is None else timeout)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("OCR 워커 풀이 종료되었습니다")
+            if len(self._heap) >= self.max_queue + self._idle_workers():
+                self.rejected += 1
+                raise WorkloadRejected("ocr", self.retry_after())
+            heapq.heappush(self._heap, (priority, next(self._seq), job))
+            self.submitted += 1
+            self._cond.notify_all()
+        return job.future
+
+    def _idle_workers(self) -> int:
+        return sum(w.state == "idle" for w in self._workers)
+
+    def retry_after(self) -> int:
+        """대기열이 빌 때까지의 예상 시간 (초, 최소 1)"""
+        waves = (len(self._heap) + 1) / max(1, self.ready_workers())
+        return max(1, math.ceil(self._avg_inference * waves))
+
+    def _next_job(self, worker: _Worker) -> Optional[_Job]:
+        with self._cond:
+            while not self._heap and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return None
+            _, _, job = heapq.heappop(self._heap)
+            worker.state = "busy"
+            return job
+
+    def _expire_queued(self):
+        """대기열 만료 감시 스레드 - 대기 중 제한 시간이 지난 작업은 워커 배정 전에 실패 처리, 취소된 작업은 제거"""
+        while True:
+            with self._cond:
+                if self._closed:
+                    return
+                now = time.monotonic()
+                expired = [
+                    entry for entry in self._heap
+                    if entry[2].deadline <= now or entry[2].future.cancelled()
+                ]
+                if not expired:
+                    next_deadline = min((entry[2].deadline for entry in self._heap), default=None)
+                    self._cond.wait(None if next_deadline is None else next_deadline - now)
+                    continue
+                removed = {entry[1] for entry in expired}
+                self._heap = [entry for entry in self._heap if entry[1] not in removed]
+                heapq.heapify(self._heap)
+            for _, _, job in expired:
+                if job.future.set_running_or_notify_cancel():
+                    self._fail(job.future, OCRJobTimeout("OCR 대기 시간이 제한 시간을 초과했습니다"), timeout=True)
+
+    def _supervise(self, worker: _Worker):
+        """워커 감독 스레드 - 기동·재시작, 대기열에서 작업을 꺼내 전달"""
+        backoff = self.RESTART_BACKOFF
+        while not self._closed:
+            if worker.process is None:
+                if not self._spawn(worker):
+                    with self._cond:
+                        self._cond.wait_for(lambda: self._closed, backoff)
+                    backoff = min(backoff * 2, 60.0)
+                    worker.restarts += 1
+                    continue
+                backoff = self.RESTART_BACKOFF
+
+            job = self._next_job(worker)
+            if job is None:
+                break
+            self._run_job(worker, job)
+            if worker.process is not None and self._needs_recycle(worker):
+                self._restart(worker, graceful=True)
+            self._set_state(worker, "idle" if worker.process is not None else "stopped")
+
+        self._stop(worker)
+        self._set_state(worker, "stopped")
+
+    def _needs_recycle(self, worker: _Worker) -> bool:
+        if self.max_rss_bytes and worker.rss > self.max_rss_bytes:
+            return True
+        return bool(self.max_jobs) and worker.jobs_since_start >= self.max_jobs
+
+    def _run_job(self, worker: _Worker, job: _Job):
+        future = job.future
+        if not future.set_running_or_notify_cancel():
+            return
+        now = time.monotonic()
+        wait = now - job.submitted
+        if now >= job.deadline:
+            self._fail(future, OCRJobTimeout("OCR 대기 시간이 제한 시간을 초과했습니다"), timeout=True)
+            return
+
+        try:
+            worker.conn.send((id(job), job.data))
+            reply = worker.conn.recv() if worker.conn.poll(job.deadline - now) else None
+        except (EOFError, OSError):
+            process = worker.process
+            self._restart(worker, graceful=False)
+            worker.crashes += 1
+            worker.last_error = f"작업 처리 중 비정상 종료 (exitcode={process.exitcode})"
+            self._fail(future, OCRWorkerCrashed("OCR 워커가 이미지 처리 중 비정상 종료되었습니다"))
+            return
+
+        if reply is None:
+            worker.last_error = "제한 시간 초과로 재시작"
+            self._restart(worker, graceful=False)
+            self._fail(future, OCRJobTimeout("OCR 처리 시간이 제한 시간을 초과했습니다"), timeout=True)
+            return
+
+        status, _, payload, inference, rss, engine_stats = reply
+        worker.jobs += 1
+        worker.jobs_since_start += 1
+        worker.rss = rss
+        worker.engine_stats = engine_stats
+        self._record(wait, inference)
+        if status == "ok":
+            with self._cond:
+                self.completed += 1
+            future.set_result(payload)
+        else:
+            self._fail(future, OCRWorkerError(payload))
+
+    def _fail(self, future: Future, error: Exception, timeout: bool = False):
+        with self._cond:
+            self.failed += 1
+            if timeout:
+                self.timeouts += 1
+        future.set_exception(error)
+
+    def _record(self, wait: float, inference: float):
+        with self._cond:
+            if self._measured:
+                self._avg_wait += self.EWMA_ALPHA * (wait - self._avg_wait)
+                self._avg_inference += self.EWMA_ALPHA * (inference - self._avg_inference)
+            else:
+                self._avg_wait, self._avg_inference = wait, inference
+            self._max_wait = max(self._max_wait, wait)
+            self._max_inference = max(self._max_inference, inference)
+            self._measured += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "ready": self.ready_workers(),
+                "queued": len(self._heap),
+                "max_queue": self.max_queue,
+                "timeout_s": self.timeout,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "timeouts": self.timeouts,
+                "rejected": self.rejected,
+                "restarts": sum(w.restarts for w in self._workers),
+                "crashes": sum(w.crashes for w in self._workers),
+                "avg_queue_wait_ms": round(self._avg_wait * 1000, 2),
+                "max_queue_wait_ms": round(self._max_wait * 1000, 2),
+                "avg_inference_ms": round(self._avg_inference * 1000, 2),
+                "max_inference_ms": round(self._max_inference * 1000, 2),
+                "worker_status": [w.stats() for w in self._workers],
+            }
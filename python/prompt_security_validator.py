@@ -5,11 +5,15 @@
 
 import re
 import json
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+import hashlib
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Optional
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 from datetime import datetime
 
+from keyword_matcher import KeywordMatcher
+from jsonl_log import JsonlLogWriter
+
 
 class SecurityLevel(Enum):
     """보안 등급"""
@@ -30,6 +34,13 @@ class ViolationType(Enum):
     SYSTEM_INFO = "시스템정보"
 
 
+class MaskingPolicy(Enum):
+    """마스킹 정책"""
+    FULL = "전체"                  # 구간 전체를 '***'로 치환
+    PARTIAL = "부분"               # 앞/뒤 일부만 남기고 문자·숫자 마스킹
+    FORMAT_PRESERVING = "형식유지"  # 길이·구분자 유지, 문자·숫자만 마스킹
+
+
 @dataclass
 class RegulationReference:
     """관련 법규 참조 정보"""
@@ -47,6 +58,7 @@ class SecurityViolation:
     matched_text: str
     position: Tuple[int, int]
     severity: int  # 1-10
+    rule_name: str = ""  # 탐지 규칙명 (패턴명 또는 키워드 규칙명)
 
 
 @dataclass
@@ -63,10 +75,39 @@ class ValidationResult:
     regulation_refs: List[RegulationReference] = None
 
 
+@dataclass
+class StreamSummary:
+    """스트리밍 검증 최종 요약 (원문/위반 목록은 보관하지 않음)"""
+    is_safe: bool
+    security_level: SecurityLevel
+    risk_score: int
+    violation_count: int
+    type_counts: Dict[ViolationType, int]
+    total_length: int
+    timestamp: str
+    recommendation: str
+    regulation_refs: List[RegulationReference] = None
+
+
+@dataclass
+class StreamSegment:
+    """스트리밍 검증 구간 결과"""
+    offset: int                          # sanitized_text의 원문 기준 시작 위치
+    sanitized_text: str                  # 확정된 마스킹 텍스트 조각
+    violations: List[SecurityViolation]  # 이번 구간에서 확정된 위반사항 (원문 기준 위치)
+    summary: Optional[StreamSummary] = None  # 마지막 구간에만 설정
+
+
 class KEPCOPromptSecurityValidator:
     """한국전력공사 프롬프트 보안 검증기"""
 
-    def __init__(self):
+    def __init__(self, fused_scan: bool = False, cache=None):
+        # fused_scan: 전체 패턴을 하나의 정규식으로 결합해 1차 스캔 (결과 동일)
+        self.fused_scan = fused_scan
+        # cache: 검증 결과 캐시 (result_cache.ValidationCache, 선택)
+        self.cache = cache
+        # save_log 파일 경로별 JSON Lines 기록기
+        self._log_writers: Dict[str, JsonlLogWriter] = {}
         self._init_patterns()
         self._init_keywords()
         self._init_rules()
@@ -203,6 +244,54 @@ class KEPCOPromptSecurityValidator:
             ),
         }
 
+        # 패턴 매칭에 반드시 필요한 리터럴 (하나도 없으면 해당 패턴 스캔 생략)
+        self.pattern_required_literals = {
+            '이메일주소': ('@',),
+            'IP주소': ('.',),
+            'MAC주소': (':', '-'),
+            'URL경로': ('://',),
+            '비밀번호패턴': (':', '='),
+            'API키패턴': (':', '='),
+            '지번주소': ('번지',),
+            '구체적금액_억': ('억',),
+            '구체적금액_원': ('원',),
+            '변전소구체위치': ('변전소',),
+            '발전소구체위치': ('화력', '원자력', '수력'),
+            '전력량수치': ('w', 'W'),
+            '임직원명': ('사장', '전무', '상무', '이사', '부장', '차장', '과장', '대리', '주임'),
+            '부서명상세': ('부', '실', '팀', '센터'),
+        }
+        self._compile_patterns()
+
+    def _compile_patterns(self):
+        """정규식 패턴 사전 컴파일 (검증 시 재컴파일/캐시 조회 제거)
+
+        - _compiled_patterns: (패턴명, 컴파일 정규식, 유형, 심각도, 필수 리터럴)
+          탐지 순서 = self.patterns 순서
+        - _fused_pattern: 전체 패턴을 이름 그룹(p0, p1, ...)으로 결합한 단일 정규식
+        """
+        self._compiled_patterns = [
+            (
+                pattern_name,
+                re.compile(regex, re.IGNORECASE),
+                vtype,
+                severity,
+                self.pattern_required_literals.get(pattern_name, ()),
+            )
+            for pattern_name, (regex, vtype, severity) in self.patterns.items()
+        ]
+        self._pattern_version = hashlib.sha256(repr([
+            (name, regex, vtype.name, severity)
+            for name, (regex, vtype, severity) in self.patterns.items()
+        ]).encode()).hexdigest()[:12]
+        self._fused_pattern = re.compile(
+            '|'.join(
+                f'(?P<p{i}>{regex})'
+                for i, (regex, _, _) in enumerate(self.patterns.values())
+            ),
+            re.IGNORECASE
+        )
+
     def _init_keywords(self):
         """키워드 기반 탐지 목록 초기화"""
         self.keyword_rules = {
@@ -276,6 +365,63 @@ class KEPCOPromptSecurityValidator:
                 'severity': 10
             }
         }
+        self._build_keyword_matcher()
+
+    def _build_keyword_matcher(self):
+        """키워드 규칙 → 다중 키워드 매처 구축 (검증 시 텍스트 1회 스캔)"""
+        matcher = KeywordMatcher()
+        for rule_name, rule in self.keyword_rules.items():
+            for keyword in rule['keywords']:
+                matcher.add(keyword, (rule_name, rule['type'], rule['severity']))
+        self.keyword_matcher = matcher
+        self._keyword_version = hashlib.sha256(repr([
+            (rule_name, rule['keywords'], rule['type'].name, rule['severity'])
+            for rule_name, rule in self.keyword_rules.items()
+        ]).encode()).hexdigest()[:12]
+
+    @property
+    def ruleset_version(self) -> str:
+        """컴파일된 탐지 규칙(패턴+키워드) 버전 - 규칙 재구축 시 변경됨"""
+        return f"{self._pattern_version}{self._keyword_version}"
+
+    def add_keyword_rule(self, rule_name: str, keywords: List[str],
+                         vtype: ViolationType, severity: int):
+        """
+        사용자 정의 키워드 규칙 추가 (변전소명, 내부 시스템 코드 등)
+
+        같은 이름의 규칙이 있으면 키워드를 추가하고 유형/심각도를 갱신
+        """
+        rule = self.keyword_rules.setdefault(
+            rule_name, {'keywords': [], 'type': vtype, 'severity': severity}
+        )
+        rule['keywords'].extend(keywords)
+        rule['type'] = vtype
+        rule['severity'] = severity
+        self._build_keyword_matcher()
+
+    def set_keyword_rules(self, keyword_rules: Dict[str, Dict[str, Any]]):
+        """키워드 규칙 전체 교체 (프로세스 풀 워커에 주 프로세스의 규칙 반영)"""
+        self.keyword_rules = {
+            rule_name: {'keywords': list(rule['keywords']), 'type': rule['type'], 'severity': rule['severity']}
+            for rule_name, rule in keyword_rules.items()
+        }
+        self._build_keyword_matcher()
+
+    def load_keyword_dictionary(self, filepath: str, rule_name: str,
+                                vtype: ViolationType, severity: int) -> int:
+        """
+        키워드 사전 파일 적재 (UTF-8, 한 줄에 키워드 1개, '#'으로 시작하는 줄은 주석)
+
+        Returns:
+            int: 적재된 키워드 수
+        """
+        with open(filepath, 'r', encoding='utf-8') as f:
+            keywords = [
+                line.strip() for line in f
+                if line.strip() and not line.lstrip().startswith('#')
+            ]
+        self.add_keyword_rule(rule_name, keywords, vtype, severity)
+        return len(keywords)
 
     def _init_rules(self):
         """검증 규칙 초기화"""
@@ -287,6 +433,26 @@ class KEPCOPromptSecurityValidator:
             SecurityLevel.BLOCKED: 60
         }
 
+        # 위반 유형별 가중치
+        self.type_weights = {
+            ViolationType.PERSONAL_INFO: 1.5,
+            ViolationType.CONFIDENTIAL: 1.4,
+            ViolationType.SYSTEM_INFO: 1.3,
+            ViolationType.TECHNICAL_INFO: 1.2,
+            ViolationType.FINANCIAL: 1.1,
+            ViolationType.ORGANIZATION: 1.0,
+            ViolationType.LOCATION: 1.0,
+        }
+
+        # 스트리밍 검증 시 단일 매칭의 최대 길이 (청크 간 겹침 구간 크기)
+        # 이보다 긴 매칭(공백 없는 초장문 URL 등)은 구간 경계에서 분할될 수 있음
+        self.stream_max_match_length = 1024
+
+        # 위반 유형별 마스킹 정책 (미지정 유형은 default_masking_policy)
+        # 겹치는 위반이 병합된 구간에는 가장 강한 정책 적용 (전체 > 부분 > 형식유지)
+        self.default_masking_policy = MaskingPolicy.FULL
+        self.masking_policies: Dict[ViolationType, MaskingPolicy] = {}
+
     def _init_regulation_map(self):
         """위반유형별 법규 매핑 초기화"""
         self.regulation_map: Dict[ViolationType, List[RegulationReference]] = {
@@ -446,10 +612,14 @@ class KEPCOPromptSecurityValidator:
 
     def _get_regulation_refs(self, violations: List[SecurityViolation]) -> List[RegulationReference]:
         """위반사항에 해당하는 법규 참조 목록을 반환 (중복 제거)"""
+        return self._get_regulation_refs_for_types(v.type for v in violations)
+
+    def _get_regulation_refs_for_types(self, vtypes: Iterable[ViolationType]) -> List[RegulationReference]:
+        """위반유형 목록에 해당하는 법규 참조 목록을 반환 (중복 제거)"""
         seen = set()
         refs = []
-        for v in violations:
-            for ref in self.regulation_map.get(v.type, []):
+        for vtype in vtypes:
+            for ref in self.regulation_map.get(vtype, []):
                 key = (ref.law, ref.article)
                 if key not in seen:
                     seen.add(key)
@@ -459,16 +629,27 @@ class KEPCOPromptSecurityValidator:
     def _find_pattern_violations(self, text: str) -> List[SecurityViolation]:
         """패턴 기반 위반사항 탐지"""
         violations = []
-
-        for pattern_name, (regex, vtype, severity) in self.patterns.items():
-            matches = re.finditer(regex, text, re.IGNORECASE)
-            for match in matches:
+        start_pos = 0
+
+        if self.fused_scan:
+            # 결합 정규식으로 1회 스캔: 어떤 패턴도 맞지 않으면 즉시 종료
+            # 첫 매칭 위치 이전에는 어떤 패턴도 시작할 수 없으므로 이후 구간만 개별 스캔
+            first = self._fused_pattern.search(text)
+            if first is None:
+                return violations
+            start_pos = first.start()
+
+        for pattern_name, compiled, vtype, severity, literals in self._compiled_patterns:
+            if literals and not any(lit in text for lit in literals):
+                continue
+            for match in compiled.finditer(text, start_pos):
                 violations.append(SecurityViolation(
                     type=vtype,
                     description=f"{pattern_name} 탐지",
                     matched_text=match.group(),
                     position=(match.start(), match.end()),
-                    severity=severity
+                    severity=severity,
+                    rule_name=pattern_name
                 ))
 
         return violations
@@ -476,25 +657,17 @@ class KEPCOPromptSecurityValidator:
     def _find_keyword_violations(self, text: str) -> List[SecurityViolation]:
         """키워드 기반 위반사항 탐지"""
         violations = []
-        text_lower = text.lower()
-
-        for rule_name, rule in self.keyword_rules.items():
-            for keyword in rule['keywords']:
-                keyword_lower = keyword.lower()
-                pos = 0
-                while True:
-                    idx = text_lower.find(keyword_lower, pos)
-                    if idx == -1:
-                        break
 
-                    violations.append(SecurityViolation(
-                        type=rule['type'],
-                        description=f"{rule_name}: '{keyword}' 키워드 발견",
-                        matched_text=text[idx:idx+len(keyword)],
-                        position=(idx, idx+len(keyword)),
-                        severity=rule['severity']
-                    ))
-                    pos = idx + 1
+        for entry_id, start, end in self.keyword_matcher.find_all(text):
+            keyword, (rule_name, vtype, severity) = self.keyword_matcher.entry(entry_id)
+            violations.append(SecurityViolation(
+                type=vtype,
+                description=f"{rule_name}: '{keyword}' 키워드 발견",
+                matched_text=text[start:end],
+                position=(start, end),
+                severity=severity,
+                rule_name=rule_name
+            ))
 
         return violations
 
@@ -503,27 +676,22 @@ class KEPCOPromptSecurityValidator:
         if not violations:
             return 0
 
-        # 심각도 합계
-        total_severity = sum(v.severity for v in violations)
-
-        # 위반 유형별 가중치
-        type_weights = {
-            ViolationType.PERSONAL_INFO: 1.5,
-            ViolationType.CONFIDENTIAL: 1.4,
-            ViolationType.SYSTEM_INFO: 1.3,
-            ViolationType.TECHNICAL_INFO: 1.2,
-            ViolationType.FINANCIAL: 1.1,
-            ViolationType.ORGANIZATION: 1.0,
-            ViolationType.LOCATION: 1.0,
-        }
-
+        # 위반 유형별 가중치 적용
         weighted_score = sum(
-            v.severity * type_weights.get(v.type, 1.0)
+            v.severity * self.type_weights.get(v.type, 1.0)
             for v in violations
         )
 
+        return self._risk_score_from_totals(weighted_score, len(violations))
+
+    @staticmethod
+    def _risk_score_from_totals(weighted_score: float, violation_count: int) -> int:
+        """가중 심각도 합계 + 위반 건수 → 위험도 점수"""
+        if not violation_count:
+            return 0
+
         # 위반 건수에 따른 추가 점수
-        count_penalty = min(len(violations) * 2, 20)
+        count_penalty = min(violation_count * 2, 20)
 
         return min(int(weighted_score + count_penalty), 100)
 
@@ -538,27 +706,78 @@ class KEPCOPromptSecurityValidator:
         else:
             return SecurityLevel.SAFE
 
-    def _sanitize_prompt(self, text: str, violations: List[SecurityViolation]) -> str:
-        """민감정보 마스킹 처리"""
-        sanitized = text
-
-        # 위치 기준 역순 정렬 (뒤에서부터 치환)
-        sorted_violations = sorted(
-            violations,
-            key=lambda v: v.position[0],
-            reverse=True
+    def _violation_span(self, v: SecurityViolation) -> Tuple[int, int, MaskingPolicy]:
+        """위반사항 → (시작, 끝, 마스킹 정책)"""
+        return (v.position[0], v.position[1],
+                self.masking_policies.get(v.type, self.default_masking_policy))
+
+    def _merge_violation_spans(
+        self, violations: List[SecurityViolation]
+    ) -> List[Tuple[int, int, MaskingPolicy]]:
+        """위반 구간 병합 (겹치는 구간은 하나로 합치고 가장 강한 정책 적용)"""
+        return self._merge_spans(sorted(self._violation_span(v) for v in violations))
+
+    @staticmethod
+    def _merge_spans(
+        spans: List[Tuple[int, int, MaskingPolicy]]
+    ) -> List[Tuple[int, int, MaskingPolicy]]:
+        """시작 위치순 정렬된 구간 병합"""
+        strength = {
+            MaskingPolicy.FORMAT_PRESERVING: 0,
+            MaskingPolicy.PARTIAL: 1,
+            MaskingPolicy.FULL: 2,
+        }
+
+        merged: List[Tuple[int, int, MaskingPolicy]] = []
+        for start, end, policy in spans:
+            if merged and start < merged[-1][1]:
+                prev_start, prev_end, prev_policy = merged[-1]
+                if strength[policy] > strength[prev_policy]:
+                    prev_policy = policy
+                merged[-1] = (prev_start, max(prev_end, end), prev_policy)
+            else:
+                merged.append((start, end, policy))
+        return merged
+
+    @staticmethod
+    def _mask_span(segment: str, policy: MaskingPolicy) -> str:
+        """구간 마스킹"""
+        if policy == MaskingPolicy.FULL:
+            return "***"
+
+        # 부분 마스킹: 앞/뒤 1/4(최대 4자)만 노출
+        keep = min(len(segment) // 4, 4) if policy == MaskingPolicy.PARTIAL else 0
+        last = len(segment) - keep
+        return ''.join(
+            ch if i < keep or i >= last or not ch.isalnum() else '*'
+            for i, ch in enumerate(segment)
         )
 
-        for violation in sorted_violations:
-            start, end = violation.position
-            # 간단한 별표 마스킹 처리
-            mask = "***"
-            sanitized = sanitized[:start] + mask + sanitized[end:]
+    def _sanitize_prompt(self, text: str, violations: List[SecurityViolation]) -> str:
+        """민감정보 마스킹 처리 (구간 병합 후 1회 조립)"""
+        parts = []
+        cursor = 0
+
+        for start, end, policy in self._merge_violation_spans(violations):
+            parts.append(text[cursor:start])
+            parts.append(self._mask_span(text[start:end], policy))
+            cursor = end
 
-        return sanitized
+        parts.append(text[cursor:])
+        return ''.join(parts)
 
     def _generate_recommendation(self, level: SecurityLevel, violations: List[SecurityViolation]) -> str:
         """권장사항 생성"""
+        # 위반 유형별 그룹화
+        type_counts = {}
+        for v in violations:
+            type_counts[v.type] = type_counts.get(v.type, 0) + 1
+
+        return self._recommendation_from_counts(level, type_counts, len(violations))
+
+    def _recommendation_from_counts(self, level: SecurityLevel,
+                                    type_counts: Dict[ViolationType, int], total: int) -> str:
+        """보안 등급 + 유형별 위반 건수 → 권장사항"""
         if level == SecurityLevel.SAFE:
             return "프롬프트를 안전하게 사용할 수 있습니다."
 
@@ -571,12 +790,7 @@ class KEPCOPromptSecurityValidator:
         else:
             recommendations.append("⚡ 주의 필요: 보안 위험 요소가 있습니다.")
 
-        # 위반 유형별 그룹화
-        type_counts = {}
-        for v in violations:
-            type_counts[v.type] = type_counts.get(v.type, 0) + 1
-
-        recommendations.append(f"\n탐지된 위반사항: 총 {len(violations)}건")
+        recommendations.append(f"\n탐지된 위반사항: 총 {total}건")
         for vtype, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
             recommendations.append(f"  - {vtype.value}: {count}건")
 
@@ -589,11 +803,77 @@ class KEPCOPromptSecurityValidator:
 
     def validate(self, prompt: str) -> ValidationResult:
         """프롬프트 보안 검증 실행"""
-        # 위반사항 탐지
+        if self.cache is None:
+            return self._build_result(prompt, self._detect_violations(prompt))
+
+        key = self.cache.make_key(prompt, self.ruleset_version)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._build_result(prompt, self._decode_violations(prompt, cached))
+
+        violations = self._detect_violations(prompt)
+        self.cache.put(key, self._encode_violations(violations))
+        return self._build_result(prompt, violations)
+
+    def assess(self, violations: List[SecurityViolation]) -> Tuple[int, SecurityLevel]:
+        """위반사항 목록 → (위험도 점수, 보안 등급) - 여러 구간(페이지 등) 결과를 누적 평가할 때 사용"""
+        risk_score = self._calculate_risk_score(violations)
+        return risk_score, self._determine_security_level(risk_score)
+
+    def merge_results(self, results: List[ValidationResult], separator: str = "\n\n") -> ValidationResult:
+        """
+        구간별 검증 결과 → 이어 붙인 전체 텍스트 기준 결과
+
+        구간을 separator로 연결하고 위반 위치를 전체 텍스트 기준으로 옮겨 점수·등급·마스킹을 다시 산출
+        (구간 경계를 넘는 매칭은 탐지하지 않음)
+        """
+        parts: List[str] = []
+        violations: List[SecurityViolation] = []
+        offset = 0
+        for i, result in enumerate(results):
+            if i:
+                parts.append(separator)
+                offset += len(separator)
+            violations.extend(
+                replace(v, position=(v.position[0] + offset, v.position[1] + offset))
+                for v in result.violations
+            )
+            parts.append(result.original_prompt)
+            offset += len(result.original_prompt)
+        return self._build_result("".join(parts), violations)
+
+    def _detect_violations(self, prompt: str) -> List[SecurityViolation]:
+        """위반사항 탐지 (패턴 → 키워드 순)"""
         pattern_violations = self._find_pattern_violations(prompt)
         keyword_violations = self._find_keyword_violations(prompt)
-        all_violations = pattern_violations + keyword_violations
+        return pattern_violations + keyword_violations
+
+    @staticmethod
+    def _encode_violations(violations: List[SecurityViolation]) -> str:
+        """캐시 저장용 직렬화 (탐지 문자열은 제외 - 위치만 보관)"""
+        return json.dumps(
+            [[v.type.name, v.description, v.position[0], v.position[1], v.severity, v.rule_name] for v in violations],
+            ensure_ascii=False,
+            separators=(',', ':'),
+        )
 
+    @staticmethod
+    def _decode_violations(prompt: str, data: str) -> List[SecurityViolation]:
+        """캐시 값 → 위반사항 (탐지 문자열은 프롬프트에서 복원)"""
+        return [
+            SecurityViolation(
+                type=ViolationType[vtype],
+                description=description,
+                matched_text=prompt[start:end],
+                position=(start, end),
+                severity=severity,
+                rule_name=rule_name[0] if rule_name else ""
+            )
+            for vtype, description, start, end, severity, *rule_name in json.loads(data)
+        ]
+
+    def _build_result(self, prompt: str, all_violations: List[SecurityViolation]) -> ValidationResult:
+        """탐지된 위반사항 → 검증 결과 (점수/등급/마스킹/권장사항)"""
         # 위험도 평가
         risk_score = self._calculate_risk_score(all_violations)
         security_level = self._determine_security_level(risk_score)
@@ -622,8 +902,38 @@ class KEPCOPromptSecurityValidator:
             regulation_refs=regulation_refs
         )
 
-    def save_log(self, result: ValidationResult, filepath: str = "security_log.json"):
-        """검증 결과 로그 저장"""
+    def open_stream(self) -> 'StreamValidation':
+        """청크 단위 검증 세션 생성 (feed/close 방식)"""
+        return StreamValidation(self)
+
+    def validate_stream(self, chunks: Iterable[str]) -> Iterator[StreamSegment]:
+        """
+        스트리밍 프롬프트 보안 검증
+
+        청크를 순서대로 받아 확정된 위반사항과 마스킹 텍스트를 구간별로 반환.
+        최대 매칭 길이(stream_max_match_length)만큼만 겹쳐서 보관하므로
+        입력 길이와 무관하게 메모리 사용량이 일정함. 마지막 구간에 summary 포함.
+
+        Args:
+            chunks: 텍스트 청크 iterable
+
+        Yields:
+            StreamSegment
+        """
+        stream = self.open_stream()
+        for chunk in chunks:
+            yield from stream.feed(chunk)
+        yield from stream.close()
+
+    def save_log(self, result: ValidationResult, filepath: str = "security_log.jsonl"):
+        """
+        검증 결과 로그 저장 (JSON Lines 추가 기록 - 호출당 비용 일정)
+
+        파일 형식이 JSON 배열에서 JSON Lines(1건 1줄)로 바뀌어 기본 경로도 security_log.json →
+        security_log.jsonl로 변경. 이전 기본 파일(security_log.json)은 그대로 남으며, 그 경로를 filepath로
+        넘기면 기존 배열 파일은 보관 파일로 옮겨지고 jsonl_log.iter_log_entries로 함께 조회.
+        파일별 기록기를 재사용하며 버퍼링·회전 설정은 jsonl_log.JsonlLogWriter.from_env 참조
+        """
         log_entry = {
             'timestamp': result.timestamp,
             'security_level': result.security_level.value,
@@ -641,21 +951,200 @@ class KEPCOPromptSecurityValidator:
         }
 
         try:
-            # 기존 로그 읽기
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    logs = json.load(f)
-            except FileNotFoundError:
-                logs = []
-
-            logs.append(log_entry)
-
-            # 로그 저장
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(logs, f, ensure_ascii=False, indent=2)
+            writer = self._log_writers.get(filepath)
+            if writer is None:
+                writer = self._log_writers[filepath] = JsonlLogWriter.from_env(filepath)
+            writer.write(log_entry)
         except Exception as e:
             print(f"로그 저장 실패: {e}")
 
+    def close_logs(self):
+        """save_log 기록기의 남은 버퍼 기록 후 종료 (프로세스 종료 시에는 자동 수행)"""
+        for writer in self._log_writers.values():
+            writer.close()
+        self._log_writers.clear()
+
+
+class StreamValidation:
+    """
+    청크 단위 검증 세션
+
+    - 매칭 최대 길이 L만큼의 꼬리 구간을 다음 청크와 겹쳐 재검사
+    - 시작 위치가 (버퍼 끝 - L) 이전인 위반사항만 확정 → L 이하 매칭은 전체 검증과 동일
+    - 패턴별로 직전 매칭 끝 위치부터 이어서 탐색 (finditer의 비중첩 규칙 유지)
+    - 위반 목록 순서는 구간 순서 기준 (전체 검증의 패턴별 순서와 다름)
+    """
+
+    def __init__(self, validator: KEPCOPromptSecurityValidator):
+        self.validator = validator
+        self.max_match_length = max(
+            validator.stream_max_match_length,
+            validator.keyword_matcher.max_keyword_length,
+            1,
+        )
+
+        self._buffer = ""
+        self._buffer_offset = 0     # 버퍼 첫 글자의 원문 기준 위치
+        self._committed = 0         # 이 위치 이전에 시작하는 위반사항은 확정됨
+        self._output_pos = 0        # 마스킹 텍스트 출력 완료 위치
+        self._pending_spans: List[Tuple[int, int, MaskingPolicy]] = []
+        self._pattern_resume: Dict[str, int] = {}
+        self._closed = False
+
+        # 요약용 누적값
+        self._weighted_score = 0.0
+        self._violation_count = 0
+        self._type_counts: Dict[ViolationType, int] = {}
+        # 유형별 최초 탐지 규칙 순번 (전체 검증과 같은 유형 순서로 요약하기 위함)
+        self._type_rank: Dict[ViolationType, int] = {}
+
+    def feed(self, chunk: str) -> List[StreamSegment]:
+        """청크 추가. 확정된 구간이 있으면 반환"""
+        if self._closed:
+            raise RuntimeError("이미 종료된 스트림입니다")
+        if not chunk:
+            return []
+
+        self._buffer += chunk
+        buffer_end = self._buffer_offset + len(self._buffer)
+        if buffer_end - self._committed < 2 * self.max_match_length:
+            return []
+        return [self._process(buffer_end - self.max_match_length)]
+
+    def close(self) -> List[StreamSegment]:
+        """입력 종료. 남은 구간과 최종 요약 반환"""
+        if self._closed:
+            return []
+        self._closed = True
+
+        segment = self._process(self._buffer_offset + len(self._buffer), final=True)
+        segment.summary = self._build_summary()
+        return [segment]
+
+    def _scan(self, boundary: int) -> List[SecurityViolation]:
+        """[committed, boundary) 구간에서 시작하는 위반사항 탐지"""
+        v = self.validator
+        text = self._buffer
+        base = self._buffer_offset
+        violations = []
+
+        scan_from = self._committed
+        if v.fused_scan:
+            first = v._fused_pattern.search(text, self._committed - base)
+            scan_from = boundary if first is None else first.start() + base
+
+        if scan_from < boundary:
+            for rank, (pattern_name, compiled, vtype, severity, literals) in enumerate(v._compiled_patterns):
+                if literals and not any(lit in text for lit in literals):
+                    continue
+                pos = max(self._pattern_resume.get(pattern_name, 0), scan_from) - base
+                for match in compiled.finditer(text, pos):
+                    start = match.start() + base
+                    if start >= boundary:
+                        break
+                    end = match.end() + base
+                    violations.append(SecurityViolation(
+                        type=vtype,
+                        description=f"{pattern_name} 탐지",
+                        matched_text=match.group(),
+                        position=(start, end),
+                        severity=severity,
+                        rule_name=pattern_name
+                    ))
+                    self._pattern_resume[pattern_name] = end
+                    self._update_type_rank(vtype, rank)
+
+        for entry_id, start, end in v.keyword_matcher.find_all(text):
+            start += base
+            if not self._committed <= start < boundary:
+                continue
+            end += base
+            keyword, (rule_name, vtype, severity) = v.keyword_matcher.entry(entry_id)
+            violations.append(SecurityViolation(
+                type=vtype,
+                description=f"{rule_name}: '{keyword}' 키워드 발견",
+                matched_text=text[start - base:end - base],
+                position=(start, end),
+                severity=severity,
+                rule_name=rule_name
+            ))
+            self._update_type_rank(vtype, len(v._compiled_patterns) + entry_id)
+
+        return violations
+
+    def _update_type_rank(self, vtype: ViolationType, rank: int):
+        if rank < self._type_rank.get(vtype, rank + 1):
+            self._type_rank[vtype] = rank
+
+    def _process(self, boundary: int, final: bool = False) -> StreamSegment:
+        """boundary 이전 구간 확정 → 위반사항/마스킹 텍스트 산출 후 버퍼 정리"""
+        v = self.validator
+        text = self._buffer
+        base = self._buffer_offset
+
+        violations = self._scan(boundary)
+        for item in violations:
+            self._weighted_score += item.severity * v.type_weights.get(item.type, 1.0)
+            self._type_counts[item.type] = self._type_counts.get(item.type, 0) + 1
+        self._violation_count += len(violations)
+
+        # 새 구간은 모두 보류 구간 이후에 시작하므로 이어 붙여 병합
+        spans = self._pending_spans + sorted(v._violation_span(item) for item in violations)
+        merged = v._merge_spans(spans)
+
+        # 이후 위반사항은 boundary 이후에 시작 → 끝이 boundary 이하인 구간만 확정 출력
+        offset = self._output_pos
+        parts = []
+        self._pending_spans = []
+        for i, (start, end, policy) in enumerate(merged):
+            if end > boundary and not final:
+                self._pending_spans = merged[i:]
+                break
+            parts.append(text[self._output_pos - base:start - base])
+            parts.append(v._mask_span(text[start - base:end - base], policy))
+            self._output_pos = end
+
+        flush_to = self._pending_spans[0][0] if self._pending_spans else boundary
+        if flush_to > self._output_pos:
+            parts.append(text[self._output_pos - base:flush_to - base])
+            self._output_pos = flush_to
+
+        self._committed = boundary
+
+        # 버퍼 정리: 미출력 구간과 단어 경계(\b) 판정용 1글자만 유지
+        keep_from = max(min(self._output_pos, boundary - 1), base)
+        self._buffer = text[keep_from - base:]
+        self._buffer_offset = keep_from
+
+        return StreamSegment(
+            offset=offset,
+            sanitized_text=''.join(parts),
+            violations=violations,
+        )
+
+    def _build_summary(self) -> StreamSummary:
+        v = self.validator
+        risk_score = v._risk_score_from_totals(self._weighted_score, self._violation_count)
+        security_level = v._determine_security_level(risk_score)
+        type_counts = {
+            vtype: self._type_counts[vtype]
+            for vtype in sorted(self._type_counts, key=self._type_rank.get)
+        }
+
+        return StreamSummary(
+            is_safe=security_level == SecurityLevel.SAFE,
+            security_level=security_level,
+            risk_score=risk_score,
+            violation_count=self._violation_count,
+            type_counts=type_counts,
+            total_length=self._buffer_offset + len(self._buffer),
+            timestamp=datetime.now().isoformat(),
+            recommendation=v._recommendation_from_counts(
+                security_level, type_counts, self._violation_count
+            ),
+            regulation_refs=v._get_regulation_refs_for_types(type_counts),
+        )
+
 
 def print_validation_result(result: ValidationResult):
     """검증 결과 출력"""
@@ -0,0 +1,219 @@
+"""
+프롬프트 검증 결과 캐시
+동일 프롬프트 재검증 시 규칙 스캔을 생략하기 위한 내용 주소(content-addressed) 캐시
+
+- 키: 규칙셋 버전 + 프롬프트 SHA-256 (규칙 변경 시 이전 항목은 자동으로 무효)
+- 값: 위반사항 위치/유형 정보만 보관 (원문·탐지 문자열 미보관 - 보안)
+- 메모리: 바이트 크기 기반 LRU + TTL
+- 공유 백엔드(선택): SQLite 파일 - 여러 uvicorn 워커/프로세스가 함께 사용
+
+사용법:
+    cache = ValidationCache.from_env()
+    validator = KEPCOPromptSecurityValidator(cache=cache)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class SQLiteCacheBackend:
+    """SQLite 파일 기반 공유 캐시 (TTL + 크기 상한, 오래된 항목부터 삭제)"""
+
+    # 이 횟수만큼 저장할 때마다 만료/용량 정리
+    CLEANUP_INTERVAL = 200
+
+    def __init__(self, path: str, max_bytes: int, ttl_seconds: float):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._puts = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS validation_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_expires ON validation_cache(expires_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM validation_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, value: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO validation_cache (key, value, size, expires_at) VALUES (?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), time.time() + self.ttl_seconds),
+            )
+            self._conn.commit()
+            self._puts += 1
+            if self._puts % self.CLEANUP_INTERVAL == 0:
+                self._cleanup()
+
+    def _cleanup(self):
+        """만료 항목 삭제 후 용량 초과분을 만료 임박 순으로 삭제"""
+        self._conn.execute("DELETE FROM validation_cache WHERE expires_at <= ?", (time.time(),))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM validation_cache").fetchone()[0]
+        if total > self.max_bytes:
+            excess = total - self.max_bytes
+            rows = self._conn.execute(
+                "SELECT key, size FROM validation_cache ORDER BY expires_at ASC"
+            )
+            doomed = []
+            for key, size in rows:
+                if excess <= 0:
+                    break
+                doomed.append((key,))
+                excess -= size
+            self._conn.executemany("DELETE FROM validation_cache WHERE key = ?", doomed)
+        self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM validation_cache")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ValidationCache:
+    """바이트 크기 기반 LRU + TTL 메모리 캐시 (선택적 공유 백엔드)"""
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 3600,
+        backend: Optional[SQLiteCacheBackend] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend
+        self._lock = threading.Lock()
+        # key → (만료시각, 값, 바이트 크기)
+        self._entries: "OrderedDict[str, Tuple[float, str, int]]" = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.backend_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls) -> Optional["ValidationCache"]:
+        """
+        환경변수 기반 생성 (VALIDATION_CACHE_MAX_MB=0 이면 비활성화)
+
+        - VALIDATION_CACHE_MAX_MB: 메모리 캐시 용량 (기본 64)
+        - VALIDATION_CACHE_TTL: 항목 유효시간(초, 기본 3600)
+        - VALIDATION_CACHE_DB: 공유 SQLite 캐시 파일 경로 (미설정 시 프로세스 내 캐시만 사용)
+        - VALIDATION_CACHE_DB_MAX_MB: 공유 캐시 용량 (기본 256)
+        """
+        max_mb = float(os.getenv("VALIDATION_CACHE_MAX_MB", "64"))
+        if max_mb <= 0:
+            return None
+
+        ttl = float(os.getenv("VALIDATION_CACHE_TTL", "3600"))
+        backend = None
+        db_path = os.getenv("VALIDATION_CACHE_DB")
+        if db_path:
+            db_max_mb = float(os.getenv("VALIDATION_CACHE_DB_MAX_MB", "256"))
+            backend = SQLiteCacheBackend(db_path, int(db_max_mb * 1024 * 1024), ttl)
+
+        return cls(max_bytes=int(max_mb * 1024 * 1024), ttl_seconds=ttl, backend=backend)
+
+    @staticmethod
+    def make_key(prompt: str, ruleset_version: str) -> str:
+        """캐시 키: 규칙셋 버전 + 프롬프트 해시"""
+        digest = hashlib.sha256(prompt.encode("utf-8", "surrogatepass")).hexdigest()
+        return f"{ruleset_version}:{digest}"
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value, _ = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._remove(key)
+
+        if self.backend is not None:
+            value = self.backend.get(key)
+            if value is not None:
+                with self._lock:
+                    self.backend_hits += 1
+                    self._store(key, value, now)
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value: str):
+        with self._lock:
+            self._store(key, value, time.time())
+        if self.backend is not None:
+            self.backend.put(key, value)
+
+    def _store(self, key: str, value: str, now: float):
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (now + self.ttl_seconds, value, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.backend_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "backend_hits": self.backend_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round((self.hits + self.backend_hits) / lookups, 4) if lookups else 0.0,
+            "shared_backend": self.backend.path if self.backend else None,
+        }
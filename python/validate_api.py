@@ -3,12 +3,25 @@
 """
 KEPCO 프롬프트 보안 검증 API
 stdin으로 JSON 입력을 받아 검증하고 stdout으로 JSON 결과를 반환
+
+상주 모드 (--serve):
+    프로세스를 한 번 띄워 두고 검증기를 재사용 (호출마다 인터프리터 기동·규칙 초기화 없음)
+    - 입력: 한 줄에 요청 1건 {"id": ..., "prompt": "..."} (응답을 기다리지 않고 연속 전송 가능)
+    - 출력: 한 줄에 응답 1건 {"id": ..., "success": true, ...검증 결과..., "elapsed_ms": ...}
+    - --workers N: N개 워커 프로세스로 분산 (응답은 완료 순서, id로 대응)
+    - 워커 프로세스가 비정상 종료되면 영향받은 요청은 success: false로 응답하고 풀을 다시 만들어 계속 처리
+    - stdin EOF 시 처리 중인 요청의 응답을 모두 쓴 뒤 종료
+
+    $ python validate_api.py --serve --workers 4
 """
 
 import sys
 import json
 import os
 import io
+import argparse
+import threading
+from concurrent.futures.process import BrokenProcessPool
 
 # Windows에서 UTF-8 강제 설정
 if sys.platform == 'win32':
@@ -23,6 +36,106 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from prompt_security_validator import KEPCOPromptSecurityValidator
 
 
+# 워커 모드에서 워커당 동시에 맡길 최대 요청 수 (초과 시 stdin 읽기 대기)
+MAX_PENDING_PER_WORKER = 64
+
+WORKER_DIED_ERROR = '검증 워커 프로세스가 비정상 종료되었습니다. 다시 시도하세요'
+
+
+def _write_line(data, lock=None):
+    line = json.dumps(data, ensure_ascii=False)
+    if lock is None:
+        print(line, flush=True)
+    else:
+        with lock:
+            print(line, flush=True)
+
+
+def _to_response(request_id, item):
+    """validation_pool.validate_item 결과 → 응답 1줄 (검증 결과 필드는 단건 모드와 같은 평면 구조)"""
+    response = {"id": request_id, "success": item["success"]}
+    if item["success"]:
+        response.update(item["result"])
+    else:
+        response["error"] = item["error"]
+    response["elapsed_ms"] = item["elapsed_ms"]
+    return response
+
+
+def _parse_request(line):
+    """요청 1줄 → (id, prompt). 형식 오류 시 (id, None, 오류 메시지)"""
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError as e:
+        return None, None, f'JSON 파싱 오류: {str(e)}'
+    if not isinstance(data, dict):
+        return None, None, '요청은 JSON 객체여야 합니다'
+    return data.get('id'), data.get('prompt', ''), None
+
+
+def serve(workers=0):
+    """
+    상주 모드: stdin의 줄 단위 JSON 요청을 계속 읽어 줄 단위 JSON 응답 출력
+
+    Args:
+        workers: 0이면 현재 프로세스에서 순서대로 처리, N이면 프로세스 풀로 분산
+    """
+    from validation_pool import ValidationPool, validate_chunk, validate_item
+
+    if workers <= 0:
+        validator = KEPCOPromptSecurityValidator()
+        print('ready', file=sys.stderr, flush=True)
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            request_id, prompt, error = _parse_request(line)
+            if error:
+                _write_line({'id': request_id, 'success': False, 'error': error})
+                continue
+            _write_line(_to_response(request_id, validate_item(validator, prompt)))
+        return
+
+    pool = ValidationPool(max_workers=workers)
+    output_lock = threading.Lock()
+    pending = threading.BoundedSemaphore(workers * MAX_PENDING_PER_WORKER)
+
+    def on_done(request_id, future):
+        try:
+            item = future.result()[0]
+            _write_line(_to_response(request_id, item), output_lock)
+        except BrokenProcessPool:
+            _write_line({'id': request_id, 'success': False, 'error': WORKER_DIED_ERROR}, output_lock)
+        except Exception as e:
+            _write_line({'id': request_id, 'success': False, 'error': f'검증 오류: {str(e)}'}, output_lock)
+        finally:
+            pending.release()
+
+    print('ready', file=sys.stderr, flush=True)
+    try:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            request_id, prompt, error = _parse_request(line)
+            if error:
+                _write_line({'id': request_id, 'success': False, 'error': error}, output_lock)
+                continue
+            pending.acquire()
+            try:
+                future = pool.executor.submit(validate_chunk, [prompt])
+            except BrokenProcessPool as e:
+                # 워커 비정상 종료로 풀이 깨진 경우: 이 요청은 오류로 응답하고 풀을 새로 만들어 계속 처리
+                pending.release()
+                print(f'검증 워커 비정상 종료, 풀 재시작: {e}', file=sys.stderr, flush=True)
+                pool.shutdown(wait=False)
+                pool = ValidationPool(max_workers=workers)
+                _write_line({'id': request_id, 'success': False, 'error': WORKER_DIED_ERROR}, output_lock)
+                continue
+            future.add_done_callback(lambda f, rid=request_id: on_done(rid, f))
+    finally:
+        # EOF 이후에도 이미 받은 요청은 모두 처리해 응답 (취소하지 않음)
+        pool.shutdown(wait=True, cancel_futures=False)
+
+
 def main():
     try:
         # stdin에서 JSON 입력 읽기
@@ -91,4 +204,11 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='KEPCO 프롬프트 보안 검증 (stdin JSON → stdout JSON)')
+    parser.add_argument('--serve', action='store_true', help='상주 모드 (줄 단위 JSON 요청/응답)')
+    parser.add_argument('--workers', type=int, default=0, help='상주 모드 워커 프로세스 수 (0: 단일 프로세스)')
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.workers)
+    else:
+        main()
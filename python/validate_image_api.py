@@ -3,18 +3,207 @@
 """
 이미지 OCR + 보안 검증 API
 커맨드라인 인자로 이미지 경로를 받아 분석하고 JSON 결과 반환
+
+다건 모드 (경로 여러 개 / glob / 디렉터리 / --stdin):
+    OCR 엔진은 한 번만 적재하고 워커 스레드(--workers)가 함께 사용
+    - 출력: 이미지 1건당 JSON 1줄 (완료 순서), 마지막 줄에 처리량 요약 {"summary": {...}}
+    - --stdin: 한 줄에 경로 1건 ({"path": "...", "id": ...} JSON 또는 경로 문자열)
+
+    $ python validate_image_api.py scans/ --recursive --workers 4
+    $ python validate_image_api.py "fax/*.png" a.jpg
+    $ find fax -name '*.tif' | python validate_image_api.py --stdin
+
+PDF·TIFF는 페이지 단위로 OCR·검증해 결과에 pages(페이지별 결과)와 document 요약 포함
 """
 
 import sys
 import json
 import os
+import argparse
+import glob
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # 상대 경로 설정
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from document_pages import document_to_dict
 from image_analyzer import ImageSecurityAnalyzer
 
 
+# 워커당 동시에 맡길 최대 이미지 수 (초과 시 입력 읽기 대기)
+MAX_PENDING_PER_WORKER = 4
+
+
+def _write_line(data, lock=None):
+    line = json.dumps(data, ensure_ascii=False)
+    if lock is None:
+        print(line, flush=True)
+    else:
+        with lock:
+            print(line, flush=True)
+
+
+def _build_result(analysis_result):
+    """ImageAnalysisResult → JSON 결과"""
+    validation = analysis_result.validation_result
+    return {
+        'success': True,
+        'extracted_text': analysis_result.extracted_text,
+        'ocr_confidence': round(analysis_result.ocr_confidence, 2),
+        'image_size': {
+            'width': analysis_result.image_size[0],
+            'height': analysis_result.image_size[1]
+        },
+        'file_size': analysis_result.file_size,
+
+        # 검증 결과
+        'is_safe': validation.is_safe,
+        'security_level': validation.security_level.value,
+        'risk_score': validation.risk_score,
+        'violations': [
+            {
+                'type': v.type.value,
+                'description': v.description,
+                'matched_text': v.matched_text,
+                'position': list(v.position),
+                'severity': v.severity
+            }
+            for v in validation.violations
+        ],
+        'sanitized_prompt': validation.sanitized_prompt,
+        'original_prompt': validation.original_prompt,
+        'recommendation': validation.recommendation,
+        'timestamp': validation.timestamp
+    }
+
+
+def _build_document_result(document_result, file_size):
+    """DocumentAnalysisResult → JSON 결과 (이미지 결과와 같은 필드 + document / pages)"""
+    return {'success': True, 'file_size': file_size, **document_to_dict(document_result)}
+
+
+def _analyze_path(analyzer, path):
+    """이미지 / 다중 페이지 문서 분석 → JSON 결과"""
+    if analyzer.is_document(path):
+        return _build_document_result(analyzer.analyze_document(path), os.path.getsize(path))
+    return _build_result(analyzer.analyze_image(path))
+
+
+def _create_analyzer():
+    """분석기 초기화 (실패 시 오류 출력 후 종료)"""
+    try:
+        return ImageSecurityAnalyzer()
+    except Exception as e:
+        result = {
+            'error': f'OCR 엔진 초기화 실패: {str(e)}. RapidOCR이 설치되어 있는지 확인하세요. (pip install rapidocr-onnxruntime)',
+            'success': False,
+        }
+        print(json.dumps(result, ensure_ascii=False))
+        sys.exit(1)
+
+
+def iter_targets(patterns, analyzer, recursive=False):
+    """
+    인자(파일 / glob / 디렉터리) → (id, 경로) 순차 반환
+
+    디렉터리는 지원 형식 이미지만 포함, 일치하는 파일이 없는 인자는 그대로 반환해 오류로 보고
+    """
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            if recursive:
+                for root, dirs, files in os.walk(pattern):
+                    dirs.sort()
+                    for name in sorted(files):
+                        path = os.path.join(root, name)
+                        if analyzer.is_supported_format(path):
+                            yield None, path
+            else:
+                for entry in sorted(os.scandir(pattern), key=lambda e: e.name):
+                    if entry.is_file() and analyzer.is_supported_format(entry.path):
+                        yield None, entry.path
+        elif glob.has_magic(pattern):
+            matches = sorted(glob.iglob(pattern, recursive=recursive))
+            if not matches:
+                yield None, pattern
+            for path in matches:
+                if os.path.isfile(path):
+                    yield None, path
+        else:
+            yield None, pattern
+
+
+def iter_stdin_targets():
+    """stdin 줄 단위 JSON → (id, 경로)"""
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            # JSON이 아니면 경로 문자열로 취급
+            yield None, line
+            continue
+        if isinstance(data, dict):
+            yield data.get('id'), data.get('path', '')
+        else:
+            yield None, str(data)
+
+
+def run_batch(analyzer, targets, workers=1):
+    """
+    다건 분석 - 결과는 완료되는 대로 JSON 1줄씩 출력, 끝에 처리량 요약
+
+    Returns:
+        실패 건수
+    """
+    output_lock = threading.Lock()
+    pending = threading.BoundedSemaphore(max(1, workers) * MAX_PENDING_PER_WORKER)
+    counts = {'total': 0, 'succeeded': 0, 'failed': 0, 'bytes': 0}
+    start = time.perf_counter()
+
+    def analyze(request_id, path):
+        item_start = time.perf_counter()
+        try:
+            result = _analyze_path(analyzer, path)
+        except Exception as e:
+            result = {'success': False, 'error': f'이미지 분석 오류: {str(e)}'}
+        result['path'] = path
+        if request_id is not None:
+            result['id'] = request_id
+        result['elapsed_ms'] = round((time.perf_counter() - item_start) * 1000, 2)
+        with output_lock:
+            counts['succeeded' if result['success'] else 'failed'] += 1
+            counts['bytes'] += result.get('file_size', 0)
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+
+    def release(_):
+        pending.release()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='ocr') as executor:
+        for request_id, path in targets:
+            pending.acquire()
+            counts['total'] += 1
+            executor.submit(analyze, request_id, path).add_done_callback(release)
+
+    elapsed = time.perf_counter() - start
+    _write_line({
+        'summary': {
+            'total': counts['total'],
+            'succeeded': counts['succeeded'],
+            'failed': counts['failed'],
+            'workers': max(1, workers),
+            'elapsed_s': round(elapsed, 3),
+            'images_per_sec': round(counts['total'] / elapsed, 2) if elapsed > 0 else None,
+            'mb_per_sec': round(counts['bytes'] / 1024 / 1024 / elapsed, 2) if elapsed > 0 else None,
+        }
+    }, output_lock)
+    return counts['failed']
+
+
 def main():
     try:
         # 커맨드라인 인자 확인
@@ -38,52 +227,10 @@ def main():
             sys.exit(1)
 
         # 분석기 초기화
-        try:
-            analyzer = ImageSecurityAnalyzer()
-        except Exception as e:
-            result = {
-                'error': f'OCR 엔진 초기화 실패: {str(e)}. RapidOCR이 설치되어 있는지 확인하세요. (pip install rapidocr-onnxruntime)',
-                'success': False,
-            }
-            print(json.dumps(result, ensure_ascii=False))
-            sys.exit(1)
+        analyzer = _create_analyzer()
 
-        # 이미지 분석 실행
-        analysis_result = analyzer.analyze_image(image_path)
-
-        # 검증 결과
-        validation = analysis_result.validation_result
-
-        # JSON 결과 생성
-        result = {
-            'success': True,
-            'extracted_text': analysis_result.extracted_text,
-            'ocr_confidence': round(analysis_result.ocr_confidence, 2),
-            'image_size': {
-                'width': analysis_result.image_size[0],
-                'height': analysis_result.image_size[1]
-            },
-            'file_size': analysis_result.file_size,
-            
-            # 검증 결과
-            'is_safe': validation.is_safe,
-            'security_level': validation.security_level.value,
-            'risk_score': validation.risk_score,
-            'violations': [
-                {
-                    'type': v.type.value,
-                    'description': v.description,
-                    'matched_text': v.matched_text,
-                    'position': list(v.position),
-                    'severity': v.severity
-                }
-                for v in validation.violations
-            ],
-            'sanitized_prompt': validation.sanitized_prompt,
-            'original_prompt': validation.original_prompt,
-            'recommendation': validation.recommendation,
-            'timestamp': validation.timestamp
-        }
+        # 이미지 분석 실행 (PDF·TIFF는 페이지 단위)
+        result = _analyze_path(analyzer, image_path)
 
         # stdout으로 JSON 출력
         print(json.dumps(result, ensure_ascii=False))
@@ -98,11 +245,36 @@ def main():
         sys.exit(1)
 
 
+def batch_main(argv):
+    parser = argparse.ArgumentParser(description='이미지 OCR + 보안 검증 (다건 모드: JSON Lines 출력)')
+    parser.add_argument('paths', nargs='*', help='이미지 파일 / glob 패턴 / 디렉터리')
+    parser.add_argument('--stdin', action='store_true', help='stdin에서 줄 단위 JSON 경로 읽기')
+    parser.add_argument('--recursive', action='store_true', help='디렉터리·** glob 하위 폴더 포함')
+    parser.add_argument('--workers', type=int, default=int(os.getenv('OCR_BATCH_WORKERS', '2')),
+                        help='동시 처리 워커 스레드 수 (OCR 엔진은 1개 공유)')
+    args = parser.parse_args(argv)
+    if not args.paths and not args.stdin:
+        parser.error('이미지 경로 또는 --stdin이 필요합니다')
+
+    analyzer = _create_analyzer()
+    targets = iter_stdin_targets() if args.stdin else iter_targets(args.paths, analyzer, args.recursive)
+    if args.stdin and args.paths:
+        targets = itertools.chain(iter_targets(args.paths, analyzer, args.recursive), targets)
+    failed = run_batch(analyzer, targets, args.workers)
+    sys.exit(1 if failed else 0)
+
+
 if __name__ == '__main__':
     # Windows UTF-8 인코딩 설정
     if sys.platform == 'win32':
         import codecs
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.detach())
         sys.stderr = codecs.getwriter('utf-8')(sys.stderr.detach())
-    
-    main()
+
+    # 기존 호출 방식(이미지 파일 1개)은 단일 JSON 결과 유지
+    argv = sys.argv[1:]
+    if not argv or (len(argv) == 1 and not argv[0].startswith('-')
+                    and not os.path.isdir(argv[0]) and not glob.has_magic(argv[0])):
+        main()
+    else:
+        batch_main(argv)
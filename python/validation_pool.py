@@ -0,0 +1,163 @@
+"""
+프롬프트 다건 검증 프로세스 풀
+검증 엔진은 순수 파이썬(GIL 제약)이므로 프로세스마다 검증기를 1회 생성해 두고 분산 처리
+
+사용법:
+    pool = ValidationPool(max_workers=4)
+    items = pool.validate_many(["프롬프트1", "프롬프트2"])
+    pool.shutdown()
+"""
+
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from prompt_security_validator import (
+    KEPCOPromptSecurityValidator, MaskingPolicy, SecurityViolation, ValidationResult, ViolationType,
+)
+from result_cache import ValidationCache
+
+
+# 워커 프로세스별 검증기 (initializer에서 1회 생성)
+_worker_validator: Optional[KEPCOPromptSecurityValidator] = None
+
+
+def violation_to_dict(v: SecurityViolation) -> Dict[str, Any]:
+    """SecurityViolation → API 응답용 dict"""
+    return {
+        "type": v.type.value,
+        "description": v.description,
+        "matched_text": v.matched_text,
+        "position": list(v.position),
+        "severity": v.severity,
+        "rule_name": v.rule_name
+    }
+
+
+def result_to_dict(result: ValidationResult) -> Dict[str, Any]:
+    """ValidationResult → API 응답용 dict"""
+    return {
+        "is_safe": result.is_safe,
+        "security_level": result.security_level.value,
+        "risk_score": result.risk_score,
+        "violations": [violation_to_dict(v) for v in result.violations],
+        "sanitized_prompt": result.sanitized_prompt,
+        "original_prompt": result.original_prompt,
+        "timestamp": result.timestamp,
+        "recommendation": result.recommendation,
+        "regulation_refs": [
+            {
+                "law": r.law,
+                "article": r.article,
+                "description": r.description,
+                "source": r.source
+            }
+            for r in (result.regulation_refs or [])
+        ]
+    }
+
+
+def validate_item(validator: KEPCOPromptSecurityValidator, prompt: str) -> Dict[str, Any]:
+    """
+    단건 검증 (오류는 예외 대신 항목 결과로 반환)
+
+    Returns:
+        {"success": True, "result": {...}, "elapsed_ms": int}
+        {"success": False, "error": str, "elapsed_ms": int}
+    """
+    start = time.perf_counter()
+    try:
+        if not isinstance(prompt, str) or not prompt.strip():
+            raise ValueError("프롬프트가 비어있습니다")
+        item = {"success": True, "result": result_to_dict(validator.validate(prompt))}
+    except Exception as e:
+        item = {"success": False, "error": str(e)}
+    item["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    return item
+
+
+def worker_config_version(validator: KEPCOPromptSecurityValidator) -> str:
+    """워커에 복제되는 검증기 설정(탐지 규칙 + 마스킹 정책) 버전 - 바뀌면 풀을 다시 만들어야 함"""
+    masking = sorted((vtype.name, policy.name) for vtype, policy in validator.masking_policies.items())
+    digest = hashlib.sha256(repr((validator.default_masking_policy.name, masking)).encode()).hexdigest()[:8]
+    return f"{validator.ruleset_version}{digest}"
+
+
+def _init_worker(keyword_rules: Optional[Dict[str, Dict[str, Any]]] = None,
+                 masking_policies: Optional[Dict[ViolationType, MaskingPolicy]] = None,
+                 default_masking_policy: Optional[MaskingPolicy] = None):
+    """
+    워커 프로세스 초기화 (검증기 1회 생성, 공유 캐시 설정 시 함께 사용)
+
+    Args:
+        keyword_rules: 주 프로세스 검증기의 키워드 규칙 (add_keyword_rule·load_keyword_dictionary 반영분 포함)
+        masking_policies: 주 프로세스 검증기의 유형별 마스킹 정책
+        default_masking_policy: 주 프로세스 검증기의 기본 마스킹 정책
+    """
+    global _worker_validator
+    _worker_validator = KEPCOPromptSecurityValidator(cache=ValidationCache.from_env())
+    if keyword_rules is not None:
+        _worker_validator.set_keyword_rules(keyword_rules)
+    if masking_policies is not None:
+        _worker_validator.masking_policies = dict(masking_policies)
+    if default_masking_policy is not None:
+        _worker_validator.default_masking_policy = default_masking_policy
+
+
+def validate_chunk(prompts: List[str]) -> List[Dict[str, Any]]:
+    """워커에서 프롬프트 묶음 검증"""
+    if _worker_validator is None:
+        _init_worker()
+    return [validate_item(_worker_validator, p) for p in prompts]
+
+
+class ValidationPool:
+    """프롬프트 검증 프로세스 풀"""
+
+    # 워커당 최소 묶음 크기 (IPC 왕복 비용 상쇄)
+    MIN_CHUNK_SIZE = 8
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 validator: Optional[KEPCOPromptSecurityValidator] = None):
+        """
+        Args:
+            validator: 키워드 규칙·마스킹 정책을 워커에 복제할 주 프로세스 검증기 (없으면 기본 설정)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # 워커에 반영된 설정 버전 (worker_config_version과 다르면 풀을 다시 만들어야 함)
+        self.config_version = worker_config_version(validator) if validator else None
+        initargs = ()
+        if validator is not None:
+            # 워커는 첫 작업 제출 시 기동되므로 생성 시점의 규칙·정책을 복사해 전달
+            keyword_rules = {
+                rule_name: dict(rule, keywords=list(rule['keywords']))
+                for rule_name, rule in validator.keyword_rules.items()
+            }
+            initargs = (keyword_rules, dict(validator.masking_policies), validator.default_masking_policy)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=initargs,
+        )
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        return self._executor
+
+    def split(self, prompts: List[str]) -> List[List[str]]:
+        """워커 수에 맞춰 입력 순서를 유지한 묶음으로 분할"""
+        target = max(self.MIN_CHUNK_SIZE, -(-len(prompts) // (self.max_workers * 4)))
+        return [prompts[i:i + target] for i in range(0, len(prompts), target)]
+
+    def validate_many(self, prompts: List[str]) -> List[Dict[str, Any]]:
+        """다건 검증 (입력 순서 유지)"""
+        results: List[Dict[str, Any]] = []
+        for chunk_result in self._executor.map(validate_chunk, self.split(prompts)):
+            results.extend(chunk_result)
+        return results
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """풀 종료 (기본: 대기 중인 작업까지 처리 후 종료, cancel_futures=True면 시작 전 작업 취소)"""
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
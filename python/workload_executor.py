@@ -0,0 +1,111 @@
+"""
+작업 유형별 실행기 (텍스트 검증 / OCR / LLM 교정)
+CPU·블로킹 작업을 이벤트 루프 밖의 스레드 풀에서 실행하고, 대기열이 가득 차면 즉시 거절
+
+- 유형별 동시 실행 수(max_concurrency)와 대기 허용 수(max_queue) 분리 설정
+- 한도 초과 시 WorkloadRejected → API에서 429 + Retry-After 응답
+- 실행 시간 지수이동평균으로 Retry-After 추정
+
+사용법:
+    ocr = WorkloadExecutor("ocr", max_concurrency=2, max_queue=8)
+    text = await ocr.run(engine.extract_text, path)
+"""
+
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict
+
+
+class WorkloadRejected(Exception):
+    """작업 대기열 초과"""
+
+    def __init__(self, workload: str, retry_after: int):
+        super().__init__(f"{workload} 작업 대기열이 가득 찼습니다. {retry_after}초 후 다시 시도하세요.")
+        self.workload = workload
+        self.retry_after = retry_after
+
+
+class WorkloadExecutor:
+    """작업 유형별 제한 실행기"""
+
+    # 실행 시간 지수이동평균 가중치
+    EWMA_ALPHA = 0.2
+
+    def __init__(self, name: str, max_concurrency: int, max_queue: int):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix=f"workload-{name}",
+        )
+        # 이벤트 루프 스레드에서만 변경되므로 별도 잠금 불필요
+        self._inflight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._avg_duration = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """동시 실행 + 대기 허용 총량"""
+        return self.max_concurrency + self.max_queue
+
+    def retry_after(self) -> int:
+        """대기열이 빌 때까지의 예상 시간 (초, 최소 1)"""
+        waves = self._inflight / self.max_concurrency
+        return max(1, math.ceil(self._avg_duration * waves))
+
+    def acquire(self):
+        """실행 슬롯 확보 (초과 시 WorkloadRejected)"""
+        if self._inflight >= self.capacity:
+            self._rejected += 1
+            raise WorkloadRejected(self.name, self.retry_after())
+        self._inflight += 1
+
+    def release(self):
+        self._inflight -= 1
+
+    @contextmanager
+    def slot(self):
+        """여러 작업을 하나의 슬롯으로 묶어 실행 (스트리밍 검증 등)"""
+        self.acquire()
+        try:
+            yield self
+        finally:
+            self.release()
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """슬롯 확보 후 스레드 풀에서 실행"""
+        with self.slot():
+            return await self.run_in_slot(fn, *args, **kwargs)
+
+    async def run_in_slot(self, fn: Callable, *args, **kwargs) -> Any:
+        """이미 확보한 슬롯 안에서 스레드 풀 실행"""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+        finally:
+            duration = time.perf_counter() - start
+            if self._completed:
+                self._avg_duration += self.EWMA_ALPHA * (duration - self._avg_duration)
+            else:
+                self._avg_duration = duration
+            self._completed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "inflight": self._inflight,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_duration_ms": round(self._avg_duration * 1000, 2),
+        }
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,46 @@
+"""
+테스트 공통 설정
+python/ 모듈을 API·CLI와 같은 방식(sys.path 추가)으로 임포트
+"""
+
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+PYTHON_DIR = os.path.join(ROOT, "python")
+
+if PYTHON_DIR not in sys.path:
+    sys.path.insert(0, PYTHON_DIR)
+
+API_DIR = os.path.join(ROOT, "api")
+
+# 감사로그 DB는 임시 경로 (audit_logger.DB_PATH는 임포트 시점에 정해지므로 테스트 모듈 임포트 전에 설정)
+_AUDIT_DIR = tempfile.mkdtemp(prefix="audit-log-test-")
+atexit.register(shutil.rmtree, _AUDIT_DIR, ignore_errors=True)
+os.environ["AUDIT_LOG_DB"] = os.path.join(_AUDIT_DIR, "audit_log.db")
+
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def api_module():
+    """api/main.py (OCR은 API 프로세스 안에서 실행, OCR 캐시 미사용)"""
+    os.environ.setdefault("OCR_WORKERS", "0")
+    os.environ.setdefault("OCR_CACHE_MAX_MB", "0")
+    os.environ.setdefault("VALIDATE_BATCH_WORKERS", "2")
+    if API_DIR not in sys.path:
+        sys.path.insert(0, API_DIR)
+    import main
+    return main
+
+
+@pytest.fixture
+def api_client(api_module):
+    from fastapi.testclient import TestClient
+
+    with TestClient(api_module.app) as client:
+        yield client
@@ -0,0 +1,56 @@
+"""/validate/batch 프로세스 풀 (워커 비정상 종료 복구, 키워드 규칙·마스킹 정책 전달)"""
+
+import os
+import signal
+import time
+
+from prompt_security_validator import MaskingPolicy, ViolationType
+
+
+def _batch(client, prompts):
+    response = client.post("/validate/batch", json={"prompts": prompts})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_batch_recovers_after_worker_crash(api_client, api_module):
+    prompts = [f"회의록 {i}번 정리" for i in range(20)]
+    assert _batch(api_client, prompts)["succeeded"] == 20
+
+    pool = api_module.app_state.validation_pool
+    for pid in list(pool.executor._processes):
+        os.kill(pid, signal.SIGKILL)
+    time.sleep(0.2)
+
+    body = _batch(api_client, prompts)
+    assert body["count"] == 20
+    assert all(not item["success"] and "워커" in item["error"] for item in body["results"])
+    assert api_module.app_state.validation_pool is not pool
+
+    assert _batch(api_client, prompts)["succeeded"] == 20
+
+
+def test_batch_workers_use_runtime_keyword_rules(api_client, api_module):
+    validator = api_module.app_state.validator
+    validator.add_keyword_rule("test_substations", ["가나다변전소"], ViolationType.CONFIDENTIAL, 9)
+    try:
+        body = _batch(api_client, ["가나다변전소 점검 일정"] * 20)
+        rules = {v["rule_name"] for item in body["results"] for v in item["result"]["violations"]}
+        assert body["succeeded"] == 20
+        assert "test_substations" in rules
+    finally:
+        del validator.keyword_rules["test_substations"]
+        validator._build_keyword_matcher()
+
+
+def test_batch_workers_use_runtime_masking_policy(api_client, api_module):
+    validator = api_module.app_state.validator
+    prompt = "연락처 010-1234-5678 입니다"
+    validator.masking_policies[ViolationType.PERSONAL_INFO] = MaskingPolicy.FORMAT_PRESERVING
+    try:
+        single = api_client.post("/validate", json={"prompt": prompt}).json()["result"]
+        body = _batch(api_client, [prompt] * 20)
+        assert "***-****-****" in single["sanitized_prompt"]
+        assert {item["result"]["sanitized_prompt"] for item in body["results"]} == {single["sanitized_prompt"]}
+    finally:
+        del validator.masking_policies[ViolationType.PERSONAL_INFO]
@@ -0,0 +1,69 @@
+"""/validate/stream 응답 스트리밍과 텍스트 실행기 슬롯 반환"""
+
+import asyncio
+import json
+
+from starlette.requests import Request
+
+
+def _stream_request(body: bytes) -> Request:
+    chunks = [{"type": "http.request", "body": body, "more_body": False}]
+
+    async def receive():
+        return chunks.pop(0) if chunks else {"type": "http.disconnect"}
+
+    scope = {
+        "type": "http", "method": "POST", "path": "/validate/stream", "headers": [],
+        "query_string": b"", "http_version": "1.1", "scheme": "http",
+        "server": ("test", 80), "client": ("test", 1234), "root_path": "",
+    }
+    return Request(scope, receive)
+
+
+def test_stream_returns_segments_and_summary(api_client, api_module):
+    text_workload = api_module.app_state.workloads["text"]
+    response = api_client.post("/validate/stream", content="연락처 010-1234-5678 입니다".encode("utf-8"))
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[-1]["type"] == "summary"
+    assert lines[-1]["violation_count"] >= 1
+    assert text_workload.stats()["inflight"] == 0
+
+
+def test_stream_slot_released_when_send_fails_before_start(api_client, api_module):
+    # 응답 시작 전에 연결이 끊겨 본문 생성기가 시작되지 않아도 슬롯이 반환되어야 함
+    text_workload = api_module.app_state.workloads["text"]
+    before = text_workload.stats()["inflight"]
+
+    async def broken_send(message):
+        raise OSError("client disconnected")
+
+    async def run():
+        request = _stream_request("010-1234-5678".encode("utf-8"))
+        response = await api_module.validate_prompt_stream(request)
+        assert text_workload.stats()["inflight"] == before + 1
+        try:
+            await response(request.scope, request.receive, broken_send)
+        except OSError:
+            pass
+
+    for _ in range(text_workload.capacity + 1):
+        asyncio.run(run())
+    assert text_workload.stats()["inflight"] == before
+
+
+def test_stream_audit_log_counts_all_violations_and_caps_sample(api_client, api_module, monkeypatch):
+    logged = []
+    monkeypatch.setattr(api_module, "log_validation", lambda **kwargs: logged.append(kwargs))
+    monkeypatch.setattr(api_module, "STREAM_LOG_MAX_VIOLATIONS", 5)
+    body = "".join(f"연락처 010-1234-{i:04d} 입니다.\n" for i in range(50)).encode("utf-8")
+    response = api_client.post("/validate/stream", content=body)
+
+    summary = json.loads(response.text.splitlines()[-1])
+    result = logged[0]["result"]
+    assert summary["violation_count"] >= 50
+    assert len(result["violations"]) == 5
+    counts = {(c["type"], c["rule_name"]): c["count"] for c in result["violation_rule_counts"]}
+    assert sum(counts.values()) == summary["violation_count"]
+    assert counts[("개인정보", "휴대전화번호")] == 50
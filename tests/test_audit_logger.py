@@ -0,0 +1,226 @@
+"""감사로그 파티션 이관·보관기간 정리·키셋 페이지네이션·대시보드 집계·내보내기 이어받기"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import audit_logger
+
+
+@pytest.fixture
+def audit_db(tmp_path, monkeypatch):
+    """임시 경로의 빈 감사로그 DB (API 세션의 커넥션 풀·기록기와 분리)"""
+    monkeypatch.setattr(audit_logger, "DB_PATH", str(tmp_path / "audit_log.db"))
+    monkeypatch.setattr(audit_logger, "_pool", None)
+    monkeypatch.setattr(audit_logger, "_writer", None)
+    yield audit_logger
+    audit_logger.close_db()
+
+
+def _write(timestamps, level="경고", risk_score=40, response_time_ms=None):
+    result = {
+        "security_level": level, "risk_score": risk_score, "is_safe": level == "안전",
+        "violations": [] if level == "안전" else [
+            {"type": "개인정보", "rule_name": "주민등록번호", "description": "주민등록번호 탐지", "severity": 3}
+        ],
+    }
+    rows = []
+    for ts in timestamps:
+        row = audit_logger._build_log_row("prompt", result, response_time_ms=response_time_ms)
+        rows.append((ts,) + row[1:])
+    with audit_logger.get_db() as conn:
+        audit_logger._write_rows(conn, rows)
+
+
+def _logs(conn):
+    rows = []
+    for p in audit_logger._load_partitions(conn):
+        rows += conn.execute(f"SELECT timestamp FROM validation_logs_{p['name']}").fetchall()
+    return sorted(r[0] for r in rows)
+
+
+def test_retention_trims_partition_straddling_cutoff(audit_db, monkeypatch):
+    audit_db.init_db()
+    _write(["2026-05-10 09:00:00", "2026-06-05 09:00:00", "2026-06-14 23:59:59",
+            "2026-06-15 00:00:00", "2026-06-25 09:00:00"])
+    monkeypatch.setattr(audit_db, "_retention_cutoff", lambda: "2026-06-15 00:00:00")
+
+    worker = audit_db.RetentionWorker(pause=0, batch=1)
+    assert worker.run_once() == 3
+    assert worker.dropped_partitions == 1
+    assert worker.trimmed_rows == 2
+
+    with audit_db.get_db() as conn:
+        assert _logs(conn) == ["2026-06-15 00:00:00", "2026-06-25 09:00:00"]
+        assert [p["name"] for p in audit_db._load_partitions(conn)] == ["p20260601"]
+        assert audit_db._count_logs(conn, None, "cached") == 2
+        assert audit_db._count_logs(conn, "경고", "cached") == 2
+        assert conn.execute("SELECT COUNT(*) FROM log_violations_p20260601").fetchone()[0] == 2
+        ids = conn.execute("SELECT MIN(id), MAX(id) FROM validation_logs_p20260601").fetchone()
+        partition = conn.execute("SELECT min_id, max_id FROM log_partitions").fetchone()
+        assert tuple(partition) == tuple(ids)
+
+    assert worker.run_once() == 0
+
+
+def test_legacy_logs_migrated_into_partitions(audit_db):
+    with audit_db.get_db() as conn:
+        conn.execute(f"CREATE TABLE validation_logs (id INTEGER PRIMARY KEY, {audit_db._LEGACY_LOG_COLUMNS})")
+        conn.executemany(f"""
+            INSERT INTO validation_logs (id, {audit_db._LEGACY_LOG_COLUMNS})
+            VALUES (?, ?, NULL, 'text', 'hash', 10, ?, 40, 0, 1, '["개인정보"]', NULL, '[]', NULL, NULL, 5)
+        """, [
+            (3, "2026-08-31 23:00:00", "경고"),
+            (7, "2026-09-01 01:00:00", "위험"),
+            (8, "2026-09-20 12:00:00", "경고"),
+        ])
+    audit_db.init_db()
+
+    with audit_db.get_db() as conn:
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert "validation_logs" not in tables
+        partitions = {p["name"]: p for p in audit_db._load_partitions(conn)}
+        assert set(partitions) == {"p20260801", "p20260901"}
+        assert (partitions["p20260901"]["min_id"], partitions["p20260901"]["max_id"]) == (7, 8)
+        assert audit_db._count_logs(conn, None, "cached") == 3
+        assert audit_db._count_logs(conn, "위험", "cached") == 1
+        assert audit_db._find_log(conn, 3)["timestamp"] == "2026-08-31 23:00:00"
+
+    # 이관 후 새 로그 ID는 기존 ID 이후부터 발급
+    _write(["2026-09-21 10:00:00"])
+    with audit_db.get_db() as conn:
+        assert conn.execute("SELECT MAX(id) FROM validation_logs_p20260901").fetchone()[0] == 9
+
+
+def test_legacy_violation_details_kept_after_migration(audit_db):
+    details = '[{"type": "개인정보", "description": "휴대전화번호 탐지", "severity": 8}]'
+    with audit_db.get_db() as conn:
+        conn.execute(f"CREATE TABLE validation_logs (id INTEGER PRIMARY KEY, {audit_db._LEGACY_LOG_COLUMNS})")
+        conn.executemany(f"""
+            INSERT INTO validation_logs (id, {audit_db._LEGACY_LOG_COLUMNS})
+            VALUES (?, '2026-09-01 01:00:00', NULL, 'text', 'hash', 10, '경고', 40, 0, 1, '["개인정보"]', ?, '[]', NULL, NULL, 5)
+        """, [(1, details), (2, "not json")])
+    audit_db.init_db()
+
+    with audit_db.get_db() as conn:
+        kept = conn.execute("SELECT id, violation_details FROM validation_logs_p20260901 ORDER BY id").fetchall()
+        assert [tuple(r) for r in kept] == [(1, details), (2, "not json")]
+    assert audit_db.get_log_detail(1)["violation_details"] == [
+        {"type": "개인정보", "rule_name": "휴대전화번호", "description": "휴대전화번호 탐지", "severity": 8}
+    ]
+
+
+def test_keyset_pagination_walks_partitions_in_order(audit_db):
+    audit_db.init_db()
+    # 같은 시각 로그 포함, 두 파티션에 걸침
+    timestamps = [f"2026-08-{d:02d} 10:00:00" for d in (28, 29, 30, 30, 31)]
+    timestamps += [f"2026-09-{d:02d} 09:00:00" for d in (1, 1, 2, 3, 4, 5, 6)]
+    _write(timestamps[:6])
+    _write(timestamps[6:], level="위험")
+
+    everything = audit_db.get_recent_logs(limit=100)["logs"]
+    expected = sorted(((r["timestamp"], r["id"]) for r in everything), reverse=True)
+    assert [(r["timestamp"], r["id"]) for r in everything] == expected
+    assert len(expected) == len(timestamps)
+
+    seen, cursor = [], None
+    while True:
+        page = audit_db.get_recent_logs(limit=5, cursor=cursor)
+        seen += [(r["timestamp"], r["id"]) for r in page["logs"]]
+        assert page["total"] == len(timestamps)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+    # offset 방식 (파티션째 건너뛰기 포함)과 before_id 방식도 같은 순서
+    assert [(r["timestamp"], r["id"]) for r in audit_db.get_recent_logs(limit=4, offset=7)["logs"]] == expected[7:11]
+    before = audit_db.get_recent_logs(limit=3, before_id=expected[4][1])["logs"]
+    assert [(r["timestamp"], r["id"]) for r in before] == expected[5:8]
+
+    danger = audit_db.get_recent_logs(limit=100, level_filter="위험", count_mode="exact")
+    assert danger["total"] == 6 and all(r["security_level"] == "위험" for r in danger["logs"])
+
+
+def _rollup_tables(conn):
+    return {
+        table: sorted(tuple(r) for r in conn.execute(f"SELECT * FROM {table}"))
+        for table in ("rollup_stats", "rollup_violations", "rollup_histograms")
+    }
+
+
+def test_dashboard_rollups_match_raw_logs(audit_db):
+    audit_db.init_db()
+    now = datetime.now().replace(microsecond=0)
+
+    def stamp(**delta):
+        return (now - timedelta(**delta)).strftime("%Y-%m-%d %H:%M:%S")
+
+    _write([stamp(hours=1), stamp(days=1)], level="안전", risk_score=0, response_time_ms=8)
+    _write([stamp(hours=2), stamp(days=2, hours=3)], level="경고", risk_score=35, response_time_ms=40)
+    _write([stamp(days=3)], level="차단", risk_score=95, response_time_ms=300)
+    _write([stamp(days=60)], level="위험", risk_score=70, response_time_ms=20)  # 조회 기간 밖
+
+    stats = audit_db.get_dashboard_stats(days=30)
+    summary = stats["summary"]
+    assert summary["total_requests"] == 5
+    assert (summary["safe_count"], summary["warning_count"], summary["danger_count"], summary["blocked_count"]) == (2, 2, 0, 1)
+    assert summary["avg_risk_score"] == round((0 + 0 + 35 + 35 + 95) / 5, 1)
+    assert summary["max_risk_score"] == 95
+    assert summary["avg_response_ms"] == round((8 * 2 + 40 * 2 + 300) / 5, 0)
+    assert stats["top_violations"] == [{"violation_type": "개인정보", "cnt": 3}]
+    assert sum(h["cnt"] for h in stats["hourly_distribution"]) == 5
+    assert {h["min_score"]: h["cnt"] for h in stats["risk_histogram"]} == {0: 2, 30: 2, 90: 1}
+
+    # 증분 집계 = 전체 로그로 재구성한 집계
+    with audit_db.get_db() as conn:
+        incremental = _rollup_tables(conn)
+        audit_db._rebuild_rollups(conn)
+        assert _rollup_tables(conn) == incremental
+
+
+def test_sampled_violations_stored_with_rule_counts(audit_db):
+    audit_db.init_db()
+    audit_db.log_validation("", {
+        "security_level": "차단", "risk_score": 100, "is_safe": False, "violation_count": 1000,
+        "violations": [{"type": "개인정보", "rule_name": "휴대전화번호", "description": "휴대전화번호 탐지", "severity": 7}],
+        "violation_rule_counts": [
+            {"type": "개인정보", "rule_name": "휴대전화번호", "count": 900},
+            {"type": "기밀정보", "rule_name": "confidential_markers", "count": 100},
+        ],
+    }, input_type="text_stream", prompt_hash="abc", prompt_length=10)
+
+    log = audit_db.get_recent_logs(limit=1)["logs"][0]
+    assert log["violation_count"] == 1000
+    detail = audit_db.get_log_detail(log["id"])
+    assert len(detail["violation_details"]) == 1
+    assert detail["violation_types"] == ["개인정보", "기밀정보"]
+    assert sum(c["count"] for c in detail["violation_rule_counts"]) == 1000
+
+
+def test_partition_from_older_version_gets_new_columns(audit_db):
+    audit_db.init_db()
+    _write(["2026-09-01 10:00:00"])
+    with audit_db.get_db() as conn:
+        conn.execute("ALTER TABLE validation_logs_p20260901 DROP COLUMN violation_rule_counts")
+    audit_db.close_db()
+
+    audit_db.init_db()
+    _write(["2026-09-02 10:00:00"])
+    assert audit_db.get_recent_logs(limit=10)["total"] == 2
+
+
+def test_export_resumes_after_last_received_id(audit_db):
+    audit_db.init_db()
+    _write([f"2026-08-{day:02d} 10:00:00" for day in range(20, 32)] + [f"2026-09-{day:02d} 10:00:00" for day in range(1, 14)])
+
+    full = [json.loads(line) for line in b"".join(audit_db.export_logs(fmt="jsonl", chunk_size=10)).splitlines()]
+    # 첫 청크만 받고 끊긴 내보내기 → 마지막으로 받은 행의 id로 이어받기
+    first = next(iter(audit_db.export_logs(fmt="jsonl", chunk_size=10)))
+    received = [json.loads(line) for line in first.splitlines()]
+    rest = b"".join(audit_db.export_logs(fmt="jsonl", after_id=received[-1]["id"], chunk_size=10))
+
+    resumed = received + [json.loads(line) for line in rest.splitlines()]
+    assert len(full) == 25
+    assert [r["id"] for r in resumed] == [r["id"] for r in full]
@@ -0,0 +1,78 @@
+"""다중 페이지 문서 읽기 (페이지 픽셀 상한, 팩스 해상도 보정)"""
+
+import io
+
+import pytest
+from PIL import Image
+
+from document_pages import DocumentAnalysisResult, DocumentReader, DocumentTooLarge, PageResult, document_to_dict
+from prompt_security_validator import KEPCOPromptSecurityValidator
+
+
+def _tiff(frames, **params):
+    buffer = io.BytesIO()
+    frames[0].save(buffer, "TIFF", save_all=True, append_images=frames[1:], **params)
+    return buffer.getvalue()
+
+
+def _pdf(*sizes):
+    pdfium = pytest.importorskip("pypdfium2")
+    pdf = pdfium.PdfDocument.new()
+    for width, height in sizes:
+        pdf.new_page(width, height)
+    buffer = io.BytesIO()
+    pdf.save(buffer)
+    pdf.close()
+    return buffer.getvalue()
+
+
+def test_tiff_frame_over_pixel_limit_rejected_before_decoding():
+    # 첫 프레임만 PIL 압축 폭탄 검사 대상 - 이후 프레임도 상한 적용
+    data = _tiff([Image.new("1", (100, 100), 1), Image.new("1", (3000, 3000), 1)], compression="group4")
+    with DocumentReader(data, max_page_pixels=1_000_000) as reader:
+        pages = iter(reader)
+        assert next(pages).number == 1
+        with pytest.raises(DocumentTooLarge):
+            next(pages)
+
+
+def test_fax_resolution_stretched_to_square_pixels():
+    frame = Image.new("1", (1728, 1100), 1)
+    data = _tiff([frame, frame], dpi=(204, 98), compression="group4")
+    with DocumentReader(data) as reader:
+        page = next(iter(reader))
+    assert page.size == (1728, round(1100 * 204 / 98))
+
+
+def test_pdf_render_scale_clamped_to_pixel_limit():
+    with DocumentReader(_pdf((2000, 2000)), pdf_dpi=300, max_page_pixels=4_000_000) as reader:
+        page = next(iter(reader))
+    width, height = page.size
+    assert width * height <= 4_000_000
+    assert width > 1900
+
+
+def test_pdf_page_too_large_rejected_without_rendering():
+    # 14400pt(200인치) 정사각 페이지 - 300dpi면 6만×6만 픽셀
+    with DocumentReader(_pdf((612, 792), (14400, 14400)), max_page_pixels=40_000_000) as reader:
+        pages = iter(reader)
+        assert next(pages).number == 1
+        with pytest.raises(DocumentTooLarge):
+            next(pages)
+
+
+def _clean_result(**kwargs):
+    text = "다음 주 회의 일정을 정리해 주세요."
+    validation = KEPCOPromptSecurityValidator().validate(text)
+    assert validation.is_safe
+    page = PageResult(number=1, extracted_text=text, validation_result=validation)
+    return DocumentAnalysisResult(
+        kind="pdf", page_count=kwargs.pop("page_count", 1), pages=[page],
+        validation_result=validation, extracted_text=text, **kwargs,
+    )
+
+
+def test_document_safe_only_when_every_page_checked():
+    assert document_to_dict(_clean_result())["is_safe"] is True
+    assert document_to_dict(_clean_result(page_count=300, truncated=True))["is_safe"] is False
+    assert document_to_dict(_clean_result(failed_pages=[1]))["is_safe"] is False
@@ -0,0 +1,67 @@
+"""JSON Lines 로그 기록기 (시간 기준 기록)와 기존 JSON 배열 로그 읽기"""
+
+import io
+import json
+import time
+
+from jsonl_log import JsonlLogWriter, _iter_json_array, iter_log_entries, iter_log_file
+
+
+def test_buffered_entry_flushed_by_timer_without_next_write(tmp_path):
+    path = tmp_path / "security_log.jsonl"
+    writer = JsonlLogWriter(str(path), buffer_size=100, flush_interval=0.1)
+    try:
+        writer.write({"n": 1})
+        deadline = time.monotonic() + 2
+        while not path.exists() or not path.read_text(encoding="utf-8"):
+            assert time.monotonic() < deadline, "flush_interval이 지나도 기록되지 않음"
+            time.sleep(0.02)
+        assert [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()] == [{"n": 1}]
+    finally:
+        writer.close()
+
+
+def test_close_writes_remaining_buffer(tmp_path):
+    path = tmp_path / "security_log.jsonl"
+    writer = JsonlLogWriter(str(path), buffer_size=100, flush_interval=60)
+    writer.write({"n": 1})
+    writer.close()
+    assert list(iter_log_file(str(path))) == [{"n": 1}]
+
+
+def test_array_reader_skips_malformed_element():
+    entries = [{"n": i, "text": "a, {b} [c] \"d\" \\\\"} for i in range(50)]
+    body = ",\n".join(json.dumps(e, ensure_ascii=False) for e in entries)
+    # 손상된 원소 뒤의 원소도 모두 읽혀야 함 (청크 경계가 원소 중간에 걸리도록 작은 청크)
+    broken = body.replace('{"n": 10,', '{"n": 10 oops,', 1)
+    for chunk_size in (7, 64, 4096):
+        read = list(_iter_json_array(io.StringIO(f"[\n{broken}\n]"), chunk_size))
+        assert [e["n"] for e in read] == [i for i in range(50) if i != 10]
+
+
+def test_array_reader_ignores_truncated_tail():
+    body = json.dumps([{"n": 1}, {"n": 2, "text": "잘린 원소"}], ensure_ascii=False)
+    truncated = body[:body.index("잘린") + 1]
+    assert list(_iter_json_array(io.StringIO(truncated), 8)) == [{"n": 1}]
+
+
+def test_array_reader_large_malformed_element_is_linear():
+    # 손상된 대형 원소 뒤로 버퍼가 커질 때마다 재해석하면 청크 수에 대해 제곱 시간
+    junk = '{"blob": "' + "x" * 2_000_000 + '" broken}'
+    data = "[" + junk + ', {"n": 1}]'
+    start = time.perf_counter()
+    assert list(_iter_json_array(io.StringIO(data), 1024)) == [{"n": 1}]
+    assert time.perf_counter() - start < 2
+
+
+def test_save_log_default_path_is_jsonl(tmp_path, monkeypatch):
+    from prompt_security_validator import KEPCOPromptSecurityValidator
+
+    monkeypatch.chdir(tmp_path)
+    validator = KEPCOPromptSecurityValidator()
+    validator.save_log(validator.validate("연락처 010-1234-5678"))
+    validator.close_logs()
+
+    assert not (tmp_path / "security_log.json").exists()
+    entries = list(iter_log_entries(str(tmp_path / "security_log.jsonl")))
+    assert len(entries) == 1 and entries[0]["violation_count"] >= 1
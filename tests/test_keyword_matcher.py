@@ -0,0 +1,46 @@
+"""트라이 기반 다중 키워드 매처 - 키워드별 str.find 스캔과 같은 결과·순서"""
+
+import random
+
+from keyword_matcher import LINEAR_SCAN_MAX_KEYWORDS, KeywordMatcher
+from prompt_security_validator import KEPCOPromptSecurityValidator, ViolationType
+
+
+def _matcher(keywords):
+    matcher = KeywordMatcher()
+    for keyword in keywords:
+        matcher.add(keyword)
+    return matcher
+
+
+def test_trie_matches_linear_scan():
+    rng = random.Random(7)
+    alphabet = "가나다변전소ABab12-"
+    keywords = list(dict.fromkeys(
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 5)))
+        for _ in range(LINEAR_SCAN_MAX_KEYWORDS * 3)
+    ))
+    # 접두어·중첩 관계 키워드 포함
+    keywords += ["변전", "변전소", "전소", "AB", "ab", "ABAB"]
+    matcher = _matcher(keywords)
+    assert len(matcher) > LINEAR_SCAN_MAX_KEYWORDS
+
+    for _ in range(50):
+        text = "".join(rng.choice(alphabet + " ") for _ in range(rng.randint(0, 200)))
+        assert matcher.find_all(text) == matcher._find_all_linear(text.lower())
+
+
+def test_overlapping_and_case_insensitive_matches():
+    matcher = _matcher(["SCADA", "변전", "변전소", "전소"])
+    found = [(matcher.entry(i)[0], s, e) for i, s, e in matcher.find_all("scada 강남변전소")]
+    assert found == [("SCADA", 0, 5), ("변전", 8, 10), ("변전소", 8, 11), ("전소", 9, 11)]
+
+
+def test_keyword_dictionary_file(tmp_path):
+    path = tmp_path / "substations.txt"
+    path.write_text("# 변전소 사전\n한빛변전소\n\n  새봄변전소  \n", encoding="utf-8")
+    validator = KEPCOPromptSecurityValidator()
+    assert validator.load_keyword_dictionary(str(path), "substations", ViolationType.TECHNICAL_INFO, 8) == 2
+
+    violations = [v for v in validator._find_keyword_violations("한빛변전소와 새봄변전소 점검") if v.rule_name == "substations"]
+    assert [(v.matched_text, v.position) for v in violations] == [("한빛변전소", (0, 5)), ("새봄변전소", (7, 12))]
@@ -0,0 +1,97 @@
+"""OCR 결과 캐시 (기본 비활성화, TTL 만료, 용량 정리)"""
+
+import sqlite3
+
+import pytest
+
+import ocr_cache
+from ocr_cache import OCRCache
+
+
+class _Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(ocr_cache.time, "time", clock.time)
+    return clock
+
+
+def test_from_env_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("OCR_CACHE_MAX_MB", raising=False)
+    assert OCRCache.from_env() is None
+
+
+def test_from_env_ttl_capped_by_retention(monkeypatch, tmp_path):
+    monkeypatch.setenv("OCR_CACHE_MAX_MB", "1")
+    monkeypatch.setenv("OCR_CACHE_DB", str(tmp_path / "c.db"))
+    monkeypatch.setenv("OCR_CACHE_TTL", str(30 * 86400))
+    monkeypatch.setenv("LOG_RETENTION_DAYS", "7")
+    cache = OCRCache.from_env()
+    assert cache.ttl == 7 * 86400
+    cache.close()
+
+
+def test_get_skips_and_deletes_expired(tmp_path, clock):
+    cache = OCRCache(str(tmp_path / "c.db"), ttl=60)
+    cache.put(["bytes:a"], {"text": "010-1234-5678"})
+    clock.now += 30
+    assert cache.get(["bytes:a"]) == {"text": "010-1234-5678"}
+
+    clock.now += 31
+    assert cache.get(["bytes:a"]) is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["expired"] == 1
+
+
+def test_alias_keeps_original_expiry(tmp_path, clock):
+    cache = OCRCache(str(tmp_path / "c.db"), ttl=60)
+    cache.put(["pixels:a"], {"text": "x"})
+    clock.now += 50
+    value, created_at = cache.lookup(["pixels:a"])
+    cache.put(["bytes:b"], value, created_at=created_at)
+
+    clock.now += 11
+    assert cache.get(["bytes:b"]) is None
+
+
+def test_expired_rows_purged_without_lookup(tmp_path, clock):
+    path = str(tmp_path / "c.db")
+    cache = OCRCache(path, ttl=60)
+    cache.put(["bytes:old"], {"text": "old"})
+    clock.now += ocr_cache.EXPIRE_INTERVAL + 61
+    cache.put(["bytes:new"], {"text": "new"})
+
+    keys = [row[0] for row in sqlite3.connect(path).execute("SELECT key FROM ocr_cache")]
+    assert keys == ["bytes:new"]
+
+
+def test_cleanup_enforces_size_bound(tmp_path, clock):
+    cache = OCRCache(str(tmp_path / "c.db"), max_bytes=400, ttl=0)
+    cache.CLEANUP_INTERVAL = 1
+    for i in range(20):
+        clock.now += 1
+        cache.put([f"bytes:{i}"], {"text": "x" * 40})
+    stats = cache.stats()
+    assert stats["bytes"] <= 400
+    assert cache.get(["bytes:19"]) is not None
+    assert cache.get(["bytes:0"]) is None
+
+
+def test_legacy_table_entries_are_expired(tmp_path, clock):
+    path = str(tmp_path / "c.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE ocr_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, accessed_at REAL NOT NULL)")
+    conn.execute("INSERT INTO ocr_cache VALUES ('bytes:a', '{}', 2, 0)")
+    conn.commit()
+    conn.close()
+
+    cache = OCRCache(path, ttl=60)
+    assert cache.get(["bytes:a"]) is None
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,118 @@
+"""타일 분할 OCR (경계 위치 선정, 겹침 중복 제거, 읽기 순서)"""
+
+import random
+
+import numpy as np
+import pytest
+
+from ocr_tiling import TiledOCR, _bounds, sort_reading_order
+
+
+def _line(x0, y0, x1, y1, text, confidence=0.9):
+    return [[[x0, y0], [x1, y0], [x1, y1], [x0, y1]], text, confidence]
+
+
+def _page(width, height, lines):
+    """흰 바탕에 줄 상자만큼 검은 띠를 그린 페이지 배열"""
+    array = np.full((height, width, 3), 255, dtype=np.uint8)
+    for line in lines:
+        x0, y0, x1, y1 = (int(v) for v in _bounds(line[0]))
+        array[y0:y1, x0:x1] = 0
+    return array
+
+
+def _two_column_lines():
+    """2단 문서 줄 목록 (단 사이 여백 1400-1600, 같은 행의 두 단은 세로 위치가 몇 px씩 어긋남)"""
+    rng = random.Random(7)
+    lines = []
+    for row, top in enumerate(range(100, 3100, 60)):
+        for column, (x0, x1) in enumerate([(100, 1400), (1600, 2900)]):
+            y0 = top + rng.randint(0, 6)
+            lines.append(_line(x0, y0, x1, y0 + 20, f"{row}-{column}"))
+    return lines
+
+
+def test_axis_cut_moves_into_gutter():
+    tiler = TiledOCR(tile_size=1600, overlap=200)
+    profile = np.ones(3000, dtype=np.int64)
+    profile[1470:1480] = 0
+
+    (a0, a1), (b0, b1) = tiler._axis(3000, profile)
+
+    cut = a1 - 100
+    assert 1470 <= cut < 1480
+    assert (a0, b0, b1) == (0, cut - 100, 3000)
+
+
+def test_axis_without_gutter_keeps_single_tile():
+    tiler = TiledOCR(tile_size=1600, overlap=200)
+    assert tiler._axis(3000, np.ones(3000, dtype=np.int64)) == [(0, 3000)]
+    # 프로파일 없이는 균등 분할
+    assert len(tiler._axis(3000)) == 2
+
+
+def test_plan_cuts_only_in_blank_rows_and_columns():
+    tiler = TiledOCR(tile_size=1600, overlap=200)
+    array = _page(3000, 3200, _two_column_lines())
+    ink = array.min(axis=2) < 128
+
+    tiles = tiler.plan(3000, 3200, array)
+
+    assert len(tiles) > 2
+    half = tiler.overlap // 2
+    for x0, y0, x1, y1 in tiles:
+        if y0 > 0:
+            assert not ink[y0 + half].any()
+        if x0 > 0:
+            assert not ink[y0:y1, x0 + half].any()
+
+
+def test_plan_single_column_splits_rows_only():
+    tiler = TiledOCR(tile_size=1600, overlap=200)
+    lines = [_line(100, top, 2900, top + 20, str(top)) for top in range(100, 3100, 60)]
+
+    tiles = tiler.plan(3000, 3200, _page(3000, 3200, lines))
+
+    assert len(tiles) > 1
+    assert all((x0, x1) == (0, 3000) for x0, _, x1, _ in tiles)
+
+
+def test_deduplicate_keeps_uncut_copy_over_larger_cut_copy():
+    tiler = TiledOCR(tile_size=1600, overlap=200)
+    whole = _line(1420, 500, 1560, 520, "한빛프로젝트")
+    # 오른쪽 타일 왼쪽 경계에 걸려 잘린 조각 (상자는 더 크지만 잘린 쪽)
+    clipped = _line(1400, 498, 1570, 522, "빛프로젝트")
+    results = [
+        ((0, 0, 1600, 1000), [whole]),
+        ((1400, 0, 3000, 1000), [clipped]),
+    ]
+
+    kept, duplicates = tiler._deduplicate(results, 3000, 1000)
+
+    assert [c["line"][1] for c in kept] == ["한빛프로젝트"]
+    assert duplicates == 1
+
+
+def test_tiled_reading_order_matches_single_shot():
+    main = pytest.importorskip("rapidocr_onnxruntime.main")
+    tiler = TiledOCR(tile_size=1600, overlap=200)
+    lines = _two_column_lines()
+    tiles = tiler.plan(3000, 3200, _page(3000, 3200, lines))
+
+    # 타일마다 영역에 온전히 들어오는 줄만 인식되었다고 가정 (겹침 영역의 줄은 두 타일에 중복)
+    results = []
+    for x0, y0, x1, y1 in tiles:
+        inside = [
+            line for line in lines
+            if x0 <= _bounds(line[0])[0] and _bounds(line[0])[2] <= x1
+            and y0 <= _bounds(line[0])[1] and _bounds(line[0])[3] <= y1
+        ]
+        results.append(((x0, y0, x1, y1), inside))
+    kept, duplicates = tiler._deduplicate(results, 3000, 3200)
+    assert duplicates > 0
+
+    tiled = [line[1] for line in sort_reading_order([c["line"] for c in kept])]
+    boxes = main.RapidOCR.sorted_boxes(np.array([line[0] for line in lines], dtype=np.float32))
+    by_box = {tuple(np.ravel(line[0])): line[1] for line in lines}
+    single_shot = [by_box[tuple(box.ravel().tolist())] for box in boxes]
+    assert tiled == single_shot
@@ -0,0 +1,52 @@
+"""OCR 워커 풀 대기열 (대기 중 제한 시간 만료, 비동기 기동) - 실제 OCR 워커 프로세스 없이 기동 지연만 재현"""
+
+import threading
+import time
+
+import pytest
+
+from ocr_worker_pool import OCRJobTimeout, OCRPoolUnavailable, OCRWorkerPool
+
+
+@pytest.fixture
+def slow_pool(monkeypatch):
+    """워커 기동(모델 적재)이 끝나지 않는 풀"""
+    release = threading.Event()
+
+    def spawn(worker):
+        pool._set_state(worker, "starting")
+        release.wait(5)
+        pool._set_state(worker, "failed")
+        return False
+
+    pool = OCRWorkerPool(workers=1, timeout=0.2, startup_timeout=5)
+    monkeypatch.setattr(pool, "_spawn", spawn)
+    monkeypatch.setattr(pool, "RESTART_BACKOFF", 10.0)
+    yield pool
+    release.set()
+    pool.shutdown()
+
+
+def test_start_without_wait_returns_immediately(slow_pool):
+    start = time.monotonic()
+    assert slow_pool.start(wait=False) == 0
+    assert time.monotonic() - start < 1
+    assert slow_pool.stats()["ready"] == 0
+
+
+def test_queued_job_expires_while_no_worker_is_free(slow_pool):
+    slow_pool.start(wait=False)
+    future = slow_pool.submit(b"image")
+    with pytest.raises(OCRJobTimeout):
+        future.result(timeout=2)
+    stats = slow_pool.stats()
+    assert stats["queued"] == 0
+    assert stats["timeouts"] == 1
+
+
+def test_shutdown_with_error_fails_queued_jobs(slow_pool):
+    slow_pool.start(wait=False)
+    future = slow_pool.submit(b"image", timeout=30)
+    slow_pool.shutdown(wait=False, error=OCRPoolUnavailable("기동 실패"))
+    with pytest.raises(OCRPoolUnavailable):
+        future.result(timeout=1)
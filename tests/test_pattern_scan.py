@@ -0,0 +1,51 @@
+"""정규식 사전 컴파일·필수 리터럴 사전 필터·결합 스캔 - 패턴별 re.finditer 결과와 동일"""
+
+import re
+
+import pytest
+
+from prompt_security_validator import KEPCOPromptSecurityValidator
+
+
+TEXTS = [
+    "",
+    "오늘 점심 메뉴 추천해 주세요",
+    "담당자 010-1234-5678, 주민번호 900101-1234567, 외국인 900101-5234567",
+    "서버 192.168.10.20 / 10.0.0.1 접속, 계좌 123-456-789012, 여권 M12345678",
+    "이메일 hong.gildong@kepco.co.kr 로 SCADA 원격제어 자료 송부 (대외비)",
+    "강남변전소 154kV 변압기 위치와 서울본부 영업팀 연락처 02-123-4567",
+    "password=Secr3t! api_key: sk-abcdef1234567890 token 토큰 값",
+    "ab" * 500 + " 010-9999-8888 " + "가나" * 500,
+]
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["per-pattern", "fused"])
+def validator(request):
+    return KEPCOPromptSecurityValidator(fused_scan=request.param)
+
+
+def _reference(validator, text):
+    """사전 필터·결합 스캔 없이 패턴 순서대로 re.finditer"""
+    return [
+        (name, m.start(), m.end(), m.group())
+        for name, (regex, _, _) in validator.patterns.items()
+        for m in re.finditer(regex, text, re.IGNORECASE)
+    ]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_pattern_violations_match_reference(validator, text):
+    found = [
+        (v.rule_name, v.position[0], v.position[1], v.matched_text)
+        for v in validator._find_pattern_violations(text)
+    ]
+    assert found == _reference(validator, text)
+
+
+def test_required_literals_appear_in_every_match(validator):
+    # 필수 리터럴이 없으면 패턴을 건너뛰므로, 매칭 결과에는 항상 리터럴 중 하나가 포함되어야 함
+    for text in TEXTS:
+        for name, start, end, matched in _reference(validator, text):
+            literals = validator.pattern_required_literals.get(name)
+            if literals:
+                assert any(lit in matched for lit in literals), (name, matched)
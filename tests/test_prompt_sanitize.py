@@ -0,0 +1,91 @@
+"""위반 구간 병합·마스킹 (_merge_spans / _sanitize_prompt)"""
+
+import random
+
+import pytest
+
+from prompt_security_validator import KEPCOPromptSecurityValidator, MaskingPolicy, SecurityViolation, ViolationType
+
+
+FULL, PARTIAL, FORMAT = MaskingPolicy.FULL, MaskingPolicy.PARTIAL, MaskingPolicy.FORMAT_PRESERVING
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return KEPCOPromptSecurityValidator()
+
+
+def _violation(start, end, vtype=ViolationType.PERSONAL_INFO):
+    return SecurityViolation(vtype, "테스트", "", (start, end), 5)
+
+
+def _legacy_sanitize(text, violations):
+    """구간 병합 이전 구현 - 뒤에서부터 위반마다 문자열 재조립"""
+    sanitized = text
+    for v in sorted(violations, key=lambda v: v.position[0], reverse=True):
+        start, end = v.position
+        sanitized = sanitized[:start] + "***" + sanitized[end:]
+    return sanitized
+
+
+@pytest.mark.parametrize("spans, expected", [
+    ([], []),
+    ([(0, 5, FULL)], [(0, 5, FULL)]),
+    # 겹침: 하나로 병합, 더 강한 정책
+    ([(0, 5, PARTIAL), (3, 8, FULL)], [(0, 8, FULL)]),
+    ([(0, 5, FULL), (3, 8, FORMAT)], [(0, 8, FULL)]),
+    # 포함
+    ([(0, 10, FORMAT), (2, 4, PARTIAL)], [(0, 10, PARTIAL)]),
+    # 연쇄 겹침
+    ([(0, 3, FORMAT), (2, 6, FORMAT), (5, 9, FORMAT)], [(0, 9, FORMAT)]),
+    # 인접(끝 == 시작)은 별도 구간 유지
+    ([(0, 3, FULL), (3, 6, PARTIAL)], [(0, 3, FULL), (3, 6, PARTIAL)]),
+    # 떨어진 구간
+    ([(0, 2, FULL), (5, 7, FULL)], [(0, 2, FULL), (5, 7, FULL)]),
+])
+def test_merge_spans(spans, expected):
+    assert KEPCOPromptSecurityValidator._merge_spans(spans) == expected
+
+
+def test_sanitize_overlapping_violations_masked_once(validator):
+    text = "계좌 123-456-789012 확인"
+    start = text.index("123")
+    violations = [_violation(start, start + 14), _violation(start + 4, start + 14)]
+    assert validator._sanitize_prompt(text, violations) == "계좌 *** 확인"
+
+
+def test_sanitize_adjacent_violations(validator):
+    assert validator._sanitize_prompt("AAABBBccc", [_violation(3, 6), _violation(0, 3)]) == "******ccc"
+
+
+def test_sanitize_matches_legacy_replace_for_disjoint_spans(validator):
+    rng = random.Random(1234)
+    for _ in range(200):
+        text = "".join(rng.choice("가나다abc0123 -") for _ in range(rng.randint(0, 80)))
+        violations, cursor = [], 0
+        while cursor < len(text):
+            start = cursor + rng.randint(0, 6)
+            end = start + rng.randint(1, 6)
+            if end > len(text):
+                break
+            violations.append(_violation(start, end))
+            # 인접 구간도 포함 (다음 시작 >= 이전 끝)
+            cursor = end
+        rng.shuffle(violations)
+        assert validator._sanitize_prompt(text, violations) == _legacy_sanitize(text, violations)
+
+
+def test_sanitize_validate_end_to_end(validator):
+    result = validator.validate("담당자 연락처는 010-1234-5678, 주민번호 900101-1234567 입니다")
+    assert "010-1234-5678" not in result.sanitized_prompt
+    assert "900101-1234567" not in result.sanitized_prompt
+    assert result.sanitized_prompt.startswith("담당자 연락처는 ")
+    assert result.sanitized_prompt.endswith(" 입니다")
+
+
+def test_sanitize_format_preserving_policy():
+    validator = KEPCOPromptSecurityValidator()
+    validator.masking_policies[ViolationType.PERSONAL_INFO] = FORMAT
+    text = "연락처 010-1234-5678"
+    start = text.index("010")
+    assert validator._sanitize_prompt(text, [_violation(start, len(text))]) == "연락처 ***-****-****"
@@ -0,0 +1,90 @@
+"""검증 결과 캐시 (적중 시 동일 결과, 규칙 변경 시 무효화, 용량·TTL, 공유 백엔드)"""
+
+import pytest
+
+import result_cache
+from prompt_security_validator import KEPCOPromptSecurityValidator, ViolationType
+from result_cache import SQLiteCacheBackend, ValidationCache
+
+
+PROMPT = "담당자 010-1234-5678, 주민번호 900101-1234567, SCADA 원격제어 자료는 대외비"
+
+
+def _summary(result):
+    return (
+        result.security_level, result.risk_score, result.sanitized_prompt, result.recommendation,
+        [(v.type, v.position, v.matched_text, v.rule_name, v.severity) for v in result.violations],
+    )
+
+
+def test_cache_hit_returns_same_result():
+    cache = ValidationCache()
+    validator = KEPCOPromptSecurityValidator(cache=cache)
+    expected = _summary(KEPCOPromptSecurityValidator().validate(PROMPT))
+
+    assert _summary(validator.validate(PROMPT)) == expected
+    assert _summary(validator.validate(PROMPT)) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cached_value_holds_no_matched_personal_info():
+    cache = ValidationCache()
+    KEPCOPromptSecurityValidator(cache=cache).validate(PROMPT)
+    (_, value, _), = cache._entries.values()
+    assert "010-1234-5678" not in value and "900101" not in value
+
+
+def test_keyword_rule_change_invalidates_cache():
+    cache = ValidationCache()
+    validator = KEPCOPromptSecurityValidator(cache=cache)
+    prompt = "한빛프로젝트 점검 일정 공유"
+    assert validator.validate(prompt).violations == []
+
+    validator.add_keyword_rule("test_substations", ["한빛프로젝트"], ViolationType.CONFIDENTIAL, 9)
+    assert [v.rule_name for v in validator.validate(prompt).violations] == ["test_substations"]
+    assert cache.misses == 2
+
+
+def test_lru_eviction_by_bytes():
+    cache = ValidationCache(max_bytes=10)
+    cache.put("a", "12345")
+    cache.put("b", "12345")
+    assert cache.get("a") == "12345"  # a가 최근 사용
+    cache.put("c", "12345")
+    assert cache.get("b") is None
+    assert cache.get("a") == "12345" and cache.get("c") == "12345"
+    assert cache.evictions == 1
+    cache.put("big", "x" * 11)  # 용량보다 큰 값은 저장하지 않음
+    assert cache.get("big") is None
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(result_cache.time, "time", lambda: now[0])
+    cache = ValidationCache(ttl_seconds=60)
+    cache.put("k", "v")
+    now[0] += 59
+    assert cache.get("k") == "v"
+    now[0] += 2
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_shared_sqlite_backend(tmp_path):
+    path = str(tmp_path / "validation_cache.db")
+    first = ValidationCache(backend=SQLiteCacheBackend(path, 1024 * 1024, 3600))
+    second = ValidationCache(backend=SQLiteCacheBackend(path, 1024 * 1024, 3600))
+    try:
+        expected = _summary(KEPCOPromptSecurityValidator(cache=first).validate(PROMPT))
+        assert _summary(KEPCOPromptSecurityValidator(cache=second).validate(PROMPT)) == expected
+        assert second.backend_hits == 1 and second.misses == 0
+    finally:
+        first.backend.close()
+        second.backend.close()
+
+
+@pytest.mark.parametrize("prompt", ["", "  ", "안전한 문장입니다"])
+def test_cache_for_prompts_without_violations(prompt):
+    validator = KEPCOPromptSecurityValidator(cache=ValidationCache())
+    first = validator.validate(prompt)
+    assert _summary(validator.validate(prompt)) == _summary(first)
@@ -0,0 +1,64 @@
+"""청크 단위 스트리밍 검증 - 청크 크기와 무관하게 전체 검증과 같은 결과"""
+
+import pytest
+
+from prompt_security_validator import KEPCOPromptSecurityValidator
+
+
+TEXT = (
+    "회의록 정리 부탁드립니다. 담당자 연락처 010-1234-5678, 주민번호 900101-1234567.\n"
+    "SCADA 원격제어 설정과 방화벽 ACL 정보는 대외비입니다. 서버 192.168.10.20 접속 "
+    "계정은 관리자권한으로 발급되었습니다. 고객명단과 요금정보 파일도 첨부합니다.\n"
+) * 3
+
+
+@pytest.fixture(scope="module")
+def validator():
+    return KEPCOPromptSecurityValidator()
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _key(v):
+    return (v.position, v.type, v.rule_name, v.matched_text)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 10_000])
+def test_stream_matches_full_validation(validator, chunk_size):
+    expected = validator.validate(TEXT)
+    segments = list(validator.validate_stream(_chunks(TEXT, chunk_size)))
+
+    assert "".join(seg.sanitized_text for seg in segments) == expected.sanitized_prompt
+    offset = 0
+    for seg in segments:
+        assert seg.offset == offset
+        offset += len(seg.sanitized_text)
+
+    violations = [v for seg in segments for v in seg.violations]
+    assert sorted(map(_key, violations)) == sorted(map(_key, expected.violations))
+    assert all(TEXT[v.position[0]:v.position[1]] == v.matched_text for v in violations)
+
+    summary = segments[-1].summary
+    assert summary is not None and all(seg.summary is None for seg in segments[:-1])
+    assert summary.violation_count == len(expected.violations)
+    assert summary.risk_score == expected.risk_score
+    assert summary.security_level == expected.security_level
+    assert summary.is_safe == expected.is_safe
+    assert summary.total_length == len(TEXT)
+
+
+def test_stream_without_violations(validator):
+    segments = list(validator.validate_stream(_chunks("오늘 점심 메뉴 추천해 주세요", 4)))
+    assert "".join(seg.sanitized_text for seg in segments) == "오늘 점심 메뉴 추천해 주세요"
+    assert segments[-1].summary.is_safe
+    assert segments[-1].summary.violation_count == 0
+
+
+def test_stream_feed_after_close_rejected(validator):
+    stream = validator.open_stream()
+    stream.feed("abc")
+    stream.close()
+    with pytest.raises(RuntimeError):
+        stream.feed("def")
@@ -0,0 +1,96 @@
+"""validate_api.py --serve 상주 모드 (줄 단위 JSON 요청/응답)"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+from conftest import PYTHON_DIR
+
+
+def _serve(lines, workers):
+    proc = subprocess.run(
+        [sys.executable, os.path.join(PYTHON_DIR, "validate_api.py"), "--serve", "--workers", str(workers)],
+        input="".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines),
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        timeout=300,
+    )
+    assert proc.returncode == 0, proc.stderr
+    return [json.loads(line) for line in proc.stdout.splitlines() if line.strip()]
+
+
+def test_serve_workers_answers_every_request_after_eof():
+    # stdin EOF 시점에 대기 중인 요청도 취소되지 않고 모두 응답되어야 함
+    requests = [{"id": i, "prompt": f"요청 {i}: 연락처 010-1234-{i:04d}"} for i in range(60)]
+    responses = _serve(requests, workers=2)
+
+    assert len(responses) == len(requests)
+    assert sorted(r["id"] for r in responses) == list(range(60))
+    assert all(r["success"] for r in responses), [r for r in responses if not r["success"]][:3]
+    assert all(r["violations"] for r in responses)
+
+
+def _worker_pids(pid):
+    """serve 프로세스의 자식 중 검증 워커(fork된 같은 명령줄) pid"""
+    with open(f"/proc/{pid}/cmdline", "rb") as f:
+        cmdline = f.read()
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        children = [int(c) for c in f.read().split()]
+    pids = []
+    for child in children:
+        try:
+            with open(f"/proc/{child}/cmdline", "rb") as f:
+                if f.read() == cmdline:
+                    pids.append(child)
+        except FileNotFoundError:
+            pass
+    return pids
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/task"), reason="/proc 필요 (Linux)")
+def test_serve_workers_recovers_after_worker_killed():
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(PYTHON_DIR, "validate_api.py"), "--serve", "--workers", "2"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        text=True, encoding="utf-8",
+    )
+
+    def ask(request_id):
+        proc.stdin.write(json.dumps({"id": request_id, "prompt": "연락처 010-1234-5678"}) + "\n")
+        proc.stdin.flush()
+        return json.loads(proc.stdout.readline())
+
+    try:
+        assert ask(0)["success"]
+        workers = _worker_pids(proc.pid)
+        assert workers
+        os.kill(workers[0], signal.SIGKILL)
+        time.sleep(1)
+
+        # 깨진 풀에 제출된 요청은 오류로 응답, 이후 요청은 새 풀에서 정상 처리
+        responses = [ask(i) for i in range(1, 5)]
+        assert [r["id"] for r in responses] == [1, 2, 3, 4]
+        assert not responses[0]["success"] and "비정상 종료" in responses[0]["error"]
+        assert all(r["success"] and r["violations"] for r in responses[1:])
+
+        proc.stdin.close()
+        assert proc.wait(timeout=60) == 0, proc.stderr.read()
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.stderr.close()
+
+
+def test_serve_single_process_keeps_order():
+    requests = [{"id": i, "prompt": "오늘 회의 안건 정리"} for i in range(5)]
+    responses = _serve(requests, workers=0)
+
+    assert [r["id"] for r in responses] == list(range(5))
+    assert all(r["success"] and r["is_safe"] for r in responses)